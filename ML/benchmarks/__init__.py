@@ -0,0 +1,5 @@
+"""
+性能基准测试包
+
+在ML目录下以模块方式运行，例如: python -m benchmarks.bench_stopwords
+"""
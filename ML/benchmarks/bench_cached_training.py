@@ -0,0 +1,116 @@
+"""
+只读矩阵训练检查
+
+特征矩阵缓存以只读内存映射方式加载CSR分量，多模型对比的工作进程在只读的共享内存视图上训练，
+两种情况下训练时都不能修改矩阵。本脚本检查两条路径:
+    cache: 列下标未排序的稀疏矩阵（与并行向量化、紧凑词汇表的输出相同）经FeatureCache保存后再加载，
+           在加载得到的只读矩阵上依次训练MODEL_TRAINERS中的每个模型
+    sweep: 列下标未排序的矩阵交给run_model_sweep，经共享内存在工作进程中训练全部模型
+报告各模型的训练和预测耗时，任何模型训练失败时以非零状态退出。
+
+用法（在ML目录下）:
+    python -m benchmarks.bench_cached_training --samples 3000
+    python main.py bench cached_training --models svm,logistic
+"""
+import argparse
+import tempfile
+import time
+import traceback
+from typing import Any, Callable, Dict
+
+from benchmarks.common import synthetic_sparse_classification
+from src.utils.config_loader import CONFIG
+
+
+def unsorted_copy(matrix: Any) -> Any:
+    """返回每行列下标倒序排列的副本，内容与原矩阵相同"""
+    import numpy as np
+    from scipy.sparse import csr_matrix
+
+    rows = np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr))
+    order = np.lexsort((-matrix.indices, rows))
+    result = csr_matrix((matrix.data[order], matrix.indices[order], matrix.indptr.copy()), shape=matrix.shape)
+    assert not result.has_sorted_indices
+    return result
+
+
+def check_model(trainer: Callable, x_train: Any, y_train: Any, x_test: Any) -> Dict[str, Any]:
+    """在只读矩阵上训练并预测一个模型，返回耗时或错误信息"""
+    try:
+        start = time.perf_counter()
+        model = trainer(x_train, y_train)
+        fit_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        model.predict(x_test)
+        if hasattr(model, 'predict_proba'):
+            model.predict_proba(x_test)
+        predict_time = time.perf_counter() - start
+    except Exception as e:
+        traceback.print_exc()
+        return {'error': f"{type(e).__name__}: {e}"}
+    return {'fit_s': fit_time, 'predict_s': predict_time}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="只读矩阵训练检查")
+    parser.add_argument('--samples', type=int, default=2000, help="样本数")
+    parser.add_argument('--features', type=int, default=5000, help="特征数")
+    parser.add_argument('--models', type=str, default='', help="以逗号分隔的模型列表，默认检查全部模型")
+    parser.add_argument('--full-search', action='store_true', help="随机森林使用配置中的完整搜索网格")
+    parser.add_argument('--skip-sweep', action='store_true', help="只检查缓存路径，不运行多模型对比")
+    parser.add_argument('--verbose', action='store_true', help="输出流程日志")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        CONFIG['logging']['log_level'] = 'warning'
+    if not args.full_search:
+        CONFIG['models']['random_forest'].update({'n_estimators': [50], 'max_depth': [8]})
+
+    from src.features.feature_cache import FeatureCache
+    from src.models.sweep import MODEL_TRAINERS, run_model_sweep
+
+    model_types = [m.strip() for m in args.models.split(',') if m.strip()] or list(MODEL_TRAINERS)
+    unknown = [m for m in model_types if m not in MODEL_TRAINERS]
+    if unknown:
+        parser.error(f"不支持的模型: {', '.join(unknown)}，可选: {', '.join(MODEL_TRAINERS)}")
+
+    x, y = synthetic_sparse_classification(args.samples, args.features)
+    split = int(args.samples * 0.8)
+
+    failures = []
+    with tempfile.TemporaryDirectory(prefix="bench_cached_training_") as work_dir:
+        FeatureCache._save_csr(work_dir, 'x_train', unsorted_copy(x[:split]))
+        FeatureCache._save_csr(work_dir, 'x_test', unsorted_copy(x[split:]))
+        x_train = FeatureCache._load_csr(work_dir, 'x_train', x[:split].shape)
+        x_test = FeatureCache._load_csr(work_dir, 'x_test', x[split:].shape)
+        y_train = y[:split]
+        print(f"缓存矩阵: 训练集{x_train.shape}, 测试集{x_test.shape}, "
+              f"只读={not x_train.indices.flags.writeable}, 下标已排序={x_train.has_sorted_indices}")
+
+        print(f"{'模型':<16}{'训练(s)':>10}{'预测(s)':>10}")
+        for model_type in model_types:
+            result = check_model(MODEL_TRAINERS[model_type], x_train, y_train, x_test)
+            if 'error' in result:
+                print(f"{model_type:<16}失败: {result['error']}")
+                failures.append(f"cache/{model_type}")
+            else:
+                print(f"{model_type:<16}{result['fit_s']:>10.2f}{result['predict_s']:>10.2f}")
+        del x_train, x_test
+
+    if not args.skip_sweep:
+        print("\n多模型对比（共享内存）:")
+        rows = run_model_sweep(model_types, unsorted_copy(x[:split]), y[:split], unsorted_copy(x[split:]), y[split:])
+        for row, _ in rows:
+            if 'error' in row:
+                print(f"{row['model']:<16}失败: {row['error']}")
+                failures.append(f"sweep/{row['model']}")
+            else:
+                print(f"{row['model']:<16}{row['fit_time']:>10.2f}{row['predict_time']:>10.2f}")
+
+    if failures:
+        raise SystemExit(f"以下模型无法在只读矩阵上训练: {', '.join(failures)}")
+
+
+if __name__ == "__main__":
+    main()
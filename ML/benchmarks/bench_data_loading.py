@@ -0,0 +1,68 @@
+"""
+数据加载基准
+
+比较直接解析CSV与列式缓存冷启动（首次转换）、热启动（复用Feather文件）的加载耗时。
+
+用法（在ML目录下）:
+    python -m benchmarks.bench_data_loading --rows 50000
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.common import synthetic_news_frame
+from src.data.columnar_cache import ColumnarCache
+from src.data.data_loader import read_dataset
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="数据加载基准")
+    parser.add_argument('--rows', type=int, default=50000, help="合成数据行数")
+    parser.add_argument('--repeat', type=int, default=3, help="热启动重复次数")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="bench_loading_")
+    try:
+        csv_path = os.path.join(work_dir, "train.news.csv")
+        synthetic_news_frame(args.rows).to_csv(csv_path, index=False)
+        size_mb = os.path.getsize(csv_path) / 1024 / 1024
+        print(f"合成CSV: {args.rows}行, {size_mb:.1f} MB")
+
+        start = time.perf_counter()
+        pd.read_csv(csv_path)
+        full_csv = time.perf_counter() - start
+
+        start = time.perf_counter()
+        read_dataset(csv_path, ColumnarCache(enabled=False))
+        usecols_csv = time.perf_counter() - start
+
+        cache = ColumnarCache(cache_dir=os.path.join(work_dir, "columnar"))
+        if not cache.enabled:
+            print("未安装pyarrow，跳过列式缓存测试")
+            return
+
+        start = time.perf_counter()
+        read_dataset(csv_path, cache)
+        cold = time.perf_counter() - start
+
+        warm = float('inf')
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            read_dataset(csv_path, cache)
+            warm = min(warm, time.perf_counter() - start)
+
+        print(f"完整CSV解析:        {full_csv * 1000:10.1f} ms")
+        print(f"CSV只读所需列:      {usecols_csv * 1000:10.1f} ms")
+        print(f"列式缓存冷启动:     {cold * 1000:10.1f} ms")
+        print(f"列式缓存热启动:     {warm * 1000:10.1f} ms")
+        print(f"热启动加速比:       {full_csv / warm:10.1f}x")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""
+训练流程各阶段基准
+
+在合成中文新闻语料上依次运行完整流程，记录每个阶段的耗时和Python堆内存峰值:
+    load_data -> TextPreprocessor.preprocess_data -> TextVectorizer.fit_transform/transform
+    -> 各train_*函数 -> model.predict -> evaluate_model
+
+每个阶段先重复执行--repeat次计时，再在tracemalloc下单独执行一次测量内存峰值
+（计时不受tracemalloc开销影响）。tracemalloc统计Python对象和NumPy数组的分配，
+不包括liblinear/libsvm等C扩展内部直接申请的内存。
+
+结果写入JSON文件（包含提交号、依赖版本和语料规模），用--compare与之前的结果对比，
+可以跟踪不同提交之间的性能回归。
+
+用法（在ML目录下）:
+    python -m benchmarks.bench_pipeline --train-rows 5000 --test-rows 1000
+    python -m benchmarks.bench_pipeline --models naive_bayes,sgd --compare results/benchmarks/old.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from benchmarks.common import synthetic_news_corpus
+from src.utils.config_loader import CONFIG
+
+ML_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class StageRunner:
+    """逐阶段计时并测量内存峰值，收集结果记录"""
+
+    def __init__(self, repeat: int, measure_memory: bool) -> None:
+        self.repeat = max(1, repeat)
+        self.measure_memory = measure_memory
+        self.records: List[Dict[str, Any]] = []
+
+    def run(self, stage: str, func: Callable[[], Any], **params: Any) -> Any:
+        """
+        执行一个阶段并记录结果
+
+        Args:
+            stage: 阶段名称
+            func: 无参数的阶段函数
+            **params: 阶段参数（模型、向量化器类型等），作为结果记录的一部分
+
+        Returns:
+            Any: 最后一次计时运行的返回值，供后续阶段使用
+        """
+        timings = []
+        result = None
+        for _ in range(self.repeat):
+            gc.collect()
+            start = time.perf_counter()
+            result = func()
+            timings.append(time.perf_counter() - start)
+
+        peak_mb = None
+        if self.measure_memory:
+            gc.collect()
+            tracemalloc.start()
+            try:
+                func()
+                peak_mb = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+            finally:
+                tracemalloc.stop()
+
+        record = {
+            'stage': stage,
+            'params': params,
+            'time_min': min(timings),
+            'time_mean': sum(timings) / len(timings),
+            'repeat': len(timings),
+            'peak_memory_mb': peak_mb,
+        }
+        self.records.append(record)
+        memory = f"{peak_mb:>10.1f}" if peak_mb is not None else f"{'-':>10}"
+        print(f"{record_key(record):<48}{record['time_min']:>10.3f}{record['time_mean']:>10.3f}{memory}")
+        return result
+
+
+def record_key(record: Dict[str, Any]) -> str:
+    """结果记录的唯一标识，用于显示和对比"""
+    params = ", ".join(f"{k}={v}" for k, v in sorted(record['params'].items()))
+    return f"{record['stage']}({params})" if params else record['stage']
+
+
+def environment_info() -> Dict[str, Any]:
+    """提交号、Python和主要依赖的版本"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ML_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    versions = {}
+    for name in ('numpy', 'scipy', 'pandas', 'sklearn', 'jieba'):
+        module = sys.modules.get(name)
+        versions[name] = getattr(module, '__version__', None) if module else None
+
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'versions': versions,
+    }
+
+
+def write_corpus(work_dir: str, args: argparse.Namespace) -> None:
+    """生成合成训练集和测试集，并让全局配置指向它们"""
+    train = synthetic_news_corpus(args.train_rows, args.content_words, seed=args.seed)
+    test = synthetic_news_corpus(args.test_rows, args.content_words, seed=args.seed + 1)
+    train_path = os.path.join(work_dir, 'train.news.csv')
+    test_path = os.path.join(work_dir, 'test.news.csv')
+    train.to_csv(train_path, index=False)
+    test.to_csv(test_path, index=False)
+
+    CONFIG['data']['train_path'] = train_path
+    CONFIG['data']['test_path'] = test_path
+    # 测量实际计算，不命中任何缓存
+    CONFIG['data'].setdefault('columnar', {})['enabled'] = args.columnar
+    CONFIG['preprocessing']['cache'] = {'enabled': False}
+    CONFIG['preprocessing']['n_workers'] = args.tokenize_workers
+    CONFIG['preprocessing'].setdefault('jieba', {})['account_dict'] = os.path.join(work_dir, 'account_names.txt')
+    CONFIG['evaluation']['save_results'] = False
+    CONFIG['evaluation']['plot_async'] = False
+
+
+def compare(records: List[Dict[str, Any]], baseline_path: str, tolerance: float) -> List[str]:
+    """
+    与之前的结果对比，打印每个阶段的耗时和内存变化
+
+    Args:
+        records: 本次结果记录
+        baseline_path: 之前的结果文件
+        tolerance: 允许的相对增幅，超过时视为回归
+
+    Returns:
+        List[str]: 回归的阶段说明
+    """
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {record_key(r): r for r in json.load(f)['results']}
+
+    print(f"\n与 {baseline_path} 对比（相对变化，正数表示变慢/变大）:")
+    regressions = []
+    for record in records:
+        key = record_key(record)
+        old = baseline.get(key)
+        if old is None:
+            continue
+        time_change = record['time_min'] / max(old['time_min'], 1e-9) - 1
+        line = f"    {key:<48}耗时{time_change:>+8.1%}"
+        if record['peak_memory_mb'] is not None and old.get('peak_memory_mb'):
+            memory_change = record['peak_memory_mb'] / old['peak_memory_mb'] - 1
+            line += f"  内存{memory_change:>+8.1%}"
+            if memory_change > tolerance:
+                regressions.append(f"{key} 内存增加{memory_change:.1%}")
+        if time_change > tolerance:
+            regressions.append(f"{key} 耗时增加{time_change:.1%}")
+        print(line)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="训练流程各阶段基准")
+    parser.add_argument('--train-rows', type=int, default=5000, help="合成训练集行数")
+    parser.add_argument('--test-rows', type=int, default=1000, help="合成测试集行数")
+    parser.add_argument('--content-words', type=int, default=80, help="报告内容的平均词数")
+    parser.add_argument('--seed', type=int, default=42, help="随机种子")
+    parser.add_argument('--vectorizers', type=str, default='tfidf', help="以逗号分隔的向量化方法，如 tfidf,count")
+    parser.add_argument('--models', type=str, default='all', help="all 或以逗号分隔的模型列表")
+    parser.add_argument('--repeat', type=int, default=3, help="每个阶段的计时次数")
+    parser.add_argument('--no-memory', action='store_true', help="不测量内存峰值")
+    parser.add_argument('--columnar', action='store_true', help="load_data使用列式缓存（默认直接解析CSV）")
+    parser.add_argument('--tokenize-workers', type=int, default=1, help="分词进程数")
+    parser.add_argument('--output', type=str, default=None,
+                        help="结果文件，默认为results/benchmarks/pipeline_<提交号>_<时间>.json")
+    parser.add_argument('--compare', type=str, default=None, help="与之前的结果文件对比")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="对比时允许的相对增幅")
+    parser.add_argument('--fail-on-regression', action='store_true', help="出现回归时以非零状态退出")
+    parser.add_argument('--verbose', action='store_true', help="输出流程日志")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        CONFIG['logging']['log_level'] = 'warning'
+
+    from src.data.data_loader import load_data
+    from src.data.preprocessor import TextPreprocessor
+    from src.features.vectorizers import TextVectorizer
+    from src.models.sweep import MODEL_TRAINERS
+    from src.evaluation.metrics import evaluate_model
+
+    model_types = list(MODEL_TRAINERS) if args.models == 'all' else [m.strip() for m in args.models.split(',')]
+    unknown = [m for m in model_types if m not in MODEL_TRAINERS]
+    if unknown:
+        parser.error(f"不支持的模型: {', '.join(unknown)}，可选: {', '.join(MODEL_TRAINERS)}")
+
+    work_dir = tempfile.mkdtemp(prefix="bench_pipeline_")
+    runner = StageRunner(args.repeat, not args.no_memory)
+    try:
+        write_corpus(work_dir, args)
+        print(f"合成语料: 训练集{args.train_rows}行, 测试集{args.test_rows}行, 平均{args.content_words}词/篇")
+        print(f"{'阶段':<48}{'最小(s)':>10}{'平均(s)':>10}{'内存峰值(MB)':>10}")
+
+        x_train, y_train, x_test, y_test, stopwords = runner.run('load_data', load_data)
+
+        preprocessor = TextPreprocessor(stopwords)
+        runner.run('TextPreprocessor.warm_up', preprocessor.warm_up)
+        train_texts, test_texts = runner.run(
+            'TextPreprocessor.preprocess_data', lambda: preprocessor.preprocess_data(x_train, x_test))
+
+        for vectorizer_type in [v.strip() for v in args.vectorizers.split(',') if v.strip()]:
+            vectorizer = TextVectorizer(vectorizer_type, stopwords)
+            x_train_vec = runner.run('TextVectorizer.fit_transform', lambda: vectorizer.fit_transform(train_texts),
+                                     vectorizer=vectorizer_type)
+            x_test_vec = runner.run('TextVectorizer.transform', lambda: vectorizer.transform(test_texts),
+                                    vectorizer=vectorizer_type)
+
+            for model_type in model_types:
+                trainer = MODEL_TRAINERS[model_type]
+                model = runner.run(f"train.{model_type}", lambda: trainer(x_train_vec, y_train),
+                                   vectorizer=vectorizer_type)
+                y_pred = runner.run('model.predict', lambda: model.predict(x_test_vec),
+                                    vectorizer=vectorizer_type, model=model_type)
+                y_score = model.predict_proba(x_test_vec)[:, 1] if hasattr(model, 'predict_proba') else None
+                runner.run('evaluate_model', lambda: evaluate_model(y_test, y_pred, y_score=y_score, plot=False),
+                           vectorizer=vectorizer_type, model=model_type)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    output_path = args.output
+    info = environment_info()
+    if output_path is None:
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        output_path = os.path.join('results', 'benchmarks', f"pipeline_{info['commit'] or 'nogit'}_{stamp}.json")
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'benchmark': 'pipeline',
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'environment': info,
+            'corpus': {
+                'train_rows': args.train_rows,
+                'test_rows': args.test_rows,
+                'content_words': args.content_words,
+                'seed': args.seed,
+            },
+            'results': runner.records,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\n结果已保存到 {output_path}")
+
+    regressions: List[str] = []
+    if args.compare:
+        regressions = compare(runner.records, args.compare, args.tolerance)
+        if regressions:
+            print("\n性能回归:")
+            for regression in regressions:
+                print(f"    {regression}")
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
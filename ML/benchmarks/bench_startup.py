@@ -0,0 +1,109 @@
+"""
+命令行启动耗时基准
+
+用 python -X importtime 运行各子命令的 --help，统计总耗时、导入耗时最高的模块，
+并检查不应在启动时导入的重量级依赖。作为启动延迟的回归检查使用:
+--help 的耗时超过 --max-ms，或者导入了 --forbid 中的模块时，以非零状态退出。
+
+用法（在ML目录下）:
+    python -m benchmarks.bench_startup --max-ms 300
+    python main.py bench startup --commands "" predict serve --top 15
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+ML_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 只显示帮助时不应导入的模块
+DEFAULT_FORBIDDEN = ['pandas', 'jieba', 'sklearn', 'scipy', 'matplotlib', 'tqdm']
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """
+    解析 -X importtime 输出
+
+    Args:
+        stderr: 子进程的标准错误输出
+
+    Returns:
+        Dict[str, Tuple[int, int]]: 模块名 -> (自身耗时, 累计耗时)，单位微秒
+    """
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        imports[name.strip()] = (int(self_us), int(cumulative_us))
+    return imports
+
+
+def measure(command: str, repeat: int) -> Tuple[List[float], Dict[str, Tuple[int, int]]]:
+    """
+    多次运行 python -X importtime main.py <子命令> --help
+
+    Args:
+        command: 子命令，空字符串表示顶层帮助
+        repeat: 运行次数
+
+    Returns:
+        Tuple: 每次运行的耗时（毫秒）和最后一次运行的导入记录
+    """
+    args = [sys.executable, '-X', 'importtime', 'main.py', *([command] if command else []), '--help']
+    timings = []
+    imports = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run(args, cwd=ML_DIR, capture_output=True, text=True)
+        timings.append((time.perf_counter() - start) * 1000)
+        if result.returncode != 0:
+            raise RuntimeError(f"{' '.join(args)} 执行失败:\n{result.stderr[-2000:]}")
+        imports = parse_importtime(result.stderr)
+    return timings, imports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="命令行启动耗时基准")
+    parser.add_argument('--commands', nargs='*', default=['', 'predict', 'serve', 'update'],
+                        help="要测量的子命令，空字符串表示顶层 main.py --help")
+    parser.add_argument('--repeat', type=int, default=5, help="每个子命令的运行次数")
+    parser.add_argument('--top', type=int, default=10, help="显示累计导入耗时最高的模块数")
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help="--help 耗时中位数上限（毫秒），超过时以非零状态退出")
+    parser.add_argument('--forbid', nargs='*', default=DEFAULT_FORBIDDEN,
+                        help="启动时不允许导入的顶层模块")
+    args = parser.parse_args()
+
+    failures = []
+    for command in args.commands:
+        label = f"main.py {command} --help".replace('  ', ' ')
+        timings, imports = measure(command, args.repeat)
+        median = statistics.median(timings)
+        total_import_ms = sum(self_us for self_us, _ in imports.values()) / 1000
+        print(f"\n{label}: 中位数 {median:.0f}ms（最小 {min(timings):.0f}ms），"
+              f"导入{len(imports)}个模块共 {total_import_ms:.0f}ms")
+
+        slowest = sorted(imports.items(), key=lambda item: item[1][1], reverse=True)[:args.top]
+        for name, (_, cumulative_us) in slowest:
+            print(f"    {cumulative_us / 1000:>8.1f}ms  {name}")
+
+        imported_forbidden = sorted({name.split('.')[0] for name in imports} & set(args.forbid))
+        if imported_forbidden:
+            failures.append(f"{label} 导入了 {', '.join(imported_forbidden)}")
+        if args.max_ms is not None and median > args.max_ms:
+            failures.append(f"{label} 耗时 {median:.0f}ms 超过上限 {args.max_ms:.0f}ms")
+
+    if failures:
+        print("\n启动耗时检查失败:")
+        for failure in failures:
+            print(f"    {failure}")
+        sys.exit(1)
+    print("\n启动耗时检查通过")
+
+
+if __name__ == "__main__":
+    main()
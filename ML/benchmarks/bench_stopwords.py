@@ -0,0 +1,49 @@
+"""
+停用词过滤微基准
+
+比较停用词列表线性查找与StopwordIndex集合查找的过滤耗时。
+
+用法（在ML目录下）:
+    python -m benchmarks.bench_stopwords --docs 200 --length 300
+"""
+import argparse
+
+from benchmarks.common import time_call, synthetic_token_documents
+from src.data.stopwords import StopwordIndex
+from src.utils.config_loader import CONFIG
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="停用词过滤微基准")
+    parser.add_argument('--docs', type=int, default=200, help="文档数")
+    parser.add_argument('--length', type=int, default=300, help="每个文档的词数")
+    parser.add_argument('--repeat', type=int, default=1, help="重复次数")
+    args = parser.parse_args()
+
+    index = StopwordIndex.from_file(CONFIG['data']['stopwords_path'])
+    stopword_list = index.to_list()
+
+    # 约三分之一的词为停用词，其余为普通中文词
+    content_words = [chr(0x4e00 + i) + chr(0x4e00 + i * 7 % 20000) for i in range(2 * len(index))]
+    documents = synthetic_token_documents(stopword_list + content_words, args.docs, args.length)
+
+    def filter_with_list():
+        return [[w for w in doc if w not in stopword_list and w.strip()] for doc in documents]
+
+    def filter_with_index():
+        return index.filter_batch(documents)
+
+    assert filter_with_list() == filter_with_index(), "两种过滤方式结果不一致"
+
+    list_time = time_call(filter_with_list, args.repeat)
+    index_time = time_call(filter_with_index, args.repeat)
+
+    tokens = args.docs * args.length
+    print(f"停用词数: {len(index)}, 文档数: {args.docs}, 总词数: {tokens}")
+    print(f"列表查找:   {list_time['min'] * 1000:10.1f} ms")
+    print(f"索引查找:   {index_time['min'] * 1000:10.1f} ms")
+    print(f"加速比:     {list_time['min'] / index_time['min']:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
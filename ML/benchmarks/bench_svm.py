@@ -0,0 +1,63 @@
+"""
+SVM训练路径基准
+
+在类似TF-IDF的稀疏数据上比较RBF核SVC（probability=True）与linear_fast路径
+（LinearSVC + sigmoid概率校准）的训练耗时、预测延迟和AUC。
+
+用法（在ML目录下）:
+    python -m benchmarks.bench_svm --samples 5000
+"""
+import argparse
+import time
+
+from sklearn.metrics import roc_auc_score
+
+from benchmarks.common import synthetic_sparse_classification
+from src.models.svm import train_svm
+from src.utils.config_loader import CONFIG
+
+
+def run(kernel: str, x_train, y_train, x_test, y_test) -> dict:
+    """训练指定kernel的SVM并返回耗时和AUC"""
+    CONFIG['models']['svm']['kernel'] = kernel
+
+    start = time.perf_counter()
+    model = train_svm(x_train, y_train)
+    fit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scores = model.predict_proba(x_test)[:, 1]
+    predict_time = time.perf_counter() - start
+
+    return {
+        'fit_s': fit_time,
+        'predict_ms_per_1k': predict_time * 1000 / x_test.shape[0] * 1000,
+        'auc': roc_auc_score(y_test, scores),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SVM训练路径基准")
+    parser.add_argument('--samples', type=int, default=5000, help="样本数")
+    parser.add_argument('--features', type=int, default=10000, help="特征数")
+    args = parser.parse_args()
+
+    x, y = synthetic_sparse_classification(args.samples, args.features)
+    split = int(args.samples * 0.8)
+    x_train, y_train, x_test, y_test = x[:split], y[:split], x[split:], y[split:]
+
+    original_kernel = CONFIG['models']['svm'].get('kernel', 'rbf')
+    try:
+        results = {kernel: run(kernel, x_train, y_train, x_test, y_test) for kernel in ('rbf', 'linear_fast')}
+    finally:
+        CONFIG['models']['svm']['kernel'] = original_kernel
+
+    print(f"样本数: {args.samples}, 特征数: {args.features}")
+    print(f"{'路径':<14}{'训练(s)':>10}{'预测(ms/千条)':>16}{'AUC':>10}")
+    for kernel, r in results.items():
+        print(f"{kernel:<14}{r['fit_s']:>10.2f}{r['predict_ms_per_1k']:>16.1f}{r['auc']:>10.4f}")
+    print(f"训练加速比: {results['rbf']['fit_s'] / results['linear_fast']['fit_s']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
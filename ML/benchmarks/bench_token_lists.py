@@ -0,0 +1,145 @@
+"""
+词列表输入与文本输入的向量化基准
+
+预处理器只分词一次，同一份分词结果分别以两种形式交给TextVectorizer:
+    text    以空格分隔的文本，sklearn按token_pattern重新切分并再次过滤停用词
+    tokens  词列表（preprocessing.output: tokens），NgramAnalyzer直接生成n-gram
+
+比较两种形式的fit_transform/transform耗时、词汇表大小，并在同一模型上比较分类指标。
+sklearn默认的token_pattern会丢弃单字词，词列表模式保留它们，因此词汇表和指标可能略有差异。
+
+用法（在ML目录下）:
+    python -m benchmarks.bench_token_lists --train-rows 20000 --test-rows 4000
+    python main.py bench token_lists --vectorizers tfidf,count,hashing --models logistic,naive_bayes
+    python main.py bench token_lists --real-data   # 使用配置中的真实数据集
+"""
+import argparse
+import shutil
+import tempfile
+from typing import Any, Dict, List
+
+from benchmarks.bench_pipeline import write_corpus
+from benchmarks.common import time_call
+from src.utils.config_loader import CONFIG
+
+MODES = ('text', 'tokens')
+METRICS = ('accuracy', 'f1', 'auc')
+
+
+def benchmark_mode(mode: str, vectorizer_type: str, stopwords: Any, train_docs: List[Any], test_docs: List[Any],
+                   y_train: Any, y_test: Any, model_types: List[str], repeat: int) -> Dict[str, Any]:
+    """
+    用一种输入形式完成向量化、训练和评估
+
+    Args:
+        mode: 'text'或'tokens'
+        vectorizer_type: 向量化方法
+        stopwords: 停用词索引
+        train_docs: 训练集分词结果
+        test_docs: 测试集分词结果
+        y_train: 训练标签
+        y_test: 测试标签
+        model_types: 要训练的模型
+        repeat: 计时次数
+
+    Returns:
+        Dict[str, Any]: 耗时、特征数和各模型的指标
+    """
+    from src.features.vectorizers import TextVectorizer
+    from src.models.sweep import MODEL_TRAINERS
+    from src.evaluation.metrics import compute_metrics
+
+    vectorizer = TextVectorizer(vectorizer_type, stopwords, pretokenized=(mode == 'tokens'))
+    fit_time = time_call(lambda: vectorizer.fit_transform(train_docs), repeat)
+    x_train_vec = vectorizer.fit_transform(train_docs)
+    transform_time = time_call(lambda: vectorizer.transform(test_docs), repeat)
+    x_test_vec = vectorizer.transform(test_docs)
+
+    metrics = {}
+    for model_type in model_types:
+        model = MODEL_TRAINERS[model_type](x_train_vec, y_train)
+        y_score = model.predict_proba(x_test_vec)[:, 1] if hasattr(model, 'predict_proba') else None
+        metrics[model_type] = compute_metrics(y_test, model.predict(x_test_vec), y_score)
+
+    return {
+        'fit_transform': fit_time['min'],
+        'transform': transform_time['min'],
+        'n_features': x_train_vec.shape[1],
+        'nnz': x_train_vec.nnz,
+        'metrics': metrics,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="词列表输入与文本输入的向量化基准")
+    parser.add_argument('--train-rows', type=int, default=10000, help="合成训练集行数")
+    parser.add_argument('--test-rows', type=int, default=2000, help="合成测试集行数")
+    parser.add_argument('--content-words', type=int, default=80, help="报告内容的平均词数")
+    parser.add_argument('--seed', type=int, default=42, help="随机种子")
+    parser.add_argument('--real-data', action='store_true', help="使用配置中的训练集和测试集，而不是合成语料")
+    parser.add_argument('--vectorizers', type=str, default='tfidf,count', help="以逗号分隔的向量化方法")
+    parser.add_argument('--models', type=str, default='logistic,naive_bayes', help="以逗号分隔的模型列表")
+    parser.add_argument('--repeat', type=int, default=3, help="每种形式的计时次数")
+    parser.add_argument('--tokenize-workers', type=int, default=1, help="分词进程数")
+    parser.add_argument('--verbose', action='store_true', help="输出流程日志")
+    args = parser.parse_args()
+    args.columnar = False
+
+    if not args.verbose:
+        CONFIG['logging']['log_level'] = 'warning'
+
+    from src.data.data_loader import load_data
+    from src.data.preprocessor import TextPreprocessor
+    from src.models.sweep import MODEL_TRAINERS
+
+    model_types = [m.strip() for m in args.models.split(',') if m.strip()]
+    unknown = [m for m in model_types if m not in MODEL_TRAINERS]
+    if unknown:
+        parser.error(f"不支持的模型: {', '.join(unknown)}，可选: {', '.join(MODEL_TRAINERS)}")
+
+    work_dir = tempfile.mkdtemp(prefix="bench_token_lists_")
+    try:
+        if args.real_data:
+            CONFIG['preprocessing']['cache'] = {'enabled': False}
+            CONFIG['preprocessing']['n_workers'] = args.tokenize_workers
+            print(f"真实数据: {CONFIG['data']['train_path']}, {CONFIG['data']['test_path']}")
+        else:
+            write_corpus(work_dir, args)
+            print(f"合成语料: 训练集{args.train_rows}行, 测试集{args.test_rows}行, 平均{args.content_words}词/篇")
+
+        x_train, y_train, x_test, y_test, stopwords = load_data()
+
+        # 只分词一次，文本形式由词列表拼接得到，两种形式的分词结果完全相同
+        preprocessing_config = dict(CONFIG['preprocessing'], output='tokens')
+        preprocessor = TextPreprocessor(stopwords, preprocessing_config)
+        train_tokens, test_tokens = preprocessor.preprocess_data(x_train, x_test)
+        inputs = {
+            'text': ([" ".join(tokens) for tokens in train_tokens], [" ".join(tokens) for tokens in test_tokens]),
+            'tokens': (train_tokens, test_tokens),
+        }
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    for vectorizer_type in [v.strip() for v in args.vectorizers.split(',') if v.strip()]:
+        results = {
+            mode: benchmark_mode(mode, vectorizer_type, stopwords, *inputs[mode], y_train, y_test,
+                                 model_types, args.repeat)
+            for mode in MODES
+        }
+        text, tokens = results['text'], results['tokens']
+
+        print(f"\n{vectorizer_type}:")
+        print(f"    {'':<16}{'text':>12}{'tokens':>12}{'加速比':>10}")
+        for key in ('fit_transform', 'transform'):
+            print(f"    {key + '(s)':<16}{text[key]:>12.3f}{tokens[key]:>12.3f}"
+                  f"{text[key] / max(tokens[key], 1e-9):>10.2f}x")
+        print(f"    {'特征数':<16}{text['n_features']:>12}{tokens['n_features']:>12}")
+        print(f"    {'非零元素':<16}{text['nnz']:>12}{tokens['nnz']:>12}")
+        for model_type in model_types:
+            for metric in METRICS:
+                old, new = text['metrics'][model_type][metric], tokens['metrics'][model_type][metric]
+                print(f"    {model_type + '.' + metric:<16}{old:>12.4f}{new:>12.4f}{new - old:>+10.4f}")
+
+
+if __name__ == "__main__":
+    main()
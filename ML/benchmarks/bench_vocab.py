@@ -0,0 +1,136 @@
+"""
+并行词汇表构建基准
+
+在合成中文新闻语料上比较sklearn单进程fit_transform与parallel_fit_transform:
+    - 耗时
+    - 主进程Python堆内存峰值（tracemalloc，不包括工作进程）
+    - 结果是否完全一致（词汇表、被剪枝的n-gram、矩阵的结构和数值）
+
+用法（在ML目录下）:
+    python -m benchmarks.bench_vocab --rows 50000 --n-jobs 4
+    python main.py bench vocab --vectorizers tfidf,count --chunk-size 5000
+"""
+import argparse
+import gc
+import os
+import time
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+from benchmarks.common import synthetic_news_corpus
+from src.utils.config_loader import CONFIG
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Tuple[Any, float, float]:
+    """
+    计时并测量主进程内存峰值
+
+    Args:
+        func: 无参数的待测函数
+        repeat: 计时次数
+
+    Returns:
+        Tuple: 最后一次的返回值、最小耗时（秒）和内存峰值（MB）
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        peak_mb = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+    finally:
+        tracemalloc.stop()
+    return result, min(timings), peak_mb
+
+
+def identical(expected: Tuple[Any, Any], actual: Tuple[Any, Any]) -> List[str]:
+    """
+    检查两次拟合的结果是否完全一致
+
+    Args:
+        expected: sklearn拟合的(向量化器, 矩阵)
+        actual: 并行拟合的(向量化器, 矩阵)
+
+    Returns:
+        List[str]: 不一致之处，为空表示完全一致
+    """
+    import numpy as np
+
+    (vec_a, x_a), (vec_b, x_b) = expected, actual
+    problems = []
+    if vec_a.vocabulary_ != vec_b.vocabulary_:
+        problems.append("词汇表不同")
+    if getattr(vec_a, 'stop_words_', None) != getattr(vec_b, 'stop_words_', None):
+        problems.append("被剪枝的n-gram不同")
+    if hasattr(vec_a, 'idf_') and not np.array_equal(vec_a.idf_, vec_b.idf_):
+        problems.append("IDF不同")
+    if x_a.shape != x_b.shape or x_a.dtype != x_b.dtype:
+        problems.append(f"矩阵形状或类型不同: {x_a.shape}/{x_a.dtype} vs {x_b.shape}/{x_b.dtype}")
+    elif not (np.array_equal(x_a.indptr, x_b.indptr) and np.array_equal(x_a.indices, x_b.indices)
+              and np.array_equal(x_a.data, x_b.data)):
+        problems.append("矩阵元素或顺序不同")
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="并行词汇表构建基准")
+    parser.add_argument('--rows', type=int, default=30000, help="合成语料行数")
+    parser.add_argument('--content-words', type=int, default=120, help="报告内容的平均词数")
+    parser.add_argument('--seed', type=int, default=42, help="随机种子")
+    parser.add_argument('--vectorizers', type=str, default='tfidf,count', help="以逗号分隔的向量化方法")
+    parser.add_argument('--n-jobs', type=int, default=-1, help="并行进程数，0或负数表示使用全部CPU核心")
+    parser.add_argument('--chunk-size', type=int, default=2000, help="每个任务块的文档数")
+    parser.add_argument('--repeat', type=int, default=3, help="计时次数")
+    parser.add_argument('--verbose', action='store_true', help="输出流程日志")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        CONFIG['logging']['log_level'] = 'warning'
+
+    from src.data.data_loader import extract_features, load_stopwords
+    from src.data.preprocessor import TextPreprocessor
+    from src.features.parallel_vocab import parallel_fit_transform
+    from src.features.vectorizers import TextVectorizer
+
+    CONFIG['preprocessing']['cache'] = {'enabled': False}
+    stopwords = load_stopwords()
+    corpus = synthetic_news_corpus(args.rows, args.content_words, seed=args.seed)
+    texts = TextPreprocessor(stopwords).preprocess_frame(extract_features(corpus))
+    print(f"合成语料: {len(texts)}个文档, 平均{args.content_words}词/篇")
+    print(f"{'向量化方法':<12}{'方式':<12}{'耗时(s)':>10}{'内存峰值(MB)':>14}")
+
+    n_jobs = args.n_jobs if args.n_jobs > 0 else (os.cpu_count() or 1)
+    failures = []
+    for vectorizer_type in [v.strip() for v in args.vectorizers.split(',') if v.strip()]:
+        def sklearn_fit() -> Tuple[Any, Any]:
+            vectorizer = TextVectorizer(vectorizer_type, stopwords).vectorizer
+            return vectorizer, vectorizer.fit_transform(texts)
+
+        def parallel_fit() -> Tuple[Any, Any]:
+            vectorizer = TextVectorizer(vectorizer_type, stopwords).vectorizer
+            return vectorizer, parallel_fit_transform(vectorizer, texts, n_jobs, args.chunk_size)
+
+        results = {}
+        for name, fit in (('sklearn', sklearn_fit), (f"parallel({n_jobs})", parallel_fit)):
+            result, seconds, peak_mb = measure(fit, args.repeat)
+            results[name] = (result, seconds, peak_mb)
+            print(f"{vectorizer_type:<12}{name:<12}{seconds:>10.3f}{peak_mb:>14.1f}")
+
+        (expected, base_time, base_mb), (actual, new_time, new_mb) = results.values()
+        problems = identical(expected, actual)
+        print(f"    加速比 {base_time / max(new_time, 1e-9):.2f}x, 内存峰值 {new_mb / max(base_mb, 1e-9):.0%}, "
+              f"结果{'一致' if not problems else '不一致: ' + '; '.join(problems)}")
+        failures.extend(f"{vectorizer_type}: {problem}" for problem in problems)
+
+    if failures:
+        raise SystemExit("并行拟合结果与sklearn不一致:\n    " + "\n    ".join(failures))
+
+
+if __name__ == "__main__":
+    main()
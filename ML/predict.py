@@ -0,0 +1,74 @@
+"""
+FakeNewsDetector - 使用已保存的模型对新闻进行预测
+"""
+import sys
+import json
+import argparse
+import traceback
+from typing import List, Optional
+
+from src.utils.logger import logger
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    预测入口函数，加载最新（或指定版本）的工件并对新闻打分。
+    
+    Args:
+        argv: 命令行参数，默认使用sys.argv
+    
+    命令行参数:
+        --title/--content/--account: 单条新闻的标题、内容和官方账号名
+        --input: 待预测的CSV文件，需包含标题、官方账号名和报告内容列
+        --output: 批量预测结果输出路径
+        --version: 工件版本号，默认使用最新版本
+        --threshold: 判定为虚假新闻的概率阈值
+    """
+    parser = argparse.ArgumentParser(description="FakeNewsDetector - 新闻真实性预测")
+    parser.add_argument('--title', type=str, default="", help="新闻标题")
+    parser.add_argument('--content', type=str, default="", help="新闻内容")
+    parser.add_argument('--account', type=str, default="", help="官方账号名")
+    parser.add_argument('--input', type=str, default=None, help="待预测的CSV文件")
+    parser.add_argument('--output', type=str, default='results/predictions.csv', help="批量预测结果输出路径")
+    parser.add_argument('--version', type=str, default=None, help="工件版本号，默认使用最新版本")
+    parser.add_argument('--threshold', type=float, default=0.5, help="判定为虚假新闻的概率阈值")
+    args = parser.parse_args(argv)
+    
+    if args.input is None and not (args.title or args.content):
+        parser.error("请通过--title/--content指定新闻，或通过--input指定CSV文件")
+    
+    # 解析参数后再导入推理依赖，--help和参数错误不承担pandas、sklearn的导入开销
+    from src.inference.predictor import NewsPredictor
+    predictor = NewsPredictor.load(args.version)
+    
+    if args.input:
+        import pandas as pd
+        from src.data.data_loader import FEATURE_COLUMNS
+        data = pd.read_csv(args.input, usecols=lambda col: col in FEATURE_COLUMNS)
+        records = [
+            {'title': row[0], 'account_name': row[1], 'content': row[2]}
+            for row in data.reindex(columns=FEATURE_COLUMNS).itertuples(index=False)
+        ]
+        probabilities = predictor.predict_proba(records)
+        data['fake_probability'] = probabilities
+        data['prediction'] = (probabilities >= args.threshold).astype(int)
+        data.to_csv(args.output, index=False)
+        logger.info(f"批量预测完成: {len(data)}条, 结果已保存到 {args.output}")
+        print(f"预测完成: {len(data)}条新闻，结果已保存到 {args.output}")
+    else:
+        record = {'title': args.title, 'account_name': args.account, 'content': args.content}
+        probability = float(predictor.predict_proba([record])[0])
+        print(json.dumps({
+            'version': predictor.bundle.version,
+            'fake_probability': probability,
+            'prediction': int(probability >= args.threshold)
+        }, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"预测出错: {str(e)}")
+        traceback.print_exc()
+        sys.exit(1)
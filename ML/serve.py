@@ -0,0 +1,39 @@
+"""
+FakeNewsDetector - HTTP推理服务入口
+"""
+import sys
+import argparse
+import traceback
+from typing import List, Optional
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    推理服务入口函数，加载模型工件并启动HTTP服务。
+    
+    Args:
+        argv: 命令行参数，默认使用sys.argv
+    
+    命令行参数:
+        --host: 监听地址
+        --port: 监听端口，默认与客户端ApiSettings.BaseUrl一致（5000）
+        --version: 模型工件版本，默认使用最新版本
+    """
+    parser = argparse.ArgumentParser(description="FakeNewsDetector - HTTP推理服务")
+    parser.add_argument('--host', type=str, default=None, help="监听地址")
+    parser.add_argument('--port', type=int, default=None, help="监听端口")
+    parser.add_argument('--version', type=str, default=None, help="模型工件版本，默认使用最新版本")
+    args = parser.parse_args(argv)
+    
+    # 解析参数后再导入服务依赖，--help不承担模型和HTTP框架的导入开销
+    from src.inference.server import run_server
+    run_server(args.host, args.port, args.version)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"推理服务出错: {str(e)}")
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,196 @@
+"""
+列式数据缓存模块
+
+首次加载CSV数据集时将所需列转换为Arrow IPC（Feather）格式，之后只要CSV未变化就直接
+以内存映射方式读取列式文件，省去CSV解析和类型推断的开销。
+依赖pyarrow，未安装时自动退回CSV读取。
+"""
+import os
+import json
+import hashlib
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from src.utils.config_loader import CONFIG
+from src.utils.logger import logger
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow为可选依赖
+    feather = None
+
+
+class ColumnarCache:
+    """列式数据缓存
+
+    每个CSV对应缓存目录下的一个.feather文件和一个.meta.json元数据文件。
+    元数据记录CSV的修改时间、大小、SHA-256哈希和缓存的列。
+    CSV的修改时间和大小未变时直接复用缓存；发生变化时重新计算哈希，
+    哈希一致则只刷新元数据，否则重新转换。
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, enabled: Optional[bool] = None) -> None:
+        """
+        初始化列式数据缓存
+
+        Args:
+            cache_dir: 缓存目录，默认使用配置中的data.columnar.cache_dir
+            enabled: 是否启用，默认使用配置中的data.columnar.enabled
+        """
+        config = CONFIG['data'].get('columnar', {}) or {}
+        self.cache_dir = cache_dir or config.get('cache_dir', 'cache/columnar')
+        self.enabled = config.get('enabled', True) if enabled is None else enabled
+
+        if self.enabled and feather is None:
+            logger.warning("未安装pyarrow，列式数据缓存不可用，将直接读取CSV")
+            self.enabled = False
+
+    def _paths(self, csv_path: str) -> Tuple[str, str]:
+        """
+        计算CSV对应的缓存文件路径
+
+        Args:
+            csv_path: CSV文件路径
+
+        Returns:
+            Tuple[str, str]: 列式文件路径和元数据文件路径
+        """
+        name = os.path.splitext(os.path.basename(csv_path))[0]
+        path_digest = hashlib.sha1(os.path.abspath(csv_path).encode('utf-8')).hexdigest()[:8]
+        base = os.path.join(self.cache_dir, f"{name}.{path_digest}")
+        return f"{base}.feather", f"{base}.meta.json"
+
+    @staticmethod
+    def _file_hash(path: str) -> str:
+        """
+        计算文件的SHA-256哈希
+
+        Args:
+            path: 文件路径
+
+        Returns:
+            str: 十六进制哈希值
+        """
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _is_fresh(self, csv_path: str, feather_path: str, meta: Dict[str, Any]) -> bool:
+        """
+        判断缓存是否仍与CSV一致
+
+        Args:
+            csv_path: CSV文件路径
+            feather_path: 列式文件路径
+            meta: 缓存元数据
+
+        Returns:
+            bool: 缓存是否可用
+        """
+        if not os.path.exists(feather_path):
+            return False
+
+        stat = os.stat(csv_path)
+        if meta.get('mtime_ns') == stat.st_mtime_ns and meta.get('size') == stat.st_size:
+            return True
+
+        # 修改时间或大小变化时比较内容哈希
+        return meta.get('sha256') == self._file_hash(csv_path)
+
+    def _write_meta(self, meta_path: str, meta: Dict[str, Any]) -> None:
+        """写入元数据文件"""
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    def ensure(self, csv_path: str, columns: List[str], convert: bool = True) -> Optional[str]:
+        """
+        确保CSV存在可用的列式缓存，必要时进行转换
+
+        转换需要把整个CSV读入内存；流式读取等不能一次载入数据集的场景应传入convert=False，
+        只复用已有的缓存。
+
+        Args:
+            csv_path: CSV文件路径
+            columns: 需要保留的列（特征列和标签列），缓存文件中的列顺序与之相同
+            convert: 缓存不存在或已过期时是否转换
+
+        Returns:
+            Optional[str]: 列式文件路径，缓存不可用且不转换时为None
+        """
+        if not self.enabled:
+            return None
+
+        feather_path, meta_path = self._paths(csv_path)
+        meta: Dict[str, Any] = {}
+        if os.path.exists(meta_path):
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"读取列式缓存元数据失败，将重新转换: {str(e)}")
+                meta = {}
+
+        stat = os.stat(csv_path)
+        if meta.get('columns') == columns and self._is_fresh(csv_path, feather_path, meta):
+            if meta.get('mtime_ns') != stat.st_mtime_ns or meta.get('size') != stat.st_size:
+                meta.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                self._write_meta(meta_path, meta)
+            logger.info(f"使用列式数据缓存: {feather_path}")
+            return feather_path
+        if not convert:
+            return None
+
+        logger.info(f"转换CSV为列式格式: {csv_path} -> {feather_path}")
+        data = pd.read_csv(csv_path, usecols=columns)
+        data = data[columns].reset_index(drop=True)
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{feather_path}.tmp"
+        # 不压缩，以便读取时可以直接内存映射
+        data.to_feather(tmp_path, compression='uncompressed')
+        os.replace(tmp_path, feather_path)
+
+        self._write_meta(meta_path, {
+            'csv_path': os.path.abspath(csv_path),
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': self._file_hash(csv_path),
+            'columns': columns,
+            'rows': len(data),
+        })
+        return feather_path
+
+    @staticmethod
+    def read(feather_path: str) -> pd.DataFrame:
+        """
+        以内存映射方式读取列式文件
+
+        数值列（如标签）可零拷贝转换为numpy数组，字符串列转换为pandas对象列。
+
+        Args:
+            feather_path: 列式文件路径
+
+        Returns:
+            pd.DataFrame: 数据
+        """
+        table = feather.read_table(feather_path, memory_map=True)
+        return table.to_pandas()
+
+    @staticmethod
+    def iter_chunks(feather_path: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        以内存映射方式分块读取列式文件
+
+        Args:
+            feather_path: 列式文件路径
+            chunk_size: 每块的最大行数
+
+        Yields:
+            pd.DataFrame: 数据块
+        """
+        table = feather.read_table(feather_path, memory_map=True)
+        for batch in table.to_batches(max_chunksize=chunk_size):
+            yield batch.to_pandas()
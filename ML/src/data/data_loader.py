@@ -5,15 +5,27 @@
 支持从配置中指定的文件路径读取数据，并处理基本的文件格式错误。
 """
 import os
-from typing import Tuple, List, Any, Optional
+from typing import Tuple, List, Optional, Iterator
 
 import pandas as pd
 import numpy as np
 from src.utils.config_loader import CONFIG
 from src.utils.logger import logger
+from src.data.stopwords import StopwordIndex
+from src.data.columnar_cache import ColumnarCache
 
 
-def load_data() -> Tuple[pd.DataFrame, np.ndarray, pd.DataFrame, np.ndarray, List[str]]:
+# 用于模型训练的特征列
+FEATURE_COLUMNS = ['Title', 'Ofiicial Account Name', 'Report Content']
+
+# 官方账号名列
+ACCOUNT_COLUMN = 'Ofiicial Account Name'
+
+# 标签列在原始数据中的位置（第6列）
+LABEL_COLUMN_INDEX = 5
+
+
+def load_data() -> Tuple[pd.DataFrame, np.ndarray, pd.DataFrame, np.ndarray, StopwordIndex]:
     """
     加载数据和停用词
     
@@ -25,7 +37,7 @@ def load_data() -> Tuple[pd.DataFrame, np.ndarray, pd.DataFrame, np.ndarray, Lis
         y_train (np.ndarray): 训练标签
         x_test (pd.DataFrame): 测试特征
         y_test (np.ndarray): 测试标签
-        stopwords (List[str]): 停用词列表
+        stopwords (StopwordIndex): 停用词索引
         
     Raises:
         FileNotFoundError: 文件路径不存在
@@ -46,10 +58,11 @@ def load_data() -> Tuple[pd.DataFrame, np.ndarray, pd.DataFrame, np.ndarray, Lis
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
     
-    # 加载训练和测试数据
+    # 加载训练和测试数据，只读取特征列和标签列
     try:
-        train_data = pd.read_csv(train_data_path)
-        test_data = pd.read_csv(test_data_path)
+        cache = ColumnarCache()
+        train_data, train_label_column = read_dataset(train_data_path, cache)
+        test_data, test_label_column = read_dataset(test_data_path, cache)
         
         # 验证数据集不为空
         if train_data.empty or test_data.empty:
@@ -57,15 +70,6 @@ def load_data() -> Tuple[pd.DataFrame, np.ndarray, pd.DataFrame, np.ndarray, Lis
             logger.error(error_msg)
             raise ValueError(error_msg)
             
-        # 检查数据集格式是否正确
-        required_columns = ['Title', 'Ofiicial Account Name', 'Report Content']
-        for dataset, name in [(train_data, "训练集"), (test_data, "测试集")]:
-            missing_cols = [col for col in required_columns if col not in dataset.columns]
-            if missing_cols:
-                error_msg = f"{name}缺少必要列: {', '.join(missing_cols)}"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-        
         logger.info(f"成功加载训练数据: {train_data.shape[0]}行, {train_data.shape[1]}列")
         logger.info(f"成功加载测试数据: {test_data.shape[0]}行, {test_data.shape[1]}列")
     except pd.errors.EmptyDataError:
@@ -81,20 +85,13 @@ def load_data() -> Tuple[pd.DataFrame, np.ndarray, pd.DataFrame, np.ndarray, Lis
         raise
     
     # 加载停用词
-    try:
-        with open(stopwords_path, 'r', encoding='utf-8') as f:
-            stopwords = [line.strip() for line in f if line.strip()]
-        
-        logger.info(f"成功加载停用词: {len(stopwords)}个")
-    except Exception as e:
-        logger.error(f"加载停用词失败: {str(e)}")
-        raise
+    stopwords = load_stopwords(stopwords_path)
     
     # 提取特征和标签
     x_train = extract_features(train_data)
-    y_train = extract_labels(train_data)
+    y_train = extract_labels(train_data, train_label_column)
     x_test = extract_features(test_data)
-    y_test = extract_labels(test_data)
+    y_test = extract_labels(test_data, test_label_column)
     
     logger.info("数据加载完成")
     return x_train, y_train, x_test, y_test, stopwords
@@ -113,23 +110,168 @@ def extract_features(data: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame: 包含特征列的数据框（标题、官方账号名和报告内容）
     """
     # 选择标题、官方账号名和报告内容作为特征
-    feature_columns = ['Title', 'Ofiicial Account Name', 'Report Content']
-    return data[feature_columns].copy()
+    return data[FEATURE_COLUMNS].copy()
 
 
-def extract_labels(data: pd.DataFrame) -> np.ndarray:
+def extract_labels(data: pd.DataFrame, label_column: Optional[str] = None) -> np.ndarray:
     """
     从数据集中提取标签
     
-    从原始数据框中提取标签列（第6列，索引为5）
+    从原始数据框中提取标签列（默认为第6列，索引为5）
     
     Args:
         data: 原始数据集
+        label_column: 标签列名，为None时使用第6列
     
     Returns:
         np.ndarray: 标签数组
     """
-    # 标签在第6列（索引为5）
-    label_column = data.columns[5]
+    # 标签在原始数据的第6列（索引为5）
+    label_column = label_column or data.columns[LABEL_COLUMN_INDEX]
     logger.debug(f"提取标签列: {label_column}")
-    return np.array(data[label_column])
\ No newline at end of file
+    return np.array(data[label_column])
+
+
+def load_stopwords(stopwords_path: Optional[str] = None) -> StopwordIndex:
+    """
+    加载停用词索引
+    
+    Args:
+        stopwords_path: 停用词文件路径，默认使用配置中的路径
+    
+    Returns:
+        StopwordIndex: 停用词索引
+        
+    Raises:
+        FileNotFoundError: 停用词文件不存在
+    """
+    stopwords_path = stopwords_path or CONFIG['data']['stopwords_path']
+    try:
+        stopwords = StopwordIndex.from_file(stopwords_path)
+        logger.info(f"成功加载停用词: {len(stopwords)}个")
+    except Exception as e:
+        logger.error(f"加载停用词失败: {str(e)}")
+        raise
+    return stopwords
+
+
+def load_account_names(file_path: str) -> List[str]:
+    """
+    读取数据集中出现过的官方账号名
+    
+    只解析官方账号名一列，去掉空值和首尾空白后去重，按出现次数从多到少排列。
+    
+    Args:
+        file_path: CSV文件路径
+    
+    Returns:
+        List[str]: 官方账号名列表
+        
+    Raises:
+        FileNotFoundError: 数据文件不存在
+    """
+    if not os.path.exists(file_path):
+        logger.error(f"数据文件不存在: {file_path}")
+        raise FileNotFoundError(f"数据文件不存在: {file_path}")
+    
+    names = pd.read_csv(file_path, usecols=[ACCOUNT_COLUMN])[ACCOUNT_COLUMN].dropna().astype(str).str.strip()
+    return names[names != ''].value_counts().index.tolist()
+
+
+def iter_data_chunks(file_path: str, chunk_size: Optional[int] = None) -> Iterator[Tuple[pd.DataFrame, np.ndarray]]:
+    """
+    分块流式读取数据集
+    
+    只读取三个特征列和标签列，每次产出固定行数的数据块，
+    峰值内存与块大小相关而与数据集大小无关。
+    
+    Args:
+        file_path: CSV文件路径
+        chunk_size: 每块的行数，默认使用配置中的data.chunk_size
+    
+    Yields:
+        Tuple[pd.DataFrame, np.ndarray]: 特征数据块和对应的标签数组
+        
+    Raises:
+        FileNotFoundError: 文件不存在
+        ValueError: 数据集缺少必要列
+    """
+    if not os.path.exists(file_path):
+        error_msg = f"文件不存在: {file_path}"
+        logger.error(error_msg)
+        raise FileNotFoundError(error_msg)
+    
+    chunk_size = chunk_size or CONFIG['data'].get('chunk_size', 5000)
+    label_column = resolve_label_column(file_path)
+    columns = FEATURE_COLUMNS + [label_column]
+    
+    logger.info(f"流式读取数据: {file_path}, 块大小: {chunk_size}, 标签列: {label_column}")
+    
+    # 已有可用的列式缓存时按批次内存映射读取，否则分块解析CSV；
+    # 生成缓存需要读入整个CSV，流式读取不生成缓存，峰值内存仍只与块大小相关
+    feather_path = ColumnarCache().ensure(file_path, columns, convert=False)
+    if feather_path:
+        reader = ColumnarCache.iter_chunks(feather_path, chunk_size)
+    else:
+        reader = pd.read_csv(file_path, usecols=columns, chunksize=chunk_size)
+    
+    total_rows = 0
+    for chunk in reader:
+        total_rows += len(chunk)
+        yield chunk[FEATURE_COLUMNS], chunk[label_column].to_numpy()
+    
+    logger.info(f"流式读取完成: {file_path}, 共{total_rows}行")
+
+
+def resolve_label_column(file_path: str) -> str:
+    """
+    读取CSV表头，校验特征列并确定标签列名
+    
+    Args:
+        file_path: CSV文件路径
+    
+    Returns:
+        str: 标签列名
+        
+    Raises:
+        ValueError: 数据集缺少必要列
+    """
+    columns = pd.read_csv(file_path, nrows=0).columns
+    missing_cols = [col for col in FEATURE_COLUMNS if col not in columns]
+    if missing_cols:
+        error_msg = f"{file_path}缺少必要列: {', '.join(missing_cols)}"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+    if len(columns) <= LABEL_COLUMN_INDEX:
+        error_msg = f"{file_path}缺少标签列（第{LABEL_COLUMN_INDEX + 1}列）"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+    return columns[LABEL_COLUMN_INDEX]
+
+
+def read_dataset(file_path: str, cache: Optional[ColumnarCache] = None) -> Tuple[pd.DataFrame, str]:
+    """
+    读取数据集的特征列和标签列
+    
+    启用列式缓存且pyarrow可用时，首次读取会把CSV转换为Feather文件，
+    之后CSV未变化时直接以内存映射方式读取Feather文件；否则只解析CSV中需要的列。
+    
+    Args:
+        file_path: CSV文件路径
+        cache: 列式数据缓存，默认按配置创建
+    
+    Returns:
+        Tuple[pd.DataFrame, str]: 包含特征列和标签列的数据，以及标签列名
+        
+    Raises:
+        ValueError: 数据集缺少必要列
+    """
+    label_column = resolve_label_column(file_path)
+    columns = FEATURE_COLUMNS + [label_column]
+    
+    cache = cache or ColumnarCache()
+    feather_path = cache.ensure(file_path, columns)
+    if feather_path:
+        return ColumnarCache.read(feather_path), label_column
+    
+    return pd.read_csv(file_path, usecols=columns)[columns], label_column
@@ -3,13 +3,171 @@
 
 提供用于处理原始文本数据的类和函数，包括分词、停用词过滤和文本特征提取等操作。
 此模块是模型训练的关键预处理步骤，可以显著影响模型性能。
+preprocessing.output为tokens时输出词列表，向量化器直接使用，不再重新切分文本。
 """
+import os
+import time
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 import pandas as pd
 import jieba
-from typing import List, Tuple, Callable, Optional, Union, Dict, Any
+from typing import List, Tuple, Callable, Optional, Union, Dict, Any, Iterable, Iterator
 from tqdm import tqdm
 from src.utils.config_loader import CONFIG
 from src.utils.logger import logger
+from src.data.token_cache import TokenCache
+from src.data.stopwords import StopwordIndex
+from src.data.data_loader import FEATURE_COLUMNS, load_account_names
+
+
+# 并行分词工作进程内的分词器状态，由_init_tokenize_worker在进程启动时设置一次
+_worker_state: Dict[str, Any] = {}
+
+# jieba分词器是进程级单例，记录本进程已应用的初始化配置，同一配置只初始化一次
+_jieba_settings_applied: Optional[str] = None
+
+# 分词结果的输出形式：以空格分隔的文本，或词列表
+OUTPUT_MODES = ('text', 'tokens')
+
+# 单条文本的分词结果
+Tokenized = Union[str, List[str]]
+
+# 预热文本，覆盖词典词、未登录词（触发HMM模型加载）、数字和英文
+WARMUP_TEXT = "新华社北京电 国务院新闻办公室今日举行发布会，网传某地出现5G基站致病的说法不实，专家呼吁理性看待。"
+
+
+def initialize_jieba(settings: Dict[str, Any]) -> float:
+    """
+    按配置显式初始化jieba分词器
+
+    先设置前缀词典序列化缓存的目录：缓存比词典文件新时jieba.initialize直接反序列化缓存，
+    否则构建前缀词典并写入缓存。随后依次加载用户词典。
+    主进程和并行分词工作进程共用此函数，进程内同一配置只执行一次。
+
+    Args:
+        settings: TextPreprocessor.jieba_settings，包含dictionary、dict_cache_dir和user_dicts
+
+    Returns:
+        float: 初始化耗时（秒），本进程已按相同配置初始化时为0
+    """
+    global _jieba_settings_applied
+    key = repr(sorted(settings.items()))
+    if _jieba_settings_applied == key:
+        return 0.0
+
+    start = time.perf_counter()
+    if settings.get('dictionary'):
+        jieba.set_dictionary(settings['dictionary'])
+    cache_dir = settings.get('dict_cache_dir')
+    if cache_dir:
+        # 只设置目录，缓存文件名由jieba按主词典路径生成，更换主词典不会误用旧缓存
+        os.makedirs(cache_dir, exist_ok=True)
+        jieba.dt.tmp_dir = os.path.abspath(cache_dir)
+    jieba.initialize()
+    for path in settings.get('user_dicts', []):
+        jieba.load_userdict(path)
+
+    _jieba_settings_applied = key
+    return time.perf_counter() - start
+
+
+def _cut_and_filter(text: str, tokenizer: str, stopwords: StopwordIndex, use_stopwords: bool,
+                    output: str = 'text') -> Tokenized:
+    """
+    对单条文本分词并过滤停用词
+
+    供主进程和并行分词工作进程共用，保证两种模式输出一致。
+
+    Args:
+        text: 待分词文本
+        tokenizer: 分词器类型，'jieba'或'paddle'
+        stopwords: 停用词索引
+        use_stopwords: 是否过滤停用词
+        output: 'text'输出以空格分隔的文本，'tokens'输出词列表
+
+    Returns:
+        Tokenized: 分词后的文本或词列表
+    """
+    if tokenizer == 'paddle':
+        words = list(jieba.cut(text, use_paddle=True))
+    else:
+        words = list(jieba.cut(text))
+
+    if use_stopwords and stopwords:
+        # 过滤停用词
+        words = stopwords.filter(words)
+
+    if output == 'tokens':
+        # 空白词在文本模式下由向量化器的正则切分丢弃，词列表模式在这里去掉
+        return [word for word in words if word.strip()]
+    return " ".join(words)
+
+
+def _init_tokenize_worker(tokenizer: str, stopwords: StopwordIndex, use_stopwords: bool,
+                          jieba_settings: Dict[str, Any], output: str = 'text') -> None:
+    """
+    并行分词工作进程初始化函数
+
+    每个工作进程只执行一次：按与主进程相同的配置初始化jieba词典并缓存分词参数。
+    主进程已写好前缀词典缓存，工作进程直接加载缓存；fork启动的工作进程继承主进程已初始化的词典。
+
+    Args:
+        tokenizer: 分词器类型
+        stopwords: 停用词索引
+        use_stopwords: 是否过滤停用词
+        jieba_settings: jieba初始化配置
+        output: 输出形式，'text'或'tokens'
+    """
+    if tokenizer == 'paddle':
+        try:
+            jieba.enable_paddle()
+        except Exception:
+            tokenizer = 'jieba'
+    initialize_jieba(jieba_settings)
+
+    _worker_state['tokenizer'] = tokenizer
+    _worker_state['stopwords'] = stopwords
+    _worker_state['use_stopwords'] = use_stopwords
+    _worker_state['output'] = output
+
+
+def _tokenize_chunk(texts: List[str]) -> List[Tokenized]:
+    """
+    在工作进程中对一个文本块进行分词
+
+    Args:
+        texts: 文本块
+
+    Returns:
+        List[Tokenized]: 分词结果，顺序与输入一致
+    """
+    output = _worker_state['output']
+    results = []
+    failures = 0
+    first_error = None
+    for text in texts:
+        if not text or not isinstance(text, str):
+            results.append([] if output == 'tokens' else "")
+            continue
+        try:
+            results.append(_cut_and_filter(
+                text,
+                _worker_state['tokenizer'],
+                _worker_state['stopwords'],
+                _worker_state['use_stopwords'],
+                output
+            ))
+        except Exception as e:
+            # 与单进程分词一致，失败的文本输出空结果；每块只记录一次日志，避免逐条刷屏
+            failures += 1
+            if first_error is None:
+                first_error = f"{str(e)}, 文本: {text[:100]}..."
+            results.append([] if output == 'tokens' else "")
+    if failures:
+        logger.error(f"分词失败: 本块{len(texts)}条中{failures}条失败, 第一条: {first_error}")
+    return results
 
 
 class TextPreprocessor:
@@ -19,17 +177,26 @@ class TextPreprocessor:
     支持使用jieba和paddle两种分词方式。
     """
     
-    def __init__(self, stopwords: Optional[List[str]] = None) -> None:
+    def __init__(self, stopwords: Optional[Union[StopwordIndex, List[str]]] = None,
+                 config: Optional[Dict[str, Any]] = None) -> None:
         """
         初始化预处理器
         
         Args:
-            stopwords: 停用词列表，如果为None则不使用停用词
+            stopwords: 停用词索引或停用词列表，如果为None则不使用停用词
+            config: 预处理配置，默认使用全局配置中的preprocessing部分
         """
-        self.stopwords = stopwords if stopwords else []
-        self.use_stopwords = CONFIG['preprocessing']['use_stopwords']
-        self.content_separator = CONFIG['preprocessing']['content_separator']
-        self.tokenizer = CONFIG['preprocessing']['tokenizer']
+        config = config if config is not None else CONFIG['preprocessing']
+        self.stopwords = StopwordIndex.coerce(stopwords)
+        self.use_stopwords = config['use_stopwords']
+        self.content_separator = config['content_separator']
+        self.tokenizer = config['tokenizer']
+        self.n_workers = self._resolve_n_workers(config.get('n_workers', 1))
+        self.chunk_size = max(1, int(config.get('chunk_size', 1000)))
+        self.output = config.get('output', 'text')
+        if self.output not in OUTPUT_MODES:
+            logger.error(f"不支持的预处理输出形式: {self.output}")
+            raise ValueError(f"不支持的预处理输出形式: {self.output}，可选: {', '.join(OUTPUT_MODES)}")
         
         # 初始化分词器
         if self.tokenizer == 'paddle':
@@ -41,9 +208,171 @@ class TextPreprocessor:
                 logger.warning(f"无法启用paddle模式分词，将使用默认模式: {str(e)}")
                 self.tokenizer = 'jieba'
         
-        logger.info(f"初始化文本预处理器: 使用停用词={self.use_stopwords}, 分词器={self.tokenizer}")
+        # jieba词典配置，词典在第一次分词或调用initialize_tokenizer/warm_up时加载
+        self.jieba_settings = self._resolve_jieba_settings(config.get('jieba', {}) or {})
+        self._tokenizer_ready = False
+        
+        # 初始化分词缓存
+        self.cache: Optional[TokenCache] = None
+        cache_config = config.get('cache', {}) or {}
+        if cache_config.get('enabled', False):
+            self.cache = TokenCache(
+                cache_config.get('path', 'cache/tokens.sqlite'),
+                self.tokenization_settings(),
+                cache_config.get('max_entries', 1000000)
+            )
+        
+        logger.info(f"初始化文本预处理器: 使用停用词={self.use_stopwords}, 分词器={self.tokenizer}, "
+                    f"并行进程数={self.n_workers}, 分词缓存={self.cache is not None}, 输出={self.output}")
     
-    def tokenize_text(self, text: str) -> str:
+    def tokenization_settings(self) -> Dict[str, Any]:
+        """
+        获取影响分词结果的配置，用于计算分词缓存键
+        
+        Returns:
+            Dict[str, Any]: 分词器、停用词指纹和分隔符等配置
+        """
+        settings = {
+            'tokenizer': self.tokenizer,
+            'use_stopwords': self.use_stopwords,
+            'stopwords': self.stopwords.fingerprint,
+            'content_separator': self.content_separator,
+            'dictionaries': self._dictionary_fingerprint(),
+        }
+        # 只在词列表模式下加入，文本模式的已有缓存键保持不变
+        if self.output != 'text':
+            settings['output'] = self.output
+        return settings
+    
+    def _resolve_jieba_settings(self, jieba_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        解析jieba初始化配置
+        
+        过滤不存在的用户词典；启用account_names时生成或复用官方账号名词典并追加到用户词典。
+        
+        Args:
+            jieba_config: 预处理配置中的jieba部分
+            
+        Returns:
+            Dict[str, Any]: initialize_jieba使用的配置
+        """
+        user_dicts = []
+        for path in jieba_config.get('user_dicts') or []:
+            if os.path.exists(path):
+                user_dicts.append(path)
+            else:
+                logger.warning(f"用户词典不存在，已跳过: {path}")
+        
+        if jieba_config.get('account_names', False):
+            account_dict = self._ensure_account_dictionary(
+                jieba_config.get('account_dict', 'cache/jieba/account_names.txt'))
+            if account_dict:
+                user_dicts.append(account_dict)
+        
+        return {
+            'dictionary': jieba_config.get('dictionary'),
+            'dict_cache_dir': jieba_config.get('dict_cache_dir'),
+            'user_dicts': user_dicts,
+        }
+    
+    @staticmethod
+    def _ensure_account_dictionary(account_dict: str) -> Optional[str]:
+        """
+        生成官方账号名用户词典
+        
+        词典比训练集新时直接复用；否则从训练集的官方账号名列重新生成。
+        jieba只会把连续的汉字、字母和数字切成一个词，含空格等字符的账号名无法整体匹配，生成时跳过。
+        训练集不存在时使用已有的词典。只在训练时调用：推理和在线更新使用工件中保存的词典副本，
+        ArtifactBundle.preprocessing_config会关闭account_names。
+        
+        Args:
+            account_dict: 词典路径
+            
+        Returns:
+            Optional[str]: 词典路径，无法生成且不存在时为None
+        """
+        train_path = CONFIG['data']['train_path']
+        if not os.path.exists(train_path):
+            return account_dict if os.path.exists(account_dict) else None
+        if os.path.exists(account_dict) and os.path.getmtime(account_dict) >= os.path.getmtime(train_path):
+            return account_dict
+        
+        names = [name for name in load_account_names(train_path) if jieba.re_han_default.fullmatch(name)]
+        os.makedirs(os.path.dirname(account_dict) or '.', exist_ok=True)
+        tmp_path = f"{account_dict}.tmp{os.getpid()}"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.writelines(f"{name}\n" for name in names)
+        os.replace(tmp_path, account_dict)
+        logger.info(f"已生成官方账号名词典: {account_dict}, {len(names)}个账号名")
+        return account_dict
+    
+    def dictionaries(self) -> Dict[str, Any]:
+        """
+        获取已解析的jieba用户词典及其指纹，训练后随模型工件保存
+        
+        Returns:
+            Dict[str, Any]: user_dicts为用户词典路径列表，fingerprint为词典指纹
+        """
+        return {'user_dicts': list(self.jieba_settings['user_dicts']), 'fingerprint': self._dictionary_fingerprint()}
+    
+    def _dictionary_fingerprint(self) -> str:
+        """主词典路径和各用户词典内容的摘要，词典变化时分词缓存随之失效"""
+        digest = hashlib.sha1(repr(self.jieba_settings.get('dictionary')).encode('utf-8'))
+        for path in self.jieba_settings['user_dicts']:
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+            digest.update(b'\0')
+        return digest.hexdigest()
+    
+    def initialize_tokenizer(self) -> None:
+        """
+        显式初始化分词器
+        
+        加载（或构建并缓存）jieba前缀词典和用户词典。不调用时在第一次分词前自动执行。
+        """
+        elapsed = initialize_jieba(self.jieba_settings)
+        if elapsed:
+            logger.info(f"jieba分词器初始化完成: 用户词典{len(self.jieba_settings['user_dicts'])}个, "
+                        f"用时{elapsed * 1000:.0f}ms")
+        self._tokenizer_ready = True
+    
+    def warm_up(self, texts: Optional[List[str]] = None) -> float:
+        """
+        预热分词器
+        
+        初始化词典并对示例文本分词，触发HMM模型等其余惰性加载，
+        使之后第一次分词的延迟与稳态一致。适合在服务启动或工作进程启动时调用。
+        
+        Args:
+            texts: 预热文本，默认使用内置示例
+            
+        Returns:
+            float: 预热耗时（秒）
+        """
+        start = time.perf_counter()
+        self.initialize_tokenizer()
+        for text in texts or [WARMUP_TEXT]:
+            _cut_and_filter(text, self.tokenizer, self.stopwords, self.use_stopwords)
+        elapsed = time.perf_counter() - start
+        logger.info(f"分词器预热完成, 用时{elapsed * 1000:.0f}ms")
+        return elapsed
+    
+    @staticmethod
+    def _resolve_n_workers(n_workers: Optional[int]) -> int:
+        """
+        解析分词并行进程数
+        
+        Args:
+            n_workers: 配置的进程数，None、0或负数表示使用全部CPU核心
+            
+        Returns:
+            int: 实际使用的进程数
+        """
+        if n_workers is None or int(n_workers) <= 0:
+            return os.cpu_count() or 1
+        return int(n_workers)
+    
+    def tokenize_text(self, text: str) -> Tokenized:
         """
         对文本进行分词
         
@@ -53,31 +382,28 @@ class TextPreprocessor:
             text: 待分词文本
             
         Returns:
-            str: 分词后的文本，以空格分隔
+            Tokenized: 分词后以空格分隔的文本，输出形式为tokens时为词列表
             
         Raises:
             ValueError: 文本格式无效或分词过程出错
         """
         if not text or not isinstance(text, str):
-            return ""
+            return self._empty_result()
+        if not self._tokenizer_ready:
+            self.initialize_tokenizer()
             
         try:
-            if self.tokenizer == 'paddle':
-                words = list(jieba.cut(text, use_paddle=True))
-            else:
-                words = list(jieba.cut(text))
-            
-            if self.use_stopwords and self.stopwords:
-                # 过滤停用词
-                words = [word for word in words if word not in self.stopwords and word.strip()]
-            
-            return " ".join(words)
+            return _cut_and_filter(text, self.tokenizer, self.stopwords, self.use_stopwords, self.output)
         except Exception as e:
             logger.error(f"分词失败: {str(e)}, 文本: {text[:100]}...")
-            return ""
+            return self._empty_result()
+    
+    def _empty_result(self) -> Tokenized:
+        """无效文本的分词结果：空文本或空词列表"""
+        return [] if self.output == 'tokens' else ""
     
     def preprocess_data(self, x_train: pd.DataFrame, x_test: pd.DataFrame, 
-                        progress_callback: Optional[Callable] = None) -> Tuple[List[str], List[str]]:
+                        progress_callback: Optional[Callable] = None) -> Tuple[List[Tokenized], List[Tokenized]]:
         """
         预处理训练和测试数据
         
@@ -89,25 +415,21 @@ class TextPreprocessor:
             progress_callback: 进度回调函数，用于更新UI进度
             
         Returns:
-            Tuple[List[str], List[str]]: 处理后的训练数据和测试数据
+            Tuple[List[Tokenized], List[Tokenized]]: 处理后的训练数据和测试数据
             
         Raises:
             ValueError: 数据格式无效或预处理过程出错
         """
         logger.info("开始数据预处理")
         
-        # 创建数据副本以避免警告
-        x_train = x_train.copy()
-        x_test = x_test.copy()
-        
         if progress_callback:
             progress_callback("预处理数据")
         
         try:
-            # 评论分条处理
-            logger.info("处理报告内容分隔符")
-            self._process_report_content(x_train, "Report Content")
-            self._process_report_content(x_test, "Report Content")
+            # 评论分条处理并整合特征，只生成新的文本列表，不修改也不复制原始数据
+            logger.info("处理报告内容分隔符并整合特征")
+            train_texts = self._integrate_features(x_train)
+            test_texts = self._integrate_features(x_test)
             
             if progress_callback:
                 progress_callback(20)
@@ -116,19 +438,15 @@ class TextPreprocessor:
             if progress_callback:
                 progress_callback("中文分词")
             
-            # 处理训练数据
-            logger.info("对训练数据进行特征整合和分词")
-            x_train_processed = self._integrate_and_tokenize_features(x_train)
-            
-            if progress_callback:
-                progress_callback(20)
+            # 处理训练数据，分词进度在内部按块汇报（共20%）
+            logger.info("对训练数据进行分词")
+            x_train_processed = self.tokenize_texts(train_texts, progress_callback, 20)
+            del train_texts
             
             # 处理测试数据
-            logger.info("对测试数据进行特征整合和分词")
-            x_test_processed = self._integrate_and_tokenize_features(x_test)
-            
-            if progress_callback:
-                progress_callback(20)
+            logger.info("对测试数据进行分词")
+            x_test_processed = self.tokenize_texts(test_texts, progress_callback, 20)
+            del test_texts
             
             # 输出一些数据样例以便调试
             if logger.level <= 10:  # DEBUG级别
@@ -142,68 +460,209 @@ class TextPreprocessor:
             logger.error(f"数据预处理失败: {str(e)}")
             raise ValueError(f"数据预处理错误: {str(e)}")
     
-    def _process_report_content(self, data: pd.DataFrame, column: str) -> None:
+    def preprocess_frame(self, data: pd.DataFrame) -> List[Tokenized]:
         """
-        处理报告内容的分隔符
+        预处理单个数据集
         
-        将报告内容按分隔符分割后重新连接为单个文本。
+        整合特征并分词，用于推理等不区分训练集和测试集的场景。
         
         Args:
-            data: 数据集
-            column: 报告内容列名
+            data: 包含标题、官方账号名和报告内容列的数据
+            
+        Returns:
+            List[Tokenized]: 分词后的文本列表，与输入逐行对应
+        """
+        return self.tokenize_texts(self._integrate_features(data))
+    
+    def preprocess_stream(self, chunks: Iterable[Tuple[pd.DataFrame, np.ndarray]]
+                          ) -> Iterator[Tuple[List[Tokenized], np.ndarray]]:
         """
-        if column not in data.columns:
-            logger.warning(f"列 {column} 不存在于数据集中")
-            return
+        流式预处理数据块
+        
+        逐块整合特征并分词，与data_loader.iter_data_chunks配合使用，
+        整个数据集不会同时驻留在内存中。
+        
+        Args:
+            chunks: (特征数据块, 标签数组) 序列
+            
+        Yields:
+            Tuple[List[Tokenized], np.ndarray]: 分词后的文本列表和对应的标签数组
             
-        data.loc[:, column] = data[column].apply(
-            lambda x: x.split(self.content_separator) if isinstance(x, str) else [])
-        data.loc[:, column] = data[column].apply(
-            lambda x: " ".join(x) if isinstance(x, list) else "")
+        Raises:
+            ValueError: 数据格式无效或预处理过程出错
+        """
+        processed_rows = 0
+        for features, labels in chunks:
+            texts = self._integrate_features(features)
+            processed = self.tokenize_texts(texts)
+            processed_rows += len(processed)
+            logger.info(f"流式预处理进度: {processed_rows}行")
+            yield processed, labels
     
-    def _integrate_and_tokenize_features(self, data: pd.DataFrame) -> List[str]:
+    def _join_report_content(self, content: pd.Series) -> pd.Series:
         """
-        整合并分词特征
+        处理报告内容的分隔符
         
-        将标题、官方账号名和报告内容合并为一个特征，并进行分词。
+        将报告内容按分隔符分割后重新连接为单个文本，非字符串内容视为空文本。
         
         Args:
-            data: 数据集
+            content: 报告内容列
             
         Returns:
-            List[str]: 分词后的特征列表
+            pd.Series: 处理后的报告内容
         """
-        # 准备好整合后的特征列
-        data.loc[:, "integrated_features"] = ""
+        separator = self.content_separator
+        return content.map(lambda x: " ".join(x.split(separator)) if isinstance(x, str) else "")
+    
+    def _integrate_features(self, data: pd.DataFrame) -> List[str]:
+        """
+        整合特征
         
-        # 将所有字段转为字符串类型
-        t = pd.DataFrame(data.astype(str))
+        将标题、官方账号名和报告内容合并为一个文本。只对这三列做字符串转换，
+        不在原始数据上添加列。
         
-        # 整合特征
-        if "Title" in t.columns and "Ofiicial Account Name" in t.columns and "Report Content" in t.columns:
-            data.loc[:, "integrated_features"] = (
-                t["Title"] + ' ' + t["Ofiicial Account Name"] + ' ' + t["Report Content"]
-            )
-        else:
-            available_columns = [col for col in ["Title", "Ofiicial Account Name", "Report Content"] if col in t.columns]
+        Args:
+            data: 数据集
+            
+        Returns:
+            List[str]: 整合后的文本列表
+            
+        Raises:
+            ValueError: 没有可用的特征列
+        """
+        available_columns = [col for col in FEATURE_COLUMNS if col in data.columns]
+        if not available_columns:
+            raise ValueError("无可用特征列")
+        if len(available_columns) < len(FEATURE_COLUMNS):
             logger.warning(f"部分特征列不存在，仅使用: {available_columns}")
-            if available_columns:
-                data.loc[:, "integrated_features"] = t[available_columns].apply(
-                    lambda row: ' '.join(row), axis=1
-                )
+        if "Report Content" not in data.columns:
+            logger.warning("列 Report Content 不存在于数据集中")
+        
+        parts = []
+        for col in available_columns:
+            column = data[col]
+            if col == "Report Content":
+                column = self._join_report_content(column)
+            parts.append(column.astype(str))
+        
+        integrated = parts[0]
+        for part in parts[1:]:
+            integrated = integrated + ' ' + part
+        return integrated.tolist()
+    
+    def tokenize_texts(self, texts: List[str], progress_callback: Optional[Callable] = None,
+                       progress_share: int = 0) -> List[Tokenized]:
+        """
+        批量分词
+        
+        启用分词缓存时先按内容哈希查询缓存，只对未命中的文本分词并写回缓存。
+        n_workers大于1且待分词文本超过一个分块时使用多进程并行分词，否则在当前进程中逐条分词。
+        输出顺序与输入顺序一致。
+        
+        Args:
+            texts: 待分词文本列表
+            progress_callback: 进度回调函数
+            progress_share: 分词过程中通过回调汇报的总进度增量
+            
+        Returns:
+            List[Tokenized]: 分词后的文本列表
+        """
+        total = len(texts)
+        reported = 0
+        
+        def report(done: int) -> None:
+            nonlocal reported
+            if progress_callback and progress_share and total:
+                target = progress_share * done // total
+                if target > reported:
+                    progress_callback(target - reported)
+                    reported = target
+        
+        if self.cache is None:
+            processed_data = self._tokenize_uncached(texts, report)
+            report(total)
+            return processed_data
+        
+        # 先查询缓存，只对未命中的文本分词；缓存中始终保存以空格分隔的文本
+        processed: List[Any] = self.cache.get_many(texts)
+        if self.output == 'tokens':
+            processed = [None if value is None else (value.split(" ") if value else []) for value in processed]
+        miss_indices = [i for i, value in enumerate(processed) if value is None]
+        hit_count = total - len(miss_indices)
+        report(hit_count)
+        
+        if miss_indices:
+            miss_texts = [texts[i] for i in miss_indices]
+            miss_results = self._tokenize_uncached(miss_texts, lambda done: report(hit_count + done))
+            for i, value in zip(miss_indices, miss_results):
+                processed[i] = value
+            if self.output == 'tokens':
+                self.cache.put_many((text, " ".join(tokens)) for text, tokens in zip(miss_texts, miss_results))
             else:
-                raise ValueError("无可用特征列")
+                self.cache.put_many(zip(miss_texts, miss_results))
         
-        # 分词
-        processed_data = []
-        total = len(data)
+        logger.info(f"分词缓存: 本批命中={hit_count}, 未命中={len(miss_indices)}")
+        self.cache.log_stats()
+        report(total)
+        return processed  # type: ignore[return-value]
+    
+    def _tokenize_uncached(self, texts: List[str], report: Callable[[int], None]) -> List[Tokenized]:
+        """
+        对文本进行实际分词，根据配置选择单进程或多进程
+        
+        Args:
+            texts: 待分词文本列表
+            report: 进度汇报函数，参数为已完成的文本数
+            
+        Returns:
+            List[Tokenized]: 分词后的文本列表
+        """
+        total = len(texts)
+        if self.n_workers > 1 and total > self.chunk_size:
+            return self._tokenize_parallel(texts, report)
         
-        for i, text in enumerate(data["integrated_features"]):
-            processed_text = self.tokenize_text(text)
-            processed_data.append(processed_text)
+        processed_data = []
+        step = max(1, total // 10)
+        for i, text in enumerate(texts):
+            processed_data.append(self.tokenize_text(text))
             
             # 每处理10%的数据记录一次日志
-            if i % max(1, total // 10) == 0:
+            if i % step == 0:
                 logger.info(f"分词进度: {i}/{total}")
+                report(i)
+        
+        return processed_data
+    
+    def _tokenize_parallel(self, texts: List[str], report: Callable[[int], None]) -> List[Tokenized]:
+        """
+        多进程并行分词
+        
+        将文本按chunk_size切分为若干块，提交到进程池中分词。
+        每个工作进程在启动时初始化一次jieba，按提交顺序收集结果以保证输出顺序。
+        
+        Args:
+            texts: 待分词文本列表
+            report: 进度汇报函数，参数为已完成的文本数
+            
+        Returns:
+            List[Tokenized]: 分词后的文本列表
+        """
+        total = len(texts)
+        chunks = [texts[i:i + self.chunk_size] for i in range(0, total, self.chunk_size)]
+        logger.info(f"使用{self.n_workers}个进程并行分词: {total}条文本, {len(chunks)}个分块")
+        
+        # 主进程先初始化：前缀词典缓存写好后工作进程直接加载，fork启动时还能继承已加载的词典
+        self.initialize_tokenizer()
+        
+        processed_data: List[Tokenized] = []
+        with ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            initializer=_init_tokenize_worker,
+            initargs=(self.tokenizer, self.stopwords, self.use_stopwords, self.jieba_settings, self.output)
+        ) as executor:
+            for chunk_result in executor.map(_tokenize_chunk, chunks):
+                processed_data.extend(chunk_result)
+                logger.info(f"分词进度: {len(processed_data)}/{total}")
+                report(len(processed_data))
         
-        return processed_data 
\ No newline at end of file
+        return processed_data
@@ -0,0 +1,117 @@
+"""
+停用词索引模块
+
+提供基于frozenset的停用词索引，用于替代停用词列表上的线性查找。
+索引从停用词文件构建一次，之后在预处理和向量化阶段共享使用。
+"""
+import hashlib
+from typing import Iterable, Iterator, List, Optional, Union
+
+
+class StopwordIndex:
+    """停用词索引
+
+    使用frozenset保存停用词，单次查询为O(1)。
+    提供对单个分词结果和批量分词结果的过滤接口。
+    """
+
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        """
+        初始化停用词索引
+
+        Args:
+            words: 停用词序列，空字符串会被忽略
+        """
+        self._words = frozenset(word for word in words if word)
+        self._fingerprint: Optional[str] = None
+
+    @classmethod
+    def from_file(cls, path: str, encoding: str = 'utf-8') -> 'StopwordIndex':
+        """
+        从停用词文件构建索引，文件每行一个停用词
+
+        Args:
+            path: 停用词文件路径
+            encoding: 文件编码
+
+        Returns:
+            StopwordIndex: 停用词索引
+
+        Raises:
+            FileNotFoundError: 文件不存在
+        """
+        with open(path, 'r', encoding=encoding) as f:
+            return cls(line.strip() for line in f)
+
+    @classmethod
+    def coerce(cls, stopwords: Optional[Union['StopwordIndex', Iterable[str]]]) -> 'StopwordIndex':
+        """
+        将停用词列表或None转换为停用词索引，已经是索引时直接返回
+
+        Args:
+            stopwords: 停用词索引、停用词序列或None
+
+        Returns:
+            StopwordIndex: 停用词索引
+        """
+        if isinstance(stopwords, cls):
+            return stopwords
+        return cls(stopwords or ())
+
+    @property
+    def words(self) -> frozenset:
+        """停用词集合"""
+        return self._words
+
+    @property
+    def fingerprint(self) -> str:
+        """停用词内容的摘要，可用于缓存键"""
+        if self._fingerprint is None:
+            text = "\n".join(sorted(self._words))
+            self._fingerprint = hashlib.sha1(text.encode('utf-8')).hexdigest()
+        return self._fingerprint
+
+    def __contains__(self, word: object) -> bool:
+        return word in self._words
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._words)
+
+    def filter(self, tokens: Iterable[str]) -> List[str]:
+        """
+        过滤一个文档的分词结果，同时去掉空白词
+
+        Args:
+            tokens: 分词结果
+
+        Returns:
+            List[str]: 过滤后的分词结果
+        """
+        words = self._words
+        return [token for token in tokens if token not in words and token.strip()]
+
+    def filter_batch(self, documents: Iterable[Iterable[str]]) -> List[List[str]]:
+        """
+        批量过滤多个文档的分词结果
+
+        Args:
+            documents: 每个元素为一个文档的分词结果
+
+        Returns:
+            List[List[str]]: 过滤后的分词结果
+        """
+        words = self._words
+        return [[token for token in tokens if token not in words and token.strip()]
+                for tokens in documents]
+
+    def to_list(self) -> List[str]:
+        """
+        转换为排序后的停用词列表，用于需要list类型参数的接口（如sklearn向量化器）
+
+        Returns:
+            List[str]: 停用词列表
+        """
+        return sorted(self._words)
@@ -0,0 +1,184 @@
+"""
+分词结果缓存模块
+
+提供基于SQLite的持久化分词缓存，按文档内容和分词配置的哈希值存储分词结果。
+数据和预处理配置未变化时重复运行可直接复用缓存，数据集增量增长时只需对新增文档分词。
+"""
+import os
+import sqlite3
+import hashlib
+import time
+from typing import List, Optional, Iterable, Tuple, Dict, Any
+
+from src.utils.logger import logger
+
+
+class TokenCache:
+    """分词结果缓存
+
+    以 sha1(分词配置摘要 + 原始文本) 作为键，在SQLite数据库中保存每个文档的分词结果。
+    记录每个条目的最近访问时间，条目数超过上限时按最近最少使用顺序淘汰到上限的90%。
+    条目数在内存中计数，只在计数超过上限时才用COUNT(*)重新统计，写入时不扫描整张表。
+    """
+
+    # SQLite单条语句中参数数量的安全上限
+    _BATCH_SIZE = 500
+
+    # 淘汰后保留的条目数占上限的比例，留出余量，避免达到上限后每次写入都触发淘汰
+    _EVICT_TO = 0.9
+
+    def __init__(self, path: str, settings: Dict[str, Any], max_entries: int = 1000000) -> None:
+        """
+        初始化分词缓存
+
+        Args:
+            path: SQLite数据库文件路径
+            settings: 影响分词结果的配置（分词器、停用词指纹、分隔符等）
+            max_entries: 缓存条目数上限，小于等于0表示不限制
+        """
+        self.path = path
+        self.max_entries = int(max_entries)
+        self.settings_digest = self.settings_digest_of(settings)
+        self.hits = 0
+        self.misses = 0
+
+        cache_dir = os.path.dirname(path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tokens ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tokens_access ON tokens(last_access)")
+        self._conn.commit()
+
+        # 条目数的上界估计：写入时按写入行数累加（覆盖已有键时偏大），淘汰时重新统计
+        self._count = len(self)
+        logger.info(f"初始化分词缓存: {path}, 已有条目={self._count}, 上限={self.max_entries}")
+
+    @staticmethod
+    def settings_digest_of(settings: Dict[str, Any]) -> str:
+        """
+        计算分词配置摘要
+
+        Args:
+            settings: 影响分词结果的配置
+
+        Returns:
+            str: 配置摘要
+        """
+        canonical = repr(sorted((str(k), repr(v)) for k, v in settings.items()))
+        return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+    def make_key(self, text: str) -> str:
+        """
+        计算文档的缓存键
+
+        Args:
+            text: 原始文本
+
+        Returns:
+            str: 缓存键
+        """
+        digest = hashlib.sha1(self.settings_digest.encode('utf-8'))
+        digest.update(text.encode('utf-8', errors='surrogatepass'))
+        return digest.hexdigest()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM tokens").fetchone()[0]
+
+    def get_many(self, texts: List[str]) -> List[Optional[str]]:
+        """
+        批量查询分词结果
+
+        Args:
+            texts: 原始文本列表
+
+        Returns:
+            List[Optional[str]]: 与输入顺序对应的分词结果，未命中的位置为None
+        """
+        keys = [self.make_key(text) for text in texts]
+        found: Dict[str, str] = {}
+        unique_keys = list(dict.fromkeys(keys))
+
+        for start in range(0, len(unique_keys), self._BATCH_SIZE):
+            batch = unique_keys[start:start + self._BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT key, value FROM tokens WHERE key IN ({placeholders})", batch
+            ).fetchall()
+            found.update(rows)
+
+        # 更新命中条目的访问时间，用于LRU淘汰
+        if found:
+            now = time.time()
+            self._conn.executemany(
+                "UPDATE tokens SET last_access = ? WHERE key = ?",
+                [(now, key) for key in found]
+            )
+            self._conn.commit()
+
+        results = [found.get(key) for key in keys]
+        hit_count = sum(1 for value in results if value is not None)
+        self.hits += hit_count
+        self.misses += len(results) - hit_count
+        return results
+
+    def put_many(self, items: Iterable[Tuple[str, str]]) -> None:
+        """
+        批量写入分词结果，写入后按需淘汰旧条目
+
+        Args:
+            items: (原始文本, 分词结果) 序列
+        """
+        now = time.time()
+        rows = [(self.make_key(text), value, now) for text, value in items]
+        if not rows:
+            return
+
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO tokens (key, value, last_access) VALUES (?, ?, ?)", rows
+        )
+        self._conn.commit()
+        self._count += len(rows)
+        if 0 < self.max_entries < self._count:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        条目数超过上限时，按最近最少使用顺序淘汰到上限的90%
+
+        Returns:
+            int: 淘汰的条目数
+        """
+        if self.max_entries <= 0:
+            return 0
+
+        self._count = len(self)
+        if self._count <= self.max_entries:
+            return 0
+        overflow = self._count - int(self.max_entries * self._EVICT_TO)
+
+        self._conn.execute(
+            "DELETE FROM tokens WHERE key IN "
+            "(SELECT key FROM tokens ORDER BY last_access ASC LIMIT ?)",
+            (overflow,)
+        )
+        self._conn.commit()
+        self._count -= overflow
+        logger.info(f"分词缓存淘汰 {overflow} 个最久未使用的条目")
+        return overflow
+
+    def log_stats(self) -> None:
+        """在日志中输出缓存命中统计"""
+        total = self.hits + self.misses
+        hit_rate = self.hits / total if total else 0.0
+        logger.info(f"分词缓存统计: 命中={self.hits}, 未命中={self.misses}, 命中率={hit_rate:.2%}")
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        self._conn.close()
@@ -6,50 +6,23 @@
 """
 import os
 import json
+import time
 from typing import Dict, List, Tuple, Any, Optional, Union, Callable
 
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-from matplotlib import rcParams
 from sklearn.metrics import (
-    classification_report, confusion_matrix, roc_curve, auc, 
+    classification_report, confusion_matrix, 
     accuracy_score, precision_score, recall_score, f1_score
 )
 
+from src.evaluation.reporting import (
+    plot_roc_curve, plot_confusion_matrix, render_in_background
+)
+from src.evaluation.scoring import binary_curves, bootstrap_confidence_intervals
 from src.utils.config_loader import CONFIG
 from src.utils.logger import logger
 
 
-def set_chinese_font():
-    """
-    设置matplotlib中文字体支持
-    
-    尝试多种常见中文字体，解决中文显示为方块的问题
-    """
-    # 中文字体列表，按优先级排序
-    chinese_fonts = ['SimHei', 'Microsoft YaHei', 'SimSun', 'FangSong', 'KaiTi', 
-                     'STSong', 'STZhongsong', 'STFangsong', 'STKaiti', 'STHeiti', 
-                     'STXihei', 'STLiti', 'STHupo', 'STCaiyun', 'STXinwei']
-    font_found = False
-    
-    for font in chinese_fonts:
-        try:
-            fm.findfont(font, fallback_to_default=False)
-            plt.rcParams['font.sans-serif'] = [font]
-            plt.rcParams['axes.unicode_minus'] = False  # 解决负号显示问题
-            logger.info(f"使用中文字体: {font}")
-            font_found = True
-            break
-        except:
-            continue
-    
-    if not font_found:
-        # 如果找不到中文字体，使用警告提示
-        plt.rcParams['font.sans-serif'] = ['DejaVu Sans']
-        logger.warning("未找到支持中文的字体，图表中的中文可能显示为方块")
-
-
 def convert_report_to_dict(report: Dict) -> Dict:
     """
     将分类报告转换为可JSON序列化的字典
@@ -105,20 +78,110 @@ def save_evaluation_results(results: Dict[str, Any]) -> None:
     logger.info(f"评估结果已保存到 {output_path}")
 
 
+def compute_metrics(y_true: np.ndarray, y_pred: np.ndarray,
+                    y_score: Optional[np.ndarray] = None) -> Dict[str, float]:
+    """
+    计算分类指标，不绘图也不写文件
+    
+    用于多模型对比等只需要数值结果的场景，可以在工作进程中调用。
+    
+    Args:
+        y_true: 真实标签
+        y_pred: 预测标签
+        y_score: 虚假新闻概率，提供时用于计算AUC，否则使用预测标签
+        
+    Returns:
+        Dict[str, float]: 准确率、精确率、召回率、F1分数和AUC
+    """
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    try:
+        auc_value = binary_curves(y_true, y_pred if y_score is None else y_score)['auc']
+    except Exception as e:
+        logger.warning(f"计算ROC曲线失败: {str(e)}，使用默认值")
+        auc_value = 0.5
+    
+    return {
+        'accuracy': float(accuracy_score(y_true, y_pred)),
+        'precision': float(precision_score(y_true, y_pred, average='weighted')),
+        'recall': float(recall_score(y_true, y_pred, average='weighted')),
+        'f1': float(f1_score(y_true, y_pred, average='weighted')),
+        'auc': float(auc_value),
+    }
+
+
+def save_comparison_report(rows: List[Dict[str, Any]], output_path: str = 'results/model_comparison.json') -> None:
+    """
+    保存多模型对比报告
+    
+    Args:
+        rows: 每个模型一行，包含模型名、训练耗时和各项指标
+        output_path: 输出路径
+    """
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(rows, f, ensure_ascii=False, indent=4)
+    
+    logger.info(f"模型对比报告已保存到 {output_path}")
+
+
+def format_classification_report(report: Dict[str, Any], digits: int = 4) -> str:
+    """
+    把classification_report(output_dict=True)的结果格式化为文本表格
+    
+    与classification_report的文本输出格式一致，避免为了日志再计算一次分类报告。
+    
+    Args:
+        report: 字典形式的分类报告
+        digits: 小数位数
+        
+    Returns:
+        str: 文本形式的分类报告
+    """
+    headers = ['precision', 'recall', 'f1-score', 'support']
+    names = [name for name in report if name != 'accuracy']
+    width = max(len(str(name)) for name in names + ['weighted avg'])
+    lines = [f"{'':>{width}} " + ''.join(f"{h:>10}" for h in headers), '']
+    
+    def row(name: str, values: Dict[str, float]) -> str:
+        cells = ''.join(f"{values[h]:>10.{digits}f}" for h in headers[:3])
+        return f"{name:>{width}} {cells}{int(values['support']):>10d}"
+    
+    for name in names:
+        if name in ('macro avg', 'weighted avg'):
+            continue
+        lines.append(row(name, report[name]))
+    lines.append('')
+    if 'accuracy' in report:
+        support = int(report['weighted avg']['support'])
+        lines.append(f"{'accuracy':>{width}} {'':>20}{report['accuracy']:>10.{digits}f}{support:>10d}")
+    for name in ('macro avg', 'weighted avg'):
+        if name in report:
+            lines.append(row(name, report[name]))
+    return '\n'.join(lines)
+
+
 def evaluate_model(
     y_true: np.ndarray, 
     y_pred: np.ndarray, 
-    progress_callback: Optional[Callable] = None
+    progress_callback: Optional[Callable] = None,
+    y_score: Optional[np.ndarray] = None,
+    plot: Optional[bool] = None
 ) -> Dict[str, Any]:
     """
     评估模型性能
     
-    计算各种性能指标，包括准确率、精确率、召回率、F1分数、混淆矩阵和ROC曲线等。
+    计算各种性能指标，包括准确率、精确率、召回率、F1分数、混淆矩阵、ROC/PR曲线和阈值扫描等。
+    提供y_score（predict_proba中虚假新闻一列）时曲线和AUC基于概率计算，否则退化为基于预测标签。
+    按配置evaluation.bootstrap计算各指标的自助法置信区间。
+    图像默认交给后台线程渲染（evaluation.plot_async），需要等待图像写完时调用wait_for_plots。
     
     Args:
         y_true: 真实标签
         y_pred: 预测标签
         progress_callback: 进度回调函数
+        y_score: 虚假新闻概率
+        plot: 是否绘制ROC曲线和混淆矩阵，为None时使用配置evaluation.plot；为False时不导入matplotlib
         
     Returns:
         Dict[str, Any]: 包含各种评估指标的字典，包含以下键:
@@ -132,6 +195,12 @@ def evaluate_model(
             - tpr: ROC曲线的真阳性率
             - thresholds: ROC曲线的阈值
             - auc: AUC值
+            - pr_precision: PR曲线的精确率
+            - pr_recall: PR曲线的召回率
+            - average_precision: 平均精确率
+            - threshold_sweep: 各阈值下的准确率、精确率、召回率和F1
+            - best_threshold: F1最高的阈值
+            - confidence_intervals: 各指标的置信区间，未启用时为空字典
     """
     if progress_callback:
         progress_callback("评估模型")
@@ -143,6 +212,8 @@ def evaluate_model(
         y_true = np.array(y_true)
     if not isinstance(y_pred, np.ndarray):
         y_pred = np.array(y_pred)
+    if y_score is not None:
+        y_score = np.asarray(y_score, dtype=np.float64)
     
     # 计算基础性能指标
     accuracy = accuracy_score(y_true, y_pred)
@@ -157,43 +228,79 @@ def evaluate_model(
     
     # 生成分类报告
     report = classification_report(y_true, y_pred, output_dict=True)
-    logger.info(f"分类报告:\n{classification_report(y_true, y_pred)}")
+    logger.info(f"分类报告:\n{format_classification_report(report)}")
     
     # 计算混淆矩阵
     conf_matrix = confusion_matrix(y_true, y_pred)
     logger.info(f"混淆矩阵:\n{conf_matrix}")
     
-    # 计算ROC曲线和AUC值
+    # 一次排序计算ROC/PR曲线、AUC和阈值扫描
+    if y_score is None:
+        logger.warning("未提供预测概率，ROC曲线和AUC基于预测标签计算")
     try:
-        fpr, tpr, thresholds = roc_curve(y_true, y_pred, pos_label=1)
-        auc_value = auc(fpr, tpr)
-        logger.info(f"AUC: {auc_value:.4f}")
+        curves = binary_curves(y_true, y_pred if y_score is None else y_score)
+        fpr, tpr, thresholds = curves['fpr'], curves['tpr'], curves['roc_thresholds']
+        auc_value = curves['auc']
+        logger.info(f"AUC: {auc_value:.4f}, 平均精确率: {curves['average_precision']:.4f}")
+        if y_score is not None:
+            logger.info(f"F1最高的阈值: {curves['best_f1_threshold']:.4f}, "
+                        f"约登指数最高的阈值: {curves['best_youden_threshold']:.4f}")
     except Exception as e:
         logger.warning(f"计算ROC曲线失败: {str(e)}，使用默认值")
         fpr, tpr, thresholds = np.array([0, 1]), np.array([0, 1]), np.array([1, 0])
         auc_value = 0.5
-    
-    # 绘制ROC曲线
-    if CONFIG['evaluation'].get('plot_roc', True):
-        plot_roc_curve(fpr, tpr, auc_value)
-    
-    # 绘制混淆矩阵
-    if CONFIG['evaluation'].get('plot_confusion_matrix', True):
-        plot_confusion_matrix(conf_matrix)
+        curves = None
+    
+    # 自助法置信区间
+    intervals = {}
+    bootstrap_config = CONFIG['evaluation'].get('bootstrap', {}) or {}
+    if bootstrap_config.get('enabled', True) and y_true.size > 0:
+        start = time.perf_counter()
+        confidence = bootstrap_config.get('confidence', 0.95)
+        n_resamples = bootstrap_config.get('n_resamples', 1000)
+        intervals = bootstrap_confidence_intervals(
+            y_true, y_pred, y_score=y_score if curves is not None else None,
+            n_resamples=n_resamples, confidence=confidence, seed=bootstrap_config.get('seed', 42)
+        )
+        logger.info(f"自助法置信区间（{n_resamples}次重采样, 置信水平{confidence:.0%}, "
+                    f"用时{(time.perf_counter() - start) * 1000:.0f}ms）:")
+        for name, interval in intervals.items():
+            logger.info(f"  {name}: [{interval['lower']:.4f}, {interval['upper']:.4f}]")
+    
+    # 绘制ROC曲线和混淆矩阵
+    if plot is None:
+        plot = CONFIG['evaluation'].get('plot', True)
+    if plot:
+        plot_jobs = []
+        if CONFIG['evaluation'].get('plot_roc', True):
+            plot_jobs.append((plot_roc_curve, (fpr, tpr, auc_value)))
+        if CONFIG['evaluation'].get('plot_confusion_matrix', True):
+            plot_jobs.append((plot_confusion_matrix, (conf_matrix,)))
+        for plot_func, plot_args in plot_jobs:
+            if CONFIG['evaluation'].get('plot_async', True):
+                render_in_background(plot_func, *plot_args)
+            else:
+                plot_func(*plot_args)
     
     if progress_callback:
         progress_callback(20)
     
     # 保存评估结果到文件
     if CONFIG['evaluation'].get('save_results', True):
-        save_evaluation_results({
+        saved = {
             'accuracy': float(accuracy),
             'precision': float(precision),
             'recall': float(recall),
             'f1': float(f1),
             'auc': float(auc_value),
-            'classification_report': convert_report_to_dict(report)
-        })
+            'classification_report': convert_report_to_dict(report),
+            'confidence_intervals': intervals
+        }
+        if curves is not None and y_score is not None:
+            saved['average_precision'] = curves['average_precision']
+            saved['best_f1_threshold'] = curves['best_f1_threshold']
+            saved['best_youden_threshold'] = curves['best_youden_threshold']
+        save_evaluation_results(saved)
     
     # 返回评估结果
     results = {
@@ -206,89 +313,14 @@ def evaluate_model(
         'fpr': fpr,
         'tpr': tpr,
         'thresholds': thresholds,
-        'auc': auc_value
+        'auc': auc_value,
+        'pr_precision': curves['precision'] if curves else None,
+        'pr_recall': curves['recall'] if curves else None,
+        'average_precision': curves['average_precision'] if curves else None,
+        'threshold_sweep': curves['threshold_sweep'] if curves else None,
+        'best_threshold': curves['best_f1_threshold'] if curves else None,
+        'confidence_intervals': intervals
     }
     
     logger.info("模型评估完成")
     return results
-
-
-def plot_roc_curve(fpr: np.ndarray, tpr: np.ndarray, auc_value: float) -> None:
-    """
-    绘制ROC曲线
-    
-    绘制ROC曲线并保存为图像文件。
-    
-    Args:
-        fpr: 假阳性率
-        tpr: 真阳性率
-        auc_value: AUC值
-    """
-    # 设置中文字体
-    set_chinese_font()
-    
-    plt.figure(figsize=(10, 8))
-    plt.title('ROC曲线 (AUC = {:.4f})'.format(auc_value))
-    plt.xlabel('假阳性率')
-    plt.ylabel('真阳性率')
-    plt.plot(fpr, tpr, color='b', lw=2, label='ROC曲线')
-    plt.plot([0, 1], [0, 1], color='r', linestyle='--', label='随机猜测')
-    plt.xlim([0.0, 1.0])
-    plt.ylim([0.0, 1.05])
-    plt.legend(loc='lower right')
-    plt.grid(True)
-    
-    # 创建结果目录
-    os.makedirs('results', exist_ok=True)
-    
-    # 保存图像
-    plt.savefig('results/roc_curve.png', dpi=300, bbox_inches='tight')
-    logger.info("ROC曲线已保存到 results/roc_curve.png")
-    
-    # 关闭图像
-    plt.close()
-    
-
-def plot_confusion_matrix(conf_matrix: np.ndarray) -> None:
-    """
-    绘制混淆矩阵
-    
-    将混淆矩阵可视化并保存为图像文件。
-    
-    Args:
-        conf_matrix: 混淆矩阵数组
-    """
-    # 设置中文字体
-    set_chinese_font()
-    
-    plt.figure(figsize=(8, 6))
-    plt.imshow(conf_matrix, interpolation='nearest', cmap=plt.cm.Blues)
-    plt.title('混淆矩阵')
-    plt.colorbar()
-    
-    classes = ['真实', '虚假']
-    tick_marks = np.arange(len(classes))
-    plt.xticks(tick_marks, classes, rotation=45)
-    plt.yticks(tick_marks, classes)
-    
-    # 在每个单元格中显示数值
-    thresh = conf_matrix.max() / 2.
-    for i in range(conf_matrix.shape[0]):
-        for j in range(conf_matrix.shape[1]):
-            plt.text(j, i, format(conf_matrix[i, j], 'd'),
-                    horizontalalignment="center",
-                    color="white" if conf_matrix[i, j] > thresh else "black")
-    
-    plt.tight_layout()
-    plt.ylabel('真实标签')
-    plt.xlabel('预测标签')
-    
-    # 创建结果目录
-    os.makedirs('results', exist_ok=True)
-    
-    # 保存图像
-    plt.savefig('results/confusion_matrix.png', dpi=300, bbox_inches='tight')
-    logger.info("混淆矩阵已保存到 results/confusion_matrix.png")
-    
-    # 关闭图像
-    plt.close() 
\ No newline at end of file
@@ -0,0 +1,207 @@
+"""
+评估报告绘图模块
+
+负责把评估结果渲染为图像文件:
+    - matplotlib在第一次绘图时才导入，并固定使用无界面的Agg后端，不绘图的运行不承担导入开销
+    - 中文字体只探测一次，结果在进程内缓存
+    - 使用面向对象的Figure/FigureCanvasAgg接口，不依赖pyplot的全局状态，可以在后台线程中渲染
+    - render_in_background把绘图任务交给后台线程，wait_for_plots等待全部图像写完
+"""
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple
+
+import numpy as np
+
+from src.utils.logger import logger
+
+
+# 中文字体列表，按优先级排序
+CHINESE_FONTS = ['SimHei', 'Microsoft YaHei', 'SimSun', 'FangSong', 'KaiTi',
+                 'STSong', 'STZhongsong', 'STFangsong', 'STKaiti', 'STHeiti',
+                 'STXihei', 'STLiti', 'STHupo', 'STCaiyun', 'STXinwei']
+
+# 后台绘图线程及尚未完成的任务
+_executor: Optional[ThreadPoolExecutor] = None
+_pending: List[Future] = []
+_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _load_matplotlib() -> Any:
+    """延迟导入matplotlib，并切换到Agg后端"""
+    import matplotlib
+    matplotlib.use('Agg')
+    return matplotlib
+
+
+@lru_cache(maxsize=1)
+def resolve_chinese_font() -> Optional[str]:
+    """
+    查找第一个可用的中文字体，结果在进程内缓存
+
+    Returns:
+        Optional[str]: 字体名称，没有可用的中文字体时为None
+    """
+    _load_matplotlib()
+    from matplotlib import font_manager
+
+    for font in CHINESE_FONTS:
+        try:
+            font_manager.findfont(font, fallback_to_default=False)
+        except ValueError:
+            continue
+        logger.info(f"使用中文字体: {font}")
+        return font
+
+    logger.warning("未找到支持中文的字体，图表中的中文可能显示为方块")
+    return None
+
+
+def set_chinese_font() -> None:
+    """
+    设置matplotlib中文字体支持
+
+    尝试多种常见中文字体，解决中文显示为方块的问题；字体只在第一次调用时探测。
+    """
+    matplotlib = _load_matplotlib()
+    font = resolve_chinese_font()
+    if font:
+        matplotlib.rcParams['font.sans-serif'] = [font]
+        matplotlib.rcParams['axes.unicode_minus'] = False  # 解决负号显示问题
+    else:
+        matplotlib.rcParams['font.sans-serif'] = ['DejaVu Sans']
+
+
+def _new_figure(figsize: Tuple[float, float]) -> Any:
+    """创建一个绑定Agg画布的独立Figure，不注册到pyplot"""
+    set_chinese_font()
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    figure = Figure(figsize=figsize)
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def _save_figure(figure: Any, output_path: str) -> None:
+    """保存图像，必要时创建目录"""
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    figure.savefig(output_path, dpi=300, bbox_inches='tight')
+
+
+def plot_roc_curve(fpr: np.ndarray, tpr: np.ndarray, auc_value: float,
+                   output_path: str = 'results/roc_curve.png') -> None:
+    """
+    绘制ROC曲线
+
+    绘制ROC曲线并保存为图像文件。
+
+    Args:
+        fpr: 假阳性率
+        tpr: 真阳性率
+        auc_value: AUC值
+        output_path: 输出路径
+    """
+    figure = _new_figure((10, 8))
+    ax = figure.add_subplot()
+    ax.set_title('ROC曲线 (AUC = {:.4f})'.format(auc_value))
+    ax.set_xlabel('假阳性率')
+    ax.set_ylabel('真阳性率')
+    ax.plot(fpr, tpr, color='b', lw=2, label='ROC曲线')
+    ax.plot([0, 1], [0, 1], color='r', linestyle='--', label='随机猜测')
+    ax.set_xlim([0.0, 1.0])
+    ax.set_ylim([0.0, 1.05])
+    ax.legend(loc='lower right')
+    ax.grid(True)
+
+    _save_figure(figure, output_path)
+    logger.info(f"ROC曲线已保存到 {output_path}")
+
+
+def plot_confusion_matrix(conf_matrix: np.ndarray, output_path: str = 'results/confusion_matrix.png') -> None:
+    """
+    绘制混淆矩阵
+
+    将混淆矩阵可视化并保存为图像文件。
+
+    Args:
+        conf_matrix: 混淆矩阵数组
+        output_path: 输出路径
+    """
+    figure = _new_figure((8, 6))
+    ax = figure.add_subplot()
+    image = ax.imshow(conf_matrix, interpolation='nearest', cmap='Blues')
+    ax.set_title('混淆矩阵')
+    figure.colorbar(image, ax=ax)
+
+    classes = ['真实', '虚假']
+    tick_marks = np.arange(len(classes))
+    ax.set_xticks(tick_marks)
+    ax.set_xticklabels(classes, rotation=45)
+    ax.set_yticks(tick_marks)
+    ax.set_yticklabels(classes)
+
+    # 在每个单元格中显示数值
+    thresh = conf_matrix.max() / 2.
+    for i in range(conf_matrix.shape[0]):
+        for j in range(conf_matrix.shape[1]):
+            ax.text(j, i, format(conf_matrix[i, j], 'd'),
+                    horizontalalignment="center",
+                    color="white" if conf_matrix[i, j] > thresh else "black")
+
+    ax.set_ylabel('真实标签')
+    ax.set_xlabel('预测标签')
+    figure.tight_layout()
+
+    _save_figure(figure, output_path)
+    logger.info(f"混淆矩阵已保存到 {output_path}")
+
+
+def render_in_background(plot_func: Callable[..., None], *args: Any, **kwargs: Any) -> Future:
+    """
+    在后台线程中执行绘图函数
+
+    所有绘图任务由同一个后台线程依次执行，调用方不需要等待图像写完即可继续。
+
+    Args:
+        plot_func: 绘图函数，例如plot_roc_curve
+        *args: 绘图函数的位置参数
+        **kwargs: 绘图函数的关键字参数
+
+    Returns:
+        Future: 绘图任务
+    """
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='plot')
+        future = _executor.submit(plot_func, *args, **kwargs)
+        _pending.append(future)
+    return future
+
+
+def wait_for_plots(timeout: Optional[float] = None) -> int:
+    """
+    等待全部后台绘图任务完成，失败的任务只记录日志
+
+    Args:
+        timeout: 每个任务的最长等待秒数，为None时一直等待
+
+    Returns:
+        int: 成功完成的任务数
+    """
+    with _lock:
+        futures = list(_pending)
+        _pending.clear()
+
+    completed = 0
+    for future in futures:
+        try:
+            future.result(timeout=timeout)
+            completed += 1
+        except Exception as e:
+            logger.warning(f"绘图失败: {str(e)}")
+    return completed
@@ -0,0 +1,217 @@
+"""
+向量化评估指标模块
+
+基于概率得分的一次排序同时得到ROC曲线、PR曲线、AUC和阈值扫描结果，
+并通过按批次生成的重采样权重矩阵计算所有指标的自助法（bootstrap）置信区间，
+全部计算都是NumPy矩阵运算，不需要逐个重采样的Python循环。
+"""
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+
+# 每批重采样权重矩阵的元素数上限，控制峰值内存
+_BOOTSTRAP_BLOCK_ELEMENTS = 4_000_000
+
+
+def _sorted_thresholds(y_true: np.ndarray, y_score: np.ndarray):
+    """
+    按得分降序排序，返回每个不同阈值处的累计真阳性数和假阳性数
+
+    Args:
+        y_true: 0/1真实标签
+        y_score: 正类得分
+
+    Returns:
+        Tuple: 排序下标、排序后的标签、各不同阈值在排序序列中的最后位置、阈值
+    """
+    order = np.argsort(-y_score, kind='mergesort')
+    score_sorted = y_score[order]
+    y_sorted = y_true[order]
+    # 得分相同的样本属于同一个阈值，只在每组的最后一个位置取累计值
+    last = np.r_[np.flatnonzero(np.diff(score_sorted)), y_sorted.size - 1]
+    return order, y_sorted, last, score_sorted[last]
+
+
+def binary_curves(y_true: np.ndarray, y_score: np.ndarray) -> Dict[str, Any]:
+    """
+    一次排序计算ROC曲线、PR曲线、AUC、平均精确率和阈值扫描
+
+    阈值扫描给出每个阈值（预测为正类当且仅当得分>=阈值）下的准确率、精确率、召回率和F1，
+    以及F1最高和约登指数（TPR - FPR）最高的阈值。
+
+    Args:
+        y_true: 0/1真实标签，1为虚假新闻
+        y_score: 虚假新闻的概率或得分
+
+    Returns:
+        Dict[str, Any]: fpr、tpr、roc_thresholds、precision、recall、auc、average_precision、
+            threshold_sweep（thresholds/accuracy/precision/recall/f1）、best_f1_threshold、best_youden_threshold
+
+    Raises:
+        ValueError: 标签中只有一个类别
+    """
+    y_true = (np.asarray(y_true) == 1).astype(np.int64)
+    y_score = np.asarray(y_score, dtype=np.float64)
+    n_pos = int(y_true.sum())
+    n_neg = y_true.size - n_pos
+    if n_pos == 0 or n_neg == 0:
+        raise ValueError("计算ROC曲线需要同时包含正类和负类样本")
+
+    _, y_sorted, last, thresholds = _sorted_thresholds(y_true, y_score)
+    tps = np.cumsum(y_sorted)[last]
+    fps = (last + 1) - tps
+
+    fpr = np.r_[0.0, fps / n_neg]
+    tpr = np.r_[0.0, tps / n_pos]
+    auc_value = float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2))
+
+    predicted_pos = tps + fps
+    precision = tps / predicted_pos
+    recall = tps / n_pos
+    # 平均精确率：召回率每次增加时的精确率加权和
+    average_precision = float(np.sum(np.diff(np.r_[0.0, recall]) * precision))
+
+    accuracy = (tps + (n_neg - fps)) / y_true.size
+    f1 = np.divide(2 * tps, predicted_pos + n_pos, out=np.zeros(tps.size), where=(predicted_pos + n_pos) > 0)
+    youden = tps / n_pos - fps / n_neg
+
+    return {
+        'fpr': fpr,
+        'tpr': tpr,
+        'roc_thresholds': np.r_[np.inf, thresholds],
+        'precision': precision,
+        'recall': recall,
+        'auc': auc_value,
+        'average_precision': average_precision,
+        'threshold_sweep': {
+            'thresholds': thresholds,
+            'accuracy': accuracy,
+            'precision': precision,
+            'recall': recall,
+            'f1': f1,
+        },
+        'best_f1_threshold': float(thresholds[np.argmax(f1)]),
+        'best_youden_threshold': float(thresholds[np.argmax(youden)]),
+    }
+
+
+def _weighted_label_metrics(weights: np.ndarray, y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    按样本权重批量计算基于预测标签的指标
+
+    精确率、召回率和F1与evaluate_model一致，按类别支持度加权平均（average='weighted'）。
+
+    Args:
+        weights: (批大小, 样本数) 权重矩阵，每行是一次重采样中各样本被抽中的次数
+        y_true: 0/1真实标签
+        y_pred: 0/1预测标签
+
+    Returns:
+        Dict[str, np.ndarray]: 每个指标一个长度为批大小的数组
+    """
+    tp = weights @ ((y_true == 1) & (y_pred == 1)).astype(np.float64)
+    fp = weights @ ((y_true == 0) & (y_pred == 1)).astype(np.float64)
+    fn = weights @ ((y_true == 1) & (y_pred == 0)).astype(np.float64)
+    tn = weights @ ((y_true == 0) & (y_pred == 0)).astype(np.float64)
+    total = tp + fp + fn + tn
+
+    def safe_divide(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        return np.divide(a, b, out=np.zeros_like(a), where=b > 0)
+
+    # 正类（1）和负类（0）各自的指标，负类的TP即正类的TN
+    per_class = []
+    for c_tp, c_fp, c_fn in ((tp, fp, fn), (tn, fn, fp)):
+        precision = safe_divide(c_tp, c_tp + c_fp)
+        recall = safe_divide(c_tp, c_tp + c_fn)
+        f1 = safe_divide(2 * precision * recall, precision + recall)
+        per_class.append((precision, recall, f1, c_tp + c_fn))
+
+    def weighted(index: int) -> np.ndarray:
+        return safe_divide(sum(m[index] * m[3] for m in per_class), total)
+
+    return {
+        'accuracy': safe_divide(tp + tn, total),
+        'precision': weighted(0),
+        'recall': weighted(1),
+        'f1': weighted(2),
+    }
+
+
+def _weighted_auc(weights_sorted: np.ndarray, y_sorted: np.ndarray, last: np.ndarray) -> np.ndarray:
+    """
+    按样本权重批量计算AUC
+
+    Args:
+        weights_sorted: 按得分降序排列的 (批大小, 样本数) 权重矩阵
+        y_sorted: 按得分降序排列的0/1标签
+        last: 各不同阈值在排序序列中的最后位置
+
+    Returns:
+        np.ndarray: 每次重采样的AUC，某次重采样只含一个类别时为nan
+    """
+    tps = np.cumsum(weights_sorted * y_sorted, axis=1)[:, last]
+    fps = np.cumsum(weights_sorted * (1 - y_sorted), axis=1)[:, last]
+    n_pos = tps[:, -1:]
+    n_neg = fps[:, -1:]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tpr = np.hstack([np.zeros_like(n_pos), tps / n_pos])
+        fpr = np.hstack([np.zeros_like(n_neg), fps / n_neg])
+    return np.sum(np.diff(fpr, axis=1) * (tpr[:, 1:] + tpr[:, :-1]) / 2, axis=1)
+
+
+def bootstrap_confidence_intervals(y_true: np.ndarray, y_pred: np.ndarray,
+                                   y_score: Optional[np.ndarray] = None, n_resamples: int = 1000,
+                                   confidence: float = 0.95, seed: Optional[int] = 42) -> Dict[str, Dict[str, float]]:
+    """
+    计算各指标的自助法百分位置信区间
+
+    每次重采样表示为各样本被抽中次数构成的权重向量，一批重采样组成一个权重矩阵，
+    所有指标都由权重矩阵与标签指示向量的矩阵乘法或按行累加得到。
+
+    Args:
+        y_true: 0/1真实标签
+        y_pred: 0/1预测标签
+        y_score: 虚假新闻概率，提供时同时计算AUC的置信区间
+        n_resamples: 重采样次数
+        confidence: 置信水平
+        seed: 随机种子
+
+    Returns:
+        Dict[str, Dict[str, float]]: 每个指标的 {'lower', 'upper', 'std'}
+    """
+    y_true = (np.asarray(y_true) == 1).astype(np.int64)
+    y_pred = (np.asarray(y_pred) == 1).astype(np.int64)
+    n_samples = y_true.size
+    rng = np.random.default_rng(seed)
+
+    if y_score is not None:
+        order, y_sorted, last, _ = _sorted_thresholds(y_true, np.asarray(y_score, dtype=np.float64))
+
+    batch_size = max(1, min(n_resamples, _BOOTSTRAP_BLOCK_ELEMENTS // max(n_samples, 1)))
+    samples: Dict[str, list] = {}
+    for start in range(0, n_resamples, batch_size):
+        batch = min(batch_size, n_resamples - start)
+        # 每行是一次重采样：n个样本下标落入各样本的次数
+        picks = rng.integers(0, n_samples, size=(batch, n_samples))
+        picks += (np.arange(batch) * n_samples)[:, None]
+        weights = np.bincount(picks.ravel(), minlength=batch * n_samples).reshape(batch, n_samples)
+        weights = weights.astype(np.float64)
+        del picks
+
+        batch_metrics = _weighted_label_metrics(weights, y_true, y_pred)
+        if y_score is not None:
+            batch_metrics['auc'] = _weighted_auc(weights[:, order], y_sorted, last)
+        for name, values in batch_metrics.items():
+            samples.setdefault(name, []).append(values)
+
+    alpha = (1 - confidence) / 2
+    intervals = {}
+    for name, chunks in samples.items():
+        values = np.concatenate(chunks)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            continue
+        lower, upper = np.quantile(values, [alpha, 1 - alpha])
+        intervals[name] = {'lower': float(lower), 'upper': float(upper), 'std': float(values.std())}
+    return intervals
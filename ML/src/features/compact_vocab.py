@@ -0,0 +1,166 @@
+"""
+紧凑词汇表模块
+
+sklearn向量化器用Python字典保存词汇表（每个词一个str对象和一个int对象），拟合后还保留
+被剪枝的全部n-gram（stop_words_），两者在内存和pickle中都远大于词汇本身。
+紧凑模式把词汇表保存为按字节序排列的UTF-8定长字节数组，用二分查找成批地把n-gram映射到列号。
+"""
+import sys
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import scipy.sparse as sp
+
+INT32_MAX = np.iinfo(np.int32).max
+
+
+def container_nbytes(container: Any) -> int:
+    """
+    估算字典或集合及其中字符串和整数对象占用的内存
+
+    Args:
+        container: 词汇表字典或n-gram集合
+
+    Returns:
+        int: 字节数
+    """
+    if container is None:
+        return 0
+    total = sys.getsizeof(container) + sum(sys.getsizeof(key) for key in container)
+    if isinstance(container, dict):
+        total += sum(sys.getsizeof(value) for value in container.values())
+    return total
+
+
+def matrix_nbytes(matrix: Any) -> int:
+    """
+    稀疏矩阵的数据、下标和行指针占用的字节数
+
+    Args:
+        matrix: CSR/CSC矩阵
+
+    Returns:
+        int: 字节数
+    """
+    return matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+
+
+def compact_matrix(matrix: Any) -> sp.csr_matrix:
+    """
+    转换为float32元素、int32下标的CSR矩阵
+
+    Args:
+        matrix: 稀疏特征矩阵
+
+    Returns:
+        sp.csr_matrix: 紧凑的CSR矩阵，非零元素超过int32范围时保留原下标类型
+    """
+    matrix = sp.csr_matrix(matrix).astype(np.float32, copy=False)
+    if matrix.nnz <= INT32_MAX:
+        matrix.indices = matrix.indices.astype(np.int32, copy=False)
+        matrix.indptr = matrix.indptr.astype(np.int32, copy=False)
+    return matrix
+
+
+class CompactVocabulary:
+    """紧凑词汇表
+
+    terms按字节序排列；UTF-8的字节序与Unicode码点顺序一致，因此sklearn按字符串排序生成的词汇表
+    列号就是词在数组中的位置，不需要额外保存列号。
+    """
+
+    def __init__(self, vocabulary: Dict[str, int]) -> None:
+        """
+        由sklearn的vocabulary_构建紧凑词汇表
+
+        Args:
+            vocabulary: n-gram到列号的映射
+        """
+        by_column = sorted(vocabulary, key=vocabulary.__getitem__)
+        terms = np.array([term.encode('utf-8') for term in by_column], dtype=np.bytes_)
+        order = np.argsort(terms, kind='stable')
+        self.terms = terms[order]
+        # 列号与字节序不一致时（如手工指定的词汇表）才保存列号
+        self.columns: Optional[np.ndarray] = None
+        if not np.array_equal(order, np.arange(len(order))):
+            self.columns = order.astype(np.int32)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    @property
+    def nbytes(self) -> int:
+        """词汇表数组占用的字节数"""
+        return self.terms.nbytes + (self.columns.nbytes if self.columns is not None else 0)
+
+    def lookup(self, features: List[str]) -> np.ndarray:
+        """
+        成批查找n-gram的列号
+
+        Args:
+            features: n-gram列表
+
+        Returns:
+            np.ndarray: 列号，不在词汇表中的n-gram为-1
+        """
+        if not features or not len(self.terms):
+            return np.full(len(features), -1, dtype=np.int64)
+        needles = np.array([feature.encode('utf-8') for feature in features], dtype=np.bytes_)
+        positions = np.searchsorted(self.terms, needles)
+        np.minimum(positions, len(self.terms) - 1, out=positions)
+        # 比较完整的字节串，比词汇表最长的词更长的n-gram不会被截断后误判为命中
+        found = self.terms[positions] == needles
+        columns = positions if self.columns is None else self.columns[positions]
+        return np.where(found, columns, -1)
+
+    def count_matrix(self, analyzed: Iterable[List[str]], n_docs: int, dtype: Any = np.float32,
+                     binary: bool = False) -> sp.csr_matrix:
+        """
+        由各文档的n-gram构建词频矩阵
+
+        Args:
+            analyzed: 各文档的n-gram列表
+            n_docs: 文档数
+            dtype: 矩阵元素类型
+            binary: 是否只记录是否出现
+
+        Returns:
+            sp.csr_matrix: 词频矩阵
+        """
+        features: List[str] = []
+        lengths = np.zeros(n_docs, dtype=np.int64)
+        for row, grams in enumerate(analyzed):
+            features.extend(grams)
+            lengths[row] = len(grams)
+
+        columns = self.lookup(features)
+        rows = np.repeat(np.arange(n_docs, dtype=np.int64), lengths)
+        found = columns >= 0
+        matrix = sp.coo_matrix((np.ones(int(found.sum()), dtype=dtype), (rows[found], columns[found])),
+                               shape=(n_docs, len(self.terms))).tocsr()
+        if binary:
+            matrix.data.fill(1)
+        return matrix
+
+    def feature_names(self) -> np.ndarray:
+        """
+        按列号排列的特征名称
+
+        Returns:
+            np.ndarray: 特征名称，与sklearn的get_feature_names_out一致为object数组
+        """
+        terms = self.terms if self.columns is None else self.terms[np.argsort(self.columns)]
+        return np.array([term.decode('utf-8') for term in terms], dtype=object)
+
+    def subset(self, columns: np.ndarray) -> 'CompactVocabulary':
+        """
+        只保留指定列的词汇表，按给定顺序重新编号
+
+        Args:
+            columns: 保留的列号
+
+        Returns:
+            CompactVocabulary: 新的词汇表
+        """
+        names = self.feature_names()
+        return CompactVocabulary({names[column]: i for i, column in enumerate(columns)})
@@ -0,0 +1,323 @@
+"""
+特征矩阵缓存模块
+
+缓存向量化后的训练/测试稀疏矩阵、标签和已拟合的向量化器。
+只更换模型时重复运行可以跳过预处理和向量化。
+
+缓存分两级:
+    条目键: 分词后语料和标签的哈希 + 向量化器类型、停用词和features配置 + sklearn版本，
+            对应缓存目录下的一个条目，保存CSR矩阵的data/indices/indptr分量（.npy，加载时内存映射）
+    来源索引: 数据文件的路径、大小和修改时间 + 分词配置 -> 语料哈希，
+            数据文件和分词配置未变化时不需要读取和分词即可定位条目
+"""
+import os
+import json
+import time
+import hashlib
+import shutil
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import joblib
+import numpy as np
+import sklearn
+from scipy.sparse import csr_matrix, spmatrix
+
+from src.utils.config_loader import CONFIG
+from src.utils.shared_csr import csr_from_components
+from src.utils.logger import logger
+
+
+# 向量化器类型对应的features配置部分
+FEATURE_CONFIG_SECTIONS = {'tfidf': 'tfidf', 'count': 'countvec', 'hashing': 'hashing'}
+
+# 只影响拟合的执行方式、不影响结果的配置项，不参与条目键
+EXECUTION_ONLY_KEYS = frozenset({'n_jobs', 'fit_chunk_size', 'measure_savings', 'latency_sample'})
+
+SOURCES_FILE = 'sources.json'
+META_FILE = 'meta.json'
+VECTORIZER_FILE = 'vectorizer.joblib'
+
+
+def _digest(*parts: Any) -> str:
+    """计算若干部分的SHA-1摘要，各部分按repr规范化"""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(repr(part).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _result_settings(config: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """影响特征结果的配置项，按键排序，去掉只影响执行方式的配置"""
+    return sorted((str(k), repr(v)) for k, v in config.items() if k not in EXECUTION_ONLY_KEYS)
+
+
+class FeatureCache:
+    """特征矩阵缓存
+
+    每个条目是缓存目录下以条目键命名的子目录，包含:
+        x_train.data.npy / x_train.indices.npy / x_train.indptr.npy 及测试集对应文件
+        y_train.npy / y_test.npy
+        vectorizer.joblib: 已拟合的TextVectorizer（含词汇表）
+        meta.json: 矩阵形状、语料哈希和配置
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, enabled: Optional[bool] = None) -> None:
+        """
+        初始化特征矩阵缓存
+
+        Args:
+            cache_dir: 缓存目录，默认使用配置中的features.cache.cache_dir
+            enabled: 是否启用，默认使用配置中的features.cache.enabled
+        """
+        config = CONFIG['features'].get('cache', {}) or {}
+        self.cache_dir = cache_dir or config.get('cache_dir', 'cache/features')
+        self.enabled = config.get('enabled', True) if enabled is None else enabled
+
+    @staticmethod
+    def source_digest(data_paths: Sequence[str], tokenization_settings: Dict[str, Any]) -> str:
+        """
+        计算数据来源摘要
+
+        只使用文件的路径、大小和修改时间，不读取文件内容；文件被改写后摘要随之变化，
+        此时由语料哈希判断内容是否真的变化。
+
+        Args:
+            data_paths: 数据文件路径（训练集、测试集）
+            tokenization_settings: 影响分词结果的配置
+
+        Returns:
+            str: 来源摘要
+        """
+        files = []
+        for path in data_paths:
+            stat = os.stat(path)
+            files.append((os.path.abspath(path), stat.st_size, stat.st_mtime_ns))
+        return _digest(files, sorted((str(k), repr(v)) for k, v in tokenization_settings.items()))
+
+    @staticmethod
+    def corpus_digest(texts: Sequence[List[str]], labels: Sequence[np.ndarray]) -> str:
+        """
+        计算分词后语料和标签的哈希
+
+        Args:
+            texts: 各数据集分词后的文本列表（或词列表）
+            labels: 各数据集的标签数组
+
+        Returns:
+            str: 语料哈希
+        """
+        digest = hashlib.sha1()
+        for dataset in texts:
+            digest.update(str(len(dataset)).encode('utf-8'))
+            for text in dataset:
+                if isinstance(text, str):
+                    digest.update(text.encode('utf-8'))
+                elif isinstance(text, (list, tuple)):
+                    # 词列表与同内容的空格分隔文本区分开，两种输出形式的向量化器不能混用
+                    digest.update(b'\2' + '\x1f'.join(text).encode('utf-8'))
+                else:
+                    digest.update(b'\1')
+                digest.update(b'\0')
+        for y in labels:
+            y = np.ascontiguousarray(y)
+            digest.update(str(y.dtype).encode('utf-8'))
+            digest.update(y.tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def entry_key(corpus_digest: str, vectorizer_type: str, stopwords_fingerprint: str) -> str:
+        """
+        计算缓存条目键
+
+        Args:
+            corpus_digest: 语料哈希
+            vectorizer_type: 向量化器类型
+            stopwords_fingerprint: 向量化器使用的停用词指纹
+
+        Returns:
+            str: 条目键
+        """
+        section = FEATURE_CONFIG_SECTIONS.get(vectorizer_type, vectorizer_type)
+        features_config = CONFIG['features'].get(section, {})
+        parts = [corpus_digest, vectorizer_type, stopwords_fingerprint,
+                 _result_settings(features_config), sklearn.__version__]
+        # 缓存的向量化器和矩阵是特征选择之后的结果；未启用时键与之前相同
+        selection = CONFIG['features'].get('selection', {}) or {}
+        if selection.get('enabled', False):
+            parts.append(_result_settings(selection))
+        return _digest(*parts)
+
+    def _sources_path(self) -> str:
+        return os.path.join(self.cache_dir, SOURCES_FILE)
+
+    def _read_sources(self) -> Dict[str, str]:
+        """读取来源索引"""
+        try:
+            with open(self._sources_path(), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def lookup_source(self, source_digest: str) -> Optional[str]:
+        """
+        通过来源摘要查找语料哈希
+
+        Args:
+            source_digest: 来源摘要
+
+        Returns:
+            Optional[str]: 语料哈希，未记录时为None
+        """
+        if not self.enabled:
+            return None
+        return self._read_sources().get(source_digest)
+
+    def link_source(self, source_digest: str, corpus_digest: str) -> None:
+        """
+        记录来源摘要对应的语料哈希
+
+        Args:
+            source_digest: 来源摘要
+            corpus_digest: 语料哈希
+        """
+        if not self.enabled:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        sources = self._read_sources()
+        sources[source_digest] = corpus_digest
+        tmp_path = f"{self._sources_path()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(sources, f, indent=2)
+        os.replace(tmp_path, self._sources_path())
+
+    def load(self, corpus_digest: str, vectorizer_type: str, stopwords_fingerprint: str
+             ) -> Optional[Tuple[Any, spmatrix, np.ndarray, spmatrix, np.ndarray]]:
+        """
+        加载缓存条目，矩阵分量以只读内存映射方式打开
+
+        Args:
+            corpus_digest: 语料哈希
+            vectorizer_type: 向量化器类型
+            stopwords_fingerprint: 向量化器使用的停用词指纹
+
+        Returns:
+            Optional[Tuple]: (向量化器, 训练特征, 训练标签, 测试特征, 测试标签)，未命中时为None
+        """
+        if not self.enabled:
+            return None
+
+        entry_dir = os.path.join(self.cache_dir,
+                                 self.entry_key(corpus_digest, vectorizer_type, stopwords_fingerprint))
+        meta_path = os.path.join(entry_dir, META_FILE)
+        if not os.path.exists(meta_path):
+            return None
+
+        start = time.perf_counter()
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            vectorizer = joblib.load(os.path.join(entry_dir, VECTORIZER_FILE))
+            x_train = self._load_csr(entry_dir, 'x_train', meta['x_train_shape'])
+            x_test = self._load_csr(entry_dir, 'x_test', meta['x_test_shape'])
+            y_train = np.load(os.path.join(entry_dir, 'y_train.npy'))
+            y_test = np.load(os.path.join(entry_dir, 'y_test.npy'))
+        except Exception as e:
+            # 其他版本的代码或sklearn写入的向量化器可能无法反序列化（AttributeError、
+            # ModuleNotFoundError、UnpicklingError等），都按未命中处理
+            logger.warning(f"读取特征矩阵缓存失败，将重新计算: {type(e).__name__}: {str(e)}")
+            return None
+
+        logger.info(f"使用特征矩阵缓存: {entry_dir}, 训练集{x_train.shape}, 测试集{x_test.shape}, "
+                    f"用时{(time.perf_counter() - start) * 1000:.0f}ms")
+        return vectorizer, x_train, y_train, x_test, y_test
+
+    def save(self, corpus_digest: str, vectorizer: Any, x_train: spmatrix, y_train: np.ndarray,
+             x_test: spmatrix, y_test: np.ndarray) -> Optional[str]:
+        """
+        保存缓存条目
+
+        Args:
+            corpus_digest: 语料哈希
+            vectorizer: 已拟合的TextVectorizer
+            x_train: 训练特征矩阵
+            y_train: 训练标签
+            x_test: 测试特征矩阵
+            y_test: 测试标签
+
+        Returns:
+            Optional[str]: 条目目录，未启用时为None
+        """
+        if not self.enabled:
+            return None
+
+        vectorizer_type = vectorizer.vectorizer_type
+        entry_dir = os.path.join(self.cache_dir,
+                                 self.entry_key(corpus_digest, vectorizer_type, vectorizer.stopwords.fingerprint))
+        tmp_dir = f"{entry_dir}.tmp{os.getpid()}"
+        os.makedirs(tmp_dir, exist_ok=True)
+
+        start = time.perf_counter()
+        self._save_csr(tmp_dir, 'x_train', x_train)
+        self._save_csr(tmp_dir, 'x_test', x_test)
+        np.save(os.path.join(tmp_dir, 'y_train.npy'), np.asarray(y_train))
+        np.save(os.path.join(tmp_dir, 'y_test.npy'), np.asarray(y_test))
+        joblib.dump(vectorizer, os.path.join(tmp_dir, VECTORIZER_FILE))
+        with open(os.path.join(tmp_dir, META_FILE), 'w', encoding='utf-8') as f:
+            json.dump({
+                'corpus_digest': corpus_digest,
+                'vectorizer_type': vectorizer_type,
+                'features_config': CONFIG['features'].get(FEATURE_CONFIG_SECTIONS.get(vectorizer_type), {}),
+                'sklearn_version': sklearn.__version__,
+                'x_train_shape': list(x_train.shape),
+                'x_test_shape': list(x_test.shape),
+                'created_at': datetime.now().isoformat(timespec='seconds'),
+            }, f, ensure_ascii=False, indent=2)
+
+        # 整个条目写完后再放到最终位置，中断的写入不会被当作有效条目。
+        # 已有条目只会在无法读取时（如旧版本写入的未排序下标）走到这里，先移开旧条目再替换
+        stale_dir = None
+        if os.path.exists(entry_dir):
+            stale_dir = f"{entry_dir}.stale{os.getpid()}"
+            try:
+                os.replace(entry_dir, stale_dir)
+            except OSError as e:
+                logger.warning(f"无法替换已有的特征矩阵缓存条目，保留旧条目: {entry_dir}, {str(e)}")
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                return entry_dir
+        os.replace(tmp_dir, entry_dir)
+        if stale_dir is not None:
+            shutil.rmtree(stale_dir, ignore_errors=True)
+            logger.info(f"已替换无法读取的特征矩阵缓存条目: {entry_dir}")
+        logger.info(f"特征矩阵已缓存: {entry_dir}, 用时{(time.perf_counter() - start) * 1000:.0f}ms")
+        return entry_dir
+
+    @staticmethod
+    def _save_csr(directory: str, name: str, matrix: spmatrix) -> None:
+        """以data/indices/indptr三个.npy文件保存CSR矩阵，保存前按行排序列下标"""
+        matrix = csr_matrix(matrix)
+        # 加载后的分量是只读内存映射，SVC等模型训练前会原地排序下标，只能在保存时排好
+        if not matrix.has_sorted_indices:
+            matrix = matrix.copy()
+            matrix.sort_indices()
+        for component in ('data', 'indices', 'indptr'):
+            np.save(os.path.join(directory, f"{name}.{component}.npy"), getattr(matrix, component))
+
+    @staticmethod
+    def _load_csr(directory: str, name: str, shape: Sequence[int]) -> csr_matrix:
+        """
+        以只读内存映射方式加载CSR矩阵分量，不复制数据
+
+        Raises:
+            ValueError: 列下标未排序（修复前写入的条目），由load按未命中处理并重新计算
+        """
+        data, indices, indptr = (
+            np.load(os.path.join(directory, f"{name}.{component}.npy"), mmap_mode='r')
+            for component in ('data', 'indices', 'indptr')
+        )
+        matrix = csr_from_components(data, indices, indptr, shape)
+        # 只读检查一次并记录在矩阵上，之后sort_indices()直接返回，不会写只读的内存映射
+        if not matrix.has_sorted_indices:
+            raise ValueError(f"缓存的{name}矩阵列下标未排序")
+        return matrix
@@ -0,0 +1,83 @@
+"""
+在线IDF估计模块
+
+为无状态的HashingVectorizer补充逆文档频率权重。文档频率按数据块累加，
+任何时刻都可以用已见过的文档计算IDF，不需要保留语料或词汇表。
+"""
+import numpy as np
+from scipy.sparse import spmatrix, csr_matrix
+from sklearn.preprocessing import normalize
+
+
+class OnlineIdfTransformer:
+    """在线IDF转换器
+
+    IDF公式与sklearn的TfidfTransformer一致:
+        smooth_idf=True:  idf = ln((1 + n) / (1 + df)) + 1
+        smooth_idf=False: idf = ln(n / df) + 1
+    """
+
+    def __init__(self, n_features: int, norm: str = 'l2', smooth_idf: bool = True,
+                 sublinear_tf: bool = False) -> None:
+        """
+        初始化在线IDF转换器
+
+        Args:
+            n_features: 特征数（哈希桶数）
+            norm: 行归一化方式，'l1'、'l2'或None
+            smooth_idf: 是否平滑IDF
+            sublinear_tf: 是否使用1 + ln(tf)代替词频
+        """
+        self.n_features = n_features
+        self.norm = norm
+        self.smooth_idf = smooth_idf
+        self.sublinear_tf = sublinear_tf
+        self.df_ = np.zeros(n_features, dtype=np.int64)
+        self.n_docs_ = 0
+
+    def partial_fit(self, counts: spmatrix) -> 'OnlineIdfTransformer':
+        """
+        用一个数据块的词频矩阵更新文档频率
+
+        Args:
+            counts: 词频矩阵（每行一个文档）
+
+        Returns:
+            OnlineIdfTransformer: 自身
+        """
+        counts = csr_matrix(counts)
+        counts.sum_duplicates()
+        # 每行中每个特征只出现一次，按列计数即为文档频率
+        self.df_ += np.bincount(counts.indices[counts.data != 0], minlength=self.n_features)
+        self.n_docs_ += counts.shape[0]
+        return self
+
+    @property
+    def idf_(self) -> np.ndarray:
+        """按当前已见文档计算的IDF向量"""
+        df = self.df_.astype(np.float64)
+        n_docs = float(self.n_docs_)
+        if self.smooth_idf:
+            df += 1
+            n_docs += 1
+        # 未出现过的特征不会出现在已见文档中，其权重取值不影响训练
+        return np.log(n_docs / np.maximum(df, 1)) + 1
+
+    def transform(self, counts: spmatrix) -> csr_matrix:
+        """
+        对词频矩阵施加IDF权重并按行归一化
+
+        Args:
+            counts: 词频矩阵
+
+        Returns:
+            csr_matrix: TF-IDF矩阵
+        """
+        result = csr_matrix(counts, dtype=np.float64, copy=True)
+        if self.sublinear_tf:
+            np.log(result.data, result.data)
+            result.data += 1
+        result.data *= self.idf_[result.indices]
+        if self.norm:
+            result = normalize(result, norm=self.norm, copy=False)
+        return result
@@ -0,0 +1,264 @@
+"""
+并行词汇表构建模块
+
+以map-reduce方式拟合CountVectorizer/TfidfVectorizer:
+    1. 各工作进程统计一个文本块中每个n-gram的文档频率和词频
+    2. 主进程按块的顺序合并统计结果，按与sklearn相同的规则（min_df、max_df、max_features）剪枝得到词汇表
+    3. 各工作进程只按最终词汇表为自己的文本块构建CSR分片，主进程纵向拼接
+
+sklearn的单进程实现先为全部n-gram构建未剪枝的词频矩阵再剪枝，主进程需要同时持有完整的
+中间词汇表和所有词出现位置；这里主进程只持有n-gram到编号的映射和两个计数数组。
+
+输出与sklearn的fit_transform完全一致：词汇表、剪枝时的排序规则、矩阵每行的元素顺序都相同，
+TF-IDF的逐行归一化按相同顺序累加，结果逐位相等。
+"""
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from numbers import Integral
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer, TfidfVectorizer
+
+from src.utils.logger import logger
+
+# 工作进程内的分析器和分片词汇表，由初始化函数在进程启动时设置一次
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_count_worker(analyzer: Callable) -> None:
+    """
+    统计阶段工作进程初始化函数
+
+    Args:
+        analyzer: 向量化器的build_analyzer()结果
+    """
+    _worker_state['analyzer'] = analyzer
+
+
+def _count_chunk(texts: List[Any]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    统计一个文本块中各n-gram的文档频率和词频
+
+    Args:
+        texts: 文本块
+
+    Returns:
+        Tuple: 按块内首次出现顺序排列的n-gram、对应的文档频率和词频
+    """
+    analyzer = _worker_state['analyzer']
+    df: Dict[str, int] = {}
+    tf: Dict[str, int] = {}
+    for text in texts:
+        for feature, count in Counter(analyzer(text)).items():
+            if feature in tf:
+                tf[feature] += count
+                df[feature] += 1
+            else:
+                tf[feature] = count
+                df[feature] = 1
+    return (list(tf), np.fromiter(df.values(), dtype=np.int64, count=len(df)),
+            np.fromiter(tf.values(), dtype=np.int64, count=len(tf)))
+
+
+def _init_shard_worker(analyzer: Callable, vocabulary: Dict[str, int], rank_to_column: np.ndarray,
+                       dtype: Any, binary: bool) -> None:
+    """
+    分片阶段工作进程初始化函数
+
+    Args:
+        analyzer: 向量化器的build_analyzer()结果
+        vocabulary: n-gram到首次出现顺序编号的映射（只含剪枝后保留的n-gram）
+        rank_to_column: 首次出现顺序编号到最终列号的映射
+        dtype: 矩阵元素类型
+        binary: 是否只记录是否出现
+    """
+    _worker_state['analyzer'] = analyzer
+    _worker_state['vocabulary'] = vocabulary
+    _worker_state['rank_to_column'] = rank_to_column
+    _worker_state['dtype'] = dtype
+    _worker_state['binary'] = binary
+
+
+def _build_shard(texts: List[Any]) -> sp.csr_matrix:
+    """
+    为一个文本块构建词频矩阵分片
+
+    每行的元素先按n-gram的首次出现顺序排列再映射到最终列号，与sklearn先排序再重映射列号的结果一致。
+
+    Args:
+        texts: 文本块
+
+    Returns:
+        sp.csr_matrix: 词频矩阵分片
+    """
+    analyzer = _worker_state['analyzer']
+    vocabulary = _worker_state['vocabulary']
+    rank_to_column = _worker_state['rank_to_column']
+
+    indices: List[int] = []
+    values: List[int] = []
+    indptr = [0]
+    for text in texts:
+        counts: Dict[int, int] = {}
+        for feature in analyzer(text):
+            rank = vocabulary.get(feature)
+            if rank is not None:
+                counts[rank] = counts.get(rank, 0) + 1
+        indices.extend(counts)
+        values.extend(counts.values())
+        indptr.append(len(indices))
+
+    shard = sp.csr_matrix(
+        (np.asarray(values, dtype=np.intc), np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+        shape=(len(texts), len(rank_to_column)),
+        dtype=_worker_state['dtype']
+    )
+    shard.sort_indices()
+    shard.indices = rank_to_column.take(shard.indices).astype(shard.indices.dtype, copy=False)
+    if _worker_state['binary']:
+        shard.data.fill(1)
+    return shard
+
+
+def _merge_counts(chunk_results: Any) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    按块的顺序合并各块的统计结果
+
+    Args:
+        chunk_results: _count_chunk结果的序列
+
+    Returns:
+        Tuple: 按全局首次出现顺序排列的n-gram、文档频率和词频
+    """
+    ids: Dict[str, int] = {}
+    df = np.zeros(1024, dtype=np.int64)
+    tf = np.zeros(1024, dtype=np.int64)
+    for terms, chunk_df, chunk_tf in chunk_results:
+        # 新出现的n-gram依次获得下一个编号，全局编号即首次出现顺序
+        chunk_ids = np.fromiter((ids.setdefault(term, len(ids)) for term in terms),
+                                dtype=np.int64, count=len(terms))
+        if len(ids) > len(df):
+            size = max(len(ids), 2 * len(df))
+            df = np.concatenate([df, np.zeros(size - len(df), dtype=np.int64)])
+            tf = np.concatenate([tf, np.zeros(size - len(tf), dtype=np.int64)])
+        # 同一块内的编号互不相同，可以直接按下标累加
+        df[chunk_ids] += chunk_df
+        tf[chunk_ids] += chunk_tf
+    n_terms = len(ids)
+    return list(ids), df[:n_terms], tf[:n_terms]
+
+
+def _limit_features(vectorizer: CountVectorizer, terms: List[str], df: np.ndarray, tf: np.ndarray,
+                    n_docs: int) -> Tuple[np.ndarray, np.ndarray, set]:
+    """
+    按sklearn的规则剪枝
+
+    与CountVectorizer._limit_features相同：在按字母序排列的n-gram上应用max_df、min_df，
+    超过max_features时按词频降序保留，排序方式与sklearn相同，词频相同时的取舍也一致。
+
+    Args:
+        vectorizer: 提供剪枝参数的向量化器
+        terms: 按首次出现顺序排列的n-gram
+        df: 文档频率
+        tf: 词频
+        n_docs: 文档数
+
+    Returns:
+        Tuple: 按字母序排列的全部n-gram的首次出现编号、保留的n-gram在其中的位置、被剪枝的n-gram集合
+
+    Raises:
+        ValueError: 参数矛盾或剪枝后没有剩余的n-gram
+    """
+    max_df, min_df, max_features = vectorizer.max_df, vectorizer.min_df, vectorizer.max_features
+    max_doc_count = max_df if isinstance(max_df, Integral) else max_df * n_docs
+    min_doc_count = min_df if isinstance(min_df, Integral) else min_df * n_docs
+    if max_doc_count < min_doc_count:
+        raise ValueError("max_df corresponds to < documents than min_df")
+
+    order = np.array(sorted(range(len(terms)), key=terms.__getitem__), dtype=np.int64)
+    dfs = df[order]
+    # sklearn在向量化器的dtype上求列和，保持相同的类型使排序结果一致
+    tfs = (dfs if vectorizer.binary else tf[order]).astype(vectorizer.dtype)
+
+    mask = np.ones(len(dfs), dtype=bool)
+    mask &= dfs <= max_doc_count
+    mask &= dfs >= min_doc_count
+    if max_features is not None and mask.sum() > max_features:
+        mask_inds = (-tfs[mask]).argsort()[:max_features]
+        new_mask = np.zeros(len(dfs), dtype=bool)
+        new_mask[np.where(mask)[0][mask_inds]] = True
+        mask = new_mask
+
+    kept = np.where(mask)[0]
+    if len(kept) == 0:
+        raise ValueError("After pruning, no terms remain. Try a lower min_df or a higher max_df.")
+    removed = {terms[i] for i in order[~mask]}
+    return order, kept, removed
+
+
+def parallel_fit_transform(vectorizer: Union[CountVectorizer, TfidfVectorizer], texts: List[Any],
+                           n_jobs: int, chunk_size: int) -> sp.csr_matrix:
+    """
+    多进程拟合向量化器并返回训练矩阵
+
+    拟合后向量化器的vocabulary_、stop_words_（以及TF-IDF的IDF）与调用vectorizer.fit_transform(texts)相同，
+    之后可以照常调用transform。
+
+    Args:
+        vectorizer: 未拟合的CountVectorizer或TfidfVectorizer
+        texts: 训练文本（或词列表）
+        n_jobs: 工作进程数
+        chunk_size: 每个任务块包含的文本数
+
+    Returns:
+        sp.csr_matrix: 与vectorizer.fit_transform(texts)相同的矩阵
+
+    Raises:
+        ValueError: 词汇表为空或剪枝参数无效
+    """
+    analyzer = vectorizer.build_analyzer()
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    logger.info(f"使用{n_jobs}个进程并行构建词汇表: {len(texts)}个文档, {len(chunks)}个分块")
+
+    # 第一遍: 各块统计文档频率和词频，按块的顺序合并
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_count_worker,
+                             initargs=(analyzer,)) as executor:
+        terms, df, tf = _merge_counts(executor.map(_count_chunk, chunks))
+    if not terms:
+        raise ValueError("empty vocabulary; perhaps the documents only contain stop words")
+
+    order, kept, removed = _limit_features(vectorizer, terms, df, tf, len(texts))
+    del df, tf
+    vocabulary = {terms[i]: column for column, i in enumerate(order[kept])}
+    # 分片内按首次出现顺序排列元素，rank_to_column把顺序编号映射回按字母序的列号
+    first_seen = order[kept]
+    rank_to_column = np.argsort(first_seen, kind='stable')
+    shard_vocabulary = {terms[first_seen[column]]: rank for rank, column in enumerate(rank_to_column)}
+    del terms, order
+    count_time = time.perf_counter() - start
+    logger.info(f"词汇表统计完成: 保留{len(vocabulary)}个特征, 剪枝{len(removed)}个, 用时{count_time:.2f}s")
+
+    # 第二遍: 按最终词汇表构建各块的CSR分片并拼接
+    start = time.perf_counter()
+    dtype = vectorizer.dtype
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_shard_worker,
+                             initargs=(analyzer, shard_vocabulary, rank_to_column, dtype,
+                                       vectorizer.binary)) as executor:
+        result = sp.vstack(list(executor.map(_build_shard, chunks)), format='csr', dtype=dtype)
+    logger.info(f"特征矩阵分片拼接完成: 形状{result.shape}, 用时{time.perf_counter() - start:.2f}s")
+
+    vectorizer.vocabulary_ = vocabulary
+    vectorizer.fixed_vocabulary_ = False
+    vectorizer.stop_words_ = removed
+
+    if isinstance(vectorizer, TfidfVectorizer):
+        vectorizer._tfidf = TfidfTransformer(norm=vectorizer.norm, use_idf=vectorizer.use_idf,
+                                             smooth_idf=vectorizer.smooth_idf,
+                                             sublinear_tf=vectorizer.sublinear_tf)
+        vectorizer._tfidf.fit(result)
+        result = vectorizer._tfidf.transform(result, copy=False)
+    return result
@@ -0,0 +1,159 @@
+"""
+有监督特征选择模块
+
+在向量化之后、训练之前按与标签的相关性选出k个特征（features.selection）:
+    chi2:        卡方统计量
+    mutual_info: 词是否出现与标签之间的互信息
+    l1:          L1正则化逻辑回归的系数绝对值，系数为0的特征不会被选中
+
+选择结果写回TextVectorizer：词汇表和IDF只保留被选中的词，之后的transform直接输出选中的列，
+不再生成未选中的列；向量化器随模型工件和特征缓存一起保存。
+"""
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy.sparse import spmatrix
+from sklearn.feature_selection import chi2, mutual_info_classif
+from sklearn.linear_model import LogisticRegression
+
+from src.features.vectorizers import TextVectorizer
+from src.utils.config_loader import CONFIG
+from src.utils.logger import logger
+
+SELECTION_METHODS = ('chi2', 'mutual_info', 'l1')
+
+
+def score_features(method: str, x_train: spmatrix, y_train: np.ndarray, config: Dict[str, Any]) -> np.ndarray:
+    """
+    计算每个特征的得分，得分越高越重要
+
+    Args:
+        method: 选择方法，'chi2'、'mutual_info'或'l1'
+        x_train: 训练特征（非负）
+        y_train: 训练标签
+        config: 特征选择配置
+
+    Returns:
+        np.ndarray: 各特征的得分
+
+    Raises:
+        ValueError: 不支持的选择方法
+    """
+    if method == 'chi2':
+        scores, _ = chi2(x_train, y_train)
+    elif method == 'mutual_info':
+        # 稀疏矩阵只能按离散特征计算，使用词是否出现
+        presence = x_train.copy()
+        presence.data = np.ones_like(presence.data)
+        scores = mutual_info_classif(presence, y_train, discrete_features=True,
+                                     random_state=config.get('random_state', 42))
+    elif method == 'l1':
+        model = LogisticRegression(penalty='l1', solver='liblinear', C=config.get('l1_C', 1.0),
+                                   random_state=config.get('random_state', 42))
+        model.fit(x_train, y_train)
+        scores = np.abs(model.coef_).max(axis=0)
+    else:
+        error_msg = f"不支持的特征选择方法: {method}，可选: {', '.join(SELECTION_METHODS)}"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+    return np.nan_to_num(np.asarray(scores, dtype=np.float64), nan=0.0)
+
+
+def top_k_columns(scores: np.ndarray, k: int, require_positive: bool = False) -> np.ndarray:
+    """
+    选出得分最高的k列
+
+    Args:
+        scores: 各特征的得分
+        k: 保留的特征数
+        require_positive: 是否只保留得分大于0的特征（L1选择中系数为0的特征）
+
+    Returns:
+        np.ndarray: 按列号升序排列的选中列
+    """
+    order = np.argsort(-scores, kind='stable')[:k]
+    if require_positive:
+        order = order[scores[order] > 0]
+    return np.sort(order)
+
+
+def _time_inference(vectorizer: TextVectorizer, model: Any, texts: List[Any]) -> float:
+    """向量化并预测一批文本，返回单条的平均耗时（毫秒）"""
+    start = time.perf_counter()
+    model.predict_proba(vectorizer.transform_texts(texts))
+    return (time.perf_counter() - start) * 1000 / len(texts)
+
+
+def _time_fit(x_train: spmatrix, y_train: np.ndarray) -> Tuple[Any, float]:
+    """训练参考模型（逻辑回归），返回模型和耗时（秒）"""
+    model = LogisticRegression(random_state=42)
+    start = time.perf_counter()
+    model.fit(x_train, y_train)
+    return model, time.perf_counter() - start
+
+
+def select_features(vectorizer: TextVectorizer, x_train: spmatrix, y_train: np.ndarray, x_test: spmatrix,
+                    sample_texts: Optional[List[Any]] = None) -> Tuple[spmatrix, spmatrix]:
+    """
+    按features.selection配置选择特征，并把选择结果写回向量化器
+
+    未启用、向量化器为hashing或k不小于现有特征数时原样返回。
+    启用measure_savings时用逻辑回归作参考模型，记录选择前后的训练耗时和单条推理延迟。
+
+    Args:
+        vectorizer: 已拟合的向量化器
+        x_train: 训练特征
+        y_train: 训练标签
+        x_test: 测试特征
+        sample_texts: 用于测量推理延迟的分词后文本，为None时不测量延迟
+
+    Returns:
+        Tuple[spmatrix, spmatrix]: 选择后的训练特征和测试特征
+
+    Raises:
+        ValueError: 不支持的选择方法
+    """
+    config = CONFIG['features'].get('selection', {}) or {}
+    if not config.get('enabled', False):
+        return x_train, x_test
+    if vectorizer.vectorizer_type == 'hashing':
+        logger.warning("哈希向量化器没有词汇表，跳过特征选择")
+        return x_train, x_test
+
+    method = config.get('method', 'chi2')
+    k = int(config.get('k', 3000))
+    n_features = x_train.shape[1]
+    if k >= n_features:
+        logger.info(f"特征数{n_features}不超过k={k}，跳过特征选择")
+        return x_train, x_test
+
+    start = time.perf_counter()
+    scores = score_features(method, x_train, y_train, config)
+    columns = top_k_columns(scores, k, require_positive=(method == 'l1'))
+    if len(columns) == 0:
+        logger.warning(f"{method}特征选择没有选中任何特征，保留全部特征")
+        return x_train, x_test
+    select_time = time.perf_counter() - start
+    logger.info(f"特征选择({method}): {n_features} -> {len(columns)}个特征, 用时{select_time:.2f}s")
+
+    measure = config.get('measure_savings', True)
+    if measure:
+        full_model, full_fit = _time_fit(x_train, y_train)
+        if sample_texts:
+            sample_texts = sample_texts[:config.get('latency_sample', 1000)]
+            full_latency = _time_inference(vectorizer, full_model, sample_texts)
+
+    vectorizer.restrict_features(columns, method)
+    x_train = vectorizer.restrict_matrix(x_train, columns)
+    x_test = vectorizer.restrict_matrix(x_test, columns)
+
+    if measure:
+        selected_model, selected_fit = _time_fit(x_train, y_train)
+        logger.info(f"特征选择节省的训练时间（参考模型: 逻辑回归）: {full_fit:.2f}s -> {selected_fit:.2f}s "
+                    f"({1 - selected_fit / max(full_fit, 1e-9):.0%})")
+        if sample_texts:
+            selected_latency = _time_inference(vectorizer, selected_model, sample_texts)
+            logger.info(f"特征选择节省的推理延迟（向量化+预测，单条）: {full_latency:.3f}ms -> "
+                        f"{selected_latency:.3f}ms ({1 - selected_latency / max(full_latency, 1e-9):.0%})")
+    return x_train, x_test
@@ -2,72 +2,267 @@
 文本向量化模块，用于将文本转换为特征向量
 
 提供将预处理后的文本转换为机器学习算法可用的数值特征向量的功能。
-支持多种向量化方法，包括TF-IDF和Count向量化，可以根据配置调整参数。
+支持多种向量化方法，包括TF-IDF、Count和哈希向量化，可以根据配置调整参数。
+哈希向量化不需要词汇表，配合在线IDF估计可以逐块处理超出内存的语料。
+预处理器输出词列表时（preprocessing.output: tokens），直接在词列表上生成n-gram，不再正则切分和重复过滤停用词。
+紧凑模式（compact: true）输出float32/int32的CSR矩阵，词汇表保存为有序字节数组并丢弃stop_words_。
 """
-from typing import List, Optional, Union, Dict, Any, Callable
+import os
+from itertools import islice
+from typing import List, Optional, Union, Dict, Any, Callable, Iterable, Iterator, Tuple
 import numpy as np
+import scipy.sparse as sp
 from scipy.sparse import spmatrix
 
-from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
+from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer, HashingVectorizer
+from sklearn.preprocessing import normalize
 from src.utils.config_loader import CONFIG
 from src.utils.logger import logger
+from src.data.stopwords import StopwordIndex
+from src.features.online_idf import OnlineIdfTransformer
+from src.features.parallel_vocab import parallel_fit_transform
+from src.features.compact_vocab import CompactVocabulary, compact_matrix, container_nbytes, matrix_nbytes
+
+
+VECTORIZER_TYPES = ('tfidf', 'count', 'hashing')
+
+# 文档可以是空格分隔的分词文本，也可以是词列表
+Document = Union[str, List[str]]
+
+
+def is_valid_document(document: Any) -> bool:
+    """
+    判断文档是否有效：非空白的字符串，或非空的词列表
+    
+    Args:
+        document: 分词文本或词列表
+        
+    Returns:
+        bool: 是否有效
+    """
+    if isinstance(document, str):
+        return bool(document.strip())
+    if isinstance(document, (list, tuple, np.ndarray)):
+        return len(document) > 0
+    return False
+
+
+class NgramAnalyzer:
+    """词列表的n-gram分析器
+    
+    作为sklearn向量化器的analyzer，在预处理器输出的词列表上直接生成n-gram。
+    n-gram以空格连接，特征名与sklearn词级n-gram一致；不做正则切分，因此单字词也会保留为特征。
+    传入停用词时与sklearn一样在转换小写之后、生成n-gram之前过滤。
+    定义在模块级别，可以随向量化器一起pickle到模型工件和特征缓存中。
+    """
+    
+    def __init__(self, ngram_range: Tuple[int, int] = (1, 1), lowercase: bool = True,
+                 stopwords: Optional[StopwordIndex] = None) -> None:
+        """
+        初始化分析器
+        
+        Args:
+            ngram_range: n-gram范围
+            lowercase: 是否把英文转换为小写，与sklearn默认行为一致
+            stopwords: 要过滤的停用词，为None时不过滤
+        """
+        self.ngram_range = tuple(ngram_range)
+        self.lowercase = lowercase
+        self.stopwords = stopwords
+    
+    def __call__(self, document: Document) -> List[str]:
+        """
+        生成文档的n-gram
+        
+        Args:
+            document: 词列表；传入字符串时按空白切分
+            
+        Returns:
+            List[str]: n-gram列表
+        """
+        tokens = document.split() if isinstance(document, str) else list(document)
+        if self.lowercase:
+            tokens = [token.lower() for token in tokens]
+        if self.stopwords:
+            tokens = self.stopwords.filter(tokens)
+        
+        min_n, max_n = self.ngram_range
+        if max_n == 1:
+            return tokens
+        
+        if min_n == 1:
+            ngrams = list(tokens)
+            min_n = 2
+        else:
+            ngrams = []
+        n_tokens = len(tokens)
+        for n in range(min_n, min(max_n, n_tokens) + 1):
+            ngrams.extend(" ".join(tokens[i:i + n]) for i in range(n_tokens - n + 1))
+        return ngrams
+    
+    def __repr__(self) -> str:
+        stopwords = len(self.stopwords) if self.stopwords else 0
+        return f"NgramAnalyzer(ngram_range={self.ngram_range}, lowercase={self.lowercase}, stopwords={stopwords})"
+
+
+class HashedFeatureNames:
+    """哈希特征的名称
+    
+    哈希向量化不保存词汇表，无法还原特征对应的词语，按下标生成占位名称。
+    """
+    
+    def __init__(self, n_features: int) -> None:
+        self.n_features = n_features
+    
+    def __len__(self) -> int:
+        return self.n_features
+    
+    def __getitem__(self, index: int) -> str:
+        return f"哈希特征#{int(index)}"
 
 
 class TextVectorizer:
     """文本向量化器
     
     将文本数据转换为机器学习模型可以使用的数值特征向量。
-    支持TF-IDF和Count两种向量化方法，并可根据配置调整参数。
+    支持TF-IDF、Count和哈希三种向量化方法，并可根据配置调整参数。
+    哈希向量化器是无状态的，可选的在线IDF估计随partial_fit_transform逐块更新。
     """
     
-    def __init__(self, vectorizer_type: str = 'tfidf', stopwords: Optional[List[str]] = None) -> None:
+    def __init__(self, vectorizer_type: str = 'tfidf',
+                 stopwords: Optional[Union[StopwordIndex, List[str]]] = None,
+                 pretokenized: Optional[bool] = None) -> None:
         """
         初始化向量化器
         
         Args:
-            vectorizer_type: 向量化器类型，可选 'tfidf' 或 'count'
-            stopwords: 停用词列表
+            vectorizer_type: 向量化器类型，可选 'tfidf'、'count' 或 'hashing'
+            stopwords: 停用词索引或停用词列表
+            pretokenized: 输入是否为词列表，默认取决于配置preprocessing.output是否为'tokens'
             
         Raises:
             ValueError: 不支持的向量化器类型
         """
         self.vectorizer_type = vectorizer_type.lower()
-        self.stopwords = stopwords if stopwords else []
-        self.vectorizer: Union[TfidfVectorizer, CountVectorizer, None] = None
+        self.stopwords = StopwordIndex.coerce(stopwords)
+        if pretokenized is None:
+            pretokenized = CONFIG['preprocessing'].get('output', 'text') == 'tokens'
+        self.pretokenized = pretokenized
+        self.vectorizer: Union[TfidfVectorizer, CountVectorizer, HashingVectorizer, None] = None
+        self.idf: Optional[OnlineIdfTransformer] = None
+        self.n_jobs = 1
+        self.fit_chunk_size = 2000
+        self.compact = False
+        self.compact_vocabulary: Optional[CompactVocabulary] = None
+        self.selection: Optional[Dict[str, Any]] = None
         
         # 检查向量化器类型是否有效
-        if self.vectorizer_type not in ['tfidf', 'count']:
-            raise ValueError(f"不支持的向量化器类型: {vectorizer_type}，支持的类型: 'tfidf', 'count'")
+        if self.vectorizer_type not in VECTORIZER_TYPES:
+            raise ValueError(f"不支持的向量化器类型: {vectorizer_type}，支持的类型: 'tfidf', 'count', 'hashing'")
         
         # 从配置中加载参数
         if self.vectorizer_type == 'tfidf':
             config = CONFIG['features']['tfidf']
+            self._set_fit_parallelism(config)
+            self.compact = config.get('compact', False)
             self.vectorizer = TfidfVectorizer(
                 min_df=config.get('min_df', 1),
                 max_features=config.get('max_features', None),
-                ngram_range=tuple(config.get('ngram_range', [1, 1])),
-                stop_words=self.stopwords if config.get('use_stopwords', True) else None,
                 norm=config.get('norm', 'l2'),
-                use_idf=config.get('use_idf', True)
+                use_idf=config.get('use_idf', True),
+                dtype=np.float32 if self.compact else np.float64,
+                **self._analyzer_params(config)
             )
             logger.info(f"初始化TF-IDF向量化器: min_df={config.get('min_df')}, "
                       f"max_features={config.get('max_features')}, "
                       f"ngram_range={config.get('ngram_range')}, "
-                      f"use_stopwords={config.get('use_stopwords', True)}")
+                      f"use_stopwords={config.get('use_stopwords', True)}, "
+                      f"compact={self.compact}")
+        elif self.vectorizer_type == 'hashing':
+            config = CONFIG['features']['hashing']
+            self.compact = config.get('compact', False)
+            n_features = config.get('n_features', 2 ** 20)
+            use_idf = config.get('use_idf', True)
+            norm = config.get('norm', 'l2')
+            # 使用IDF时先输出原始词频，归一化在施加IDF之后进行
+            self.vectorizer = HashingVectorizer(
+                n_features=n_features,
+                alternate_sign=False,
+                norm=None if use_idf else norm,
+                dtype=np.float32 if self.compact else np.float64,
+                **self._analyzer_params(config)
+            )
+            if use_idf:
+                self.idf = OnlineIdfTransformer(n_features, norm=norm)
+            logger.info(f"初始化哈希向量化器: n_features={n_features}, "
+                      f"ngram_range={config.get('ngram_range')}, "
+                      f"use_stopwords={config.get('use_stopwords', True)}, "
+                      f"use_idf={use_idf}, compact={self.compact}")
         else:  # 'count'
             config = CONFIG['features']['countvec']
+            self._set_fit_parallelism(config)
+            self.compact = config.get('compact', False)
             self.vectorizer = CountVectorizer(
                 min_df=config.get('min_df', 1),
                 max_features=config.get('max_features', None),
-                ngram_range=tuple(config.get('ngram_range', [1, 1])),
-                stop_words=self.stopwords if config.get('use_stopwords', True) else None,
-                binary=config.get('binary', False)
+                binary=config.get('binary', False),
+                dtype=np.float32 if self.compact else np.int64,
+                **self._analyzer_params(config)
             )
             logger.info(f"初始化Count向量化器: min_df={config.get('min_df')}, "
                       f"max_features={config.get('max_features')}, "
                       f"ngram_range={config.get('ngram_range')}, "
                       f"use_stopwords={config.get('use_stopwords', True)}, "
-                      f"binary={config.get('binary', False)}")
+                      f"binary={config.get('binary', False)}, compact={self.compact}")
+    
+    def _set_fit_parallelism(self, config: Dict[str, Any]) -> None:
+        """
+        读取拟合词汇表的并行配置
+        
+        Args:
+            config: 向量化器配置，n_jobs为0或负数时使用全部CPU核心
+        """
+        n_jobs = config.get('n_jobs', 1)
+        if n_jobs is None or n_jobs <= 0:
+            n_jobs = os.cpu_count() or 1
+        self.n_jobs = int(n_jobs)
+        self.fit_chunk_size = max(1, int(config.get('fit_chunk_size', 2000)))
+    
+    def _analyzer_params(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        生成传给sklearn向量化器的分析器相关参数
+        
+        输入为词列表时使用NgramAnalyzer，否则使用sklearn默认的正则切分；
+        两种输入都按向量化器配置的use_stopwords过滤停用词，与预处理阶段是否过滤无关。
+        
+        Args:
+            config: 向量化器配置
+            
+        Returns:
+            Dict[str, Any]: analyzer或ngram_range/stop_words参数
+        """
+        ngram_range = tuple(config.get('ngram_range', [1, 1]))
+        if self.pretokenized:
+            # token_pattern置空，避免sklearn提示该参数在自定义analyzer下不生效
+            stopwords = self.stopwords if config.get('use_stopwords', True) and self.stopwords else None
+            return {'analyzer': NgramAnalyzer(ngram_range, stopwords=stopwords), 'token_pattern': None}
+        return {'ngram_range': ngram_range, 'stop_words': self._stop_words_param(config)}
+    
+    def _stop_words_param(self, config: Dict[str, Any]) -> Optional[List[str]]:
+        """
+        生成传给sklearn向量化器的stop_words参数
+        
+        sklearn只接受列表形式的停用词，并在内部转换为frozenset。
+        
+        Args:
+            config: 向量化器配置
+            
+        Returns:
+            Optional[List[str]]: 停用词列表，不使用停用词时为None
+        """
+        if not config.get('use_stopwords', True) or not self.stopwords:
+            return None
+        return self.stopwords.to_list()
     
     def fit_transform(self, texts: List[str], progress_callback: Optional[Callable] = None) -> spmatrix:
         """
@@ -93,7 +288,7 @@ class TextVectorizer:
             raise ValueError("输入文本列表为空")
         
         # 过滤无效文本
-        valid_texts = [t for t in texts if isinstance(t, str) and t.strip()]
+        valid_texts = [t for t in texts if is_valid_document(t)]
         if len(valid_texts) < len(texts):
             logger.warning(f"过滤了{len(texts) - len(valid_texts)}个无效文本")
         
@@ -103,11 +298,21 @@ class TextVectorizer:
         try:
             logger.info(f"使用{self.vectorizer_type}对训练数据进行向量化: {len(valid_texts)}个文档")
             assert self.vectorizer is not None, "向量化器未初始化"
-            result = self.vectorizer.fit_transform(valid_texts)
-            
-            # 记录一些统计信息
-            vocab_size = len(self.vectorizer.vocabulary_)
-            logger.info(f"词汇表大小: {vocab_size}")
+            n_jobs = getattr(self, 'n_jobs', 1)
+            chunk_size = getattr(self, 'fit_chunk_size', 2000)
+            if self.vectorizer_type == 'hashing':
+                result = self.partial_fit_transform(valid_texts)
+            elif n_jobs > 1 and len(valid_texts) > chunk_size:
+                # 多进程分块统计词频并剪枝，结果与单进程fit_transform相同
+                result = parallel_fit_transform(self.vectorizer, valid_texts, n_jobs, chunk_size)
+            else:
+                result = self.vectorizer.fit_transform(valid_texts)
+                
+                # 记录一些统计信息
+                vocab_size = len(self.vectorizer.vocabulary_)
+                logger.info(f"词汇表大小: {vocab_size}")
+            if self.compact:
+                result = self._compact_fitted(result)
             logger.info(f"特征矩阵形状: {result.shape}")
             
             if progress_callback:
@@ -119,7 +324,8 @@ class TextVectorizer:
             logger.error(error_msg)
             raise ValueError(error_msg)
     
-    def transform(self, texts: List[str], progress_callback: Optional[Callable] = None) -> spmatrix:
+    def transform(self, texts: List[str], progress_callback: Optional[Callable] = None,
+                  keep_empty: bool = False) -> spmatrix:
         """
         转换文本数据
         
@@ -128,6 +334,7 @@ class TextVectorizer:
         Args:
             texts: 待向量化的文本列表
             progress_callback: 进度回调函数
+            keep_empty: 是否保留无效文本（转换为全零行），保证输出矩阵与输入逐行对齐，推理时使用
             
         Returns:
             spmatrix: 稀疏特征矩阵
@@ -145,17 +352,21 @@ class TextVectorizer:
         if not texts:
             raise ValueError("输入文本列表为空")
         
-        # 过滤无效文本
-        valid_texts = [t for t in texts if isinstance(t, str) and t.strip()]
-        if len(valid_texts) < len(texts):
-            logger.warning(f"过滤了{len(texts) - len(valid_texts)}个无效文本")
-        
-        if not valid_texts:
-            raise ValueError("过滤后没有有效文本可供向量化")
+        if keep_empty:
+            empty: Document = [] if getattr(self, 'pretokenized', False) else ""
+            valid_texts = [t if is_valid_document(t) else empty for t in texts]
+        else:
+            # 过滤无效文本
+            valid_texts = [t for t in texts if is_valid_document(t)]
+            if len(valid_texts) < len(texts):
+                logger.warning(f"过滤了{len(texts) - len(valid_texts)}个无效文本")
+            
+            if not valid_texts:
+                raise ValueError("过滤后没有有效文本可供向量化")
         
         try:
             logger.info(f"使用{self.vectorizer_type}对测试数据进行向量化: {len(valid_texts)}个文档")
-            result = self.vectorizer.transform(valid_texts)
+            result = self.transform_texts(valid_texts)
             
             # 记录一些统计信息
             logger.info(f"特征矩阵形状: {result.shape}")
@@ -167,4 +378,292 @@ class TextVectorizer:
         except Exception as e:
             error_msg = f"{self.vectorizer_type}向量化失败: {str(e)}"
             logger.error(error_msg)
-            raise ValueError(error_msg) 
\ No newline at end of file
+            raise ValueError(error_msg) 
+    
+    def fit_transform_stream(self, chunks: Iterable[Tuple[List[str], np.ndarray]],
+                             progress_callback: Optional[Callable] = None) -> Tuple[spmatrix, np.ndarray]:
+        """
+        以流式方式拟合并转换文本数据
+        
+        逐块消费预处理器产出的 (文本, 标签) 数据块，直接把文本生成器交给底层向量化器，
+        不在内存中保留完整的文本列表。无效文本连同对应的标签一起被过滤。
+        
+        Args:
+            chunks: (分词后文本列表, 标签数组) 序列
+            progress_callback: 进度回调函数
+            
+        Returns:
+            Tuple[spmatrix, np.ndarray]: 稀疏特征矩阵和对齐后的标签数组
+            
+        Raises:
+            ValueError: 没有有效文本或向量化过程出错
+        """
+        if progress_callback:
+            progress_callback(f"{self.vectorizer_type.upper()}向量化")
+        
+        labels: List[np.ndarray] = []
+        try:
+            logger.info(f"使用{self.vectorizer_type}对训练数据进行流式向量化")
+            assert self.vectorizer is not None, "向量化器未初始化"
+            if self.vectorizer_type == 'hashing':
+                result = self.partial_fit_transform(self._iter_valid_texts(chunks, labels))
+            else:
+                result = self.vectorizer.fit_transform(self._iter_valid_texts(chunks, labels))
+                
+                # 记录一些统计信息
+                logger.info(f"词汇表大小: {len(self.vectorizer.vocabulary_)}")
+            if self.compact:
+                result = self._compact_fitted(result)
+            logger.info(f"特征矩阵形状: {result.shape}")
+        except Exception as e:
+            error_msg = f"{self.vectorizer_type}向量化失败: {str(e)}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        if progress_callback:
+            progress_callback(20)
+        
+        return result, np.concatenate(labels)
+    
+    def transform_stream(self, chunks: Iterable[Tuple[List[str], np.ndarray]],
+                         progress_callback: Optional[Callable] = None) -> Tuple[spmatrix, np.ndarray]:
+        """
+        以流式方式转换文本数据
+        
+        Args:
+            chunks: (分词后文本列表, 标签数组) 序列
+            progress_callback: 进度回调函数
+            
+        Returns:
+            Tuple[spmatrix, np.ndarray]: 稀疏特征矩阵和对齐后的标签数组
+            
+        Raises:
+            ValueError: 向量化器未初始化、没有有效文本或向量化过程出错
+        """
+        if self.vectorizer is None:
+            raise ValueError("向量化器未初始化，请先调用fit_transform")
+        
+        if progress_callback:
+            progress_callback(f"{self.vectorizer_type.upper()}向量化")
+        
+        labels: List[np.ndarray] = []
+        try:
+            logger.info(f"使用{self.vectorizer_type}对测试数据进行流式向量化")
+            result = self.transform_texts(self._iter_valid_texts(chunks, labels))
+            logger.info(f"特征矩阵形状: {result.shape}")
+        except Exception as e:
+            error_msg = f"{self.vectorizer_type}向量化失败: {str(e)}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        if progress_callback:
+            progress_callback(20)
+        
+        return result, np.concatenate(labels)
+    
+    def partial_fit_transform(self, texts: Iterable[str]) -> spmatrix:
+        """
+        用一批文本更新在线IDF估计并返回其特征矩阵
+        
+        仅适用于哈希向量化器。文本只哈希一次，先用本批词频更新文档频率，
+        再用更新后的IDF加权，因此对全部数据一次调用时结果与完整语料上的IDF一致。
+        
+        Args:
+            texts: 分词后的文本
+            
+        Returns:
+            spmatrix: 稀疏特征矩阵
+            
+        Raises:
+            ValueError: 向量化器不是哈希向量化器
+        """
+        if self.vectorizer_type != 'hashing':
+            raise ValueError(f"{self.vectorizer_type}向量化器需要完整语料构建词汇表，不支持增量拟合")
+        
+        counts = self.vectorizer.transform(texts)
+        if self.idf is None:
+            return counts
+        self.idf.partial_fit(counts)
+        return self.idf.transform(counts)
+    
+    def transform_texts(self, texts: Iterable[str]) -> spmatrix:
+        """
+        使用底层向量化器转换文本，哈希向量化器在启用IDF时施加当前的IDF估计
+        
+        不过滤文本也不输出日志，供逐块处理时调用。
+        
+        Args:
+            texts: 分词后的文本
+            
+        Returns:
+            spmatrix: 稀疏特征矩阵
+        """
+        assert self.vectorizer is not None, "向量化器未初始化"
+        # 早期版本保存的向量化器没有紧凑模式和idf属性
+        if getattr(self, 'compact_vocabulary', None) is not None:
+            result = self._compact_transform(texts)
+        else:
+            result = self.vectorizer.transform(texts)
+        idf = getattr(self, 'idf', None)
+        if idf is not None:
+            result = idf.transform(result)
+        if getattr(self, 'compact', False):
+            result = compact_matrix(result)
+        return result
+    
+    def _compact_fitted(self, result: spmatrix) -> spmatrix:
+        """
+        拟合后切换到紧凑表示，并记录切换前后的内存占用
+        
+        词汇表字典换成CompactVocabulary，删除stop_words_，训练矩阵转换为float32/int32。
+        
+        Args:
+            result: 拟合得到的训练矩阵
+            
+        Returns:
+            spmatrix: 紧凑的训练矩阵
+        """
+        # 与默认模式对比：元素为float64，下标沿用sklearn生成的类型
+        matrix_before = result.nnz * np.dtype(np.float64).itemsize + result.indices.nbytes + result.indptr.nbytes
+        result = compact_matrix(result)
+        matrix_after = matrix_nbytes(result)
+        
+        vocabulary_before = vocabulary_after = 0
+        if self.vectorizer_type != 'hashing':
+            vocabulary = self.vectorizer.vocabulary_
+            vocabulary_before = (container_nbytes(vocabulary)
+                                 + container_nbytes(getattr(self.vectorizer, 'stop_words_', None)))
+            self.compact_vocabulary = CompactVocabulary(vocabulary)
+            vocabulary_after = self.compact_vocabulary.nbytes
+            del self.vectorizer.vocabulary_
+            if hasattr(self.vectorizer, 'stop_words_'):
+                del self.vectorizer.stop_words_
+        
+        mb = 1024 ** 2
+        logger.info(f"紧凑模式内存占用: 词汇表 {vocabulary_before / mb:.2f}MB -> {vocabulary_after / mb:.2f}MB, "
+                    f"训练矩阵 {matrix_before / mb:.2f}MB -> {matrix_after / mb:.2f}MB")
+        return result
+    
+    def _compact_transform(self, texts: Iterable[Document]) -> spmatrix:
+        """
+        用紧凑词汇表转换文本
+        
+        按fit_chunk_size分块，每块的n-gram一次性用二分查找映射到列号；TF-IDF再施加拟合得到的IDF和归一化。
+        
+        Args:
+            texts: 分词后的文本
+            
+        Returns:
+            spmatrix: 稀疏特征矩阵
+        """
+        analyzer = self.vectorizer.build_analyzer()
+        binary = getattr(self.vectorizer, 'binary', False)
+        iterator = iter(texts)
+        blocks = []
+        while True:
+            block = list(islice(iterator, self.fit_chunk_size))
+            if not block:
+                break
+            blocks.append(self.compact_vocabulary.count_matrix(
+                (analyzer(text) for text in block), len(block), np.float32, binary))
+        if not blocks:
+            blocks.append(self.compact_vocabulary.count_matrix([], 0, np.float32, binary))
+        counts = blocks[0] if len(blocks) == 1 else sp.vstack(blocks, format='csr')
+        if self.vectorizer_type == 'tfidf':
+            return self.vectorizer._tfidf.transform(counts, copy=False)
+        return counts
+    
+    def restrict_features(self, columns: np.ndarray, method: str) -> None:
+        """
+        只保留选中的特征
+        
+        词汇表和IDF只保留选中的列并按原顺序重新编号，之后transform直接输出这些列。
+        
+        Args:
+            columns: 按升序排列的选中列号
+            method: 特征选择方法，记录在selection属性中
+            
+        Raises:
+            ValueError: 哈希向量化器没有词汇表
+        """
+        if self.vectorizer_type == 'hashing':
+            raise ValueError("哈希向量化器没有词汇表，不支持特征选择")
+        
+        n_before = len(self.get_feature_names_out())
+        if getattr(self, 'compact_vocabulary', None) is not None:
+            self.compact_vocabulary = self.compact_vocabulary.subset(columns)
+        else:
+            names = self.vectorizer.get_feature_names_out()
+            self.vectorizer.vocabulary_ = {names[column]: i for i, column in enumerate(columns)}
+        
+        if self.vectorizer_type == 'tfidf' and self.vectorizer.use_idf:
+            tfidf = self.vectorizer._tfidf
+            tfidf.idf_ = tfidf.idf_[columns]
+            tfidf.n_features_in_ = len(columns)
+        
+        self.selection = {'method': method, 'n_features_before': n_before, 'n_features': len(columns)}
+    
+    def restrict_matrix(self, matrix: spmatrix, columns: np.ndarray) -> spmatrix:
+        """
+        从已有的特征矩阵中取出选中的列，结果与restrict_features之后transform的输出一致
+        
+        TF-IDF设置了norm时按选中的列重新归一化每一行。
+        
+        Args:
+            matrix: 选择前的特征矩阵
+            columns: 选中的列号
+            
+        Returns:
+            spmatrix: 选择后的特征矩阵
+        """
+        result = sp.csr_matrix(matrix)[:, columns]
+        if self.vectorizer_type == 'tfidf' and self.vectorizer.norm:
+            result = normalize(result, norm=self.vectorizer.norm, copy=False)
+        if getattr(self, 'compact', False):
+            result = compact_matrix(result)
+        return result
+    
+    def get_feature_names_out(self) -> Union[np.ndarray, HashedFeatureNames]:
+        """
+        获取特征名称
+        
+        Returns:
+            Union[np.ndarray, HashedFeatureNames]: 特征名称，哈希向量化器返回按下标生成的占位名称
+        """
+        if self.vectorizer_type == 'hashing':
+            return HashedFeatureNames(self.vectorizer.n_features)
+        if getattr(self, 'compact_vocabulary', None) is not None:
+            return self.compact_vocabulary.feature_names()
+        return self.vectorizer.get_feature_names_out()
+    
+    @staticmethod
+    def _iter_valid_texts(chunks: Iterable[Tuple[List[str], np.ndarray]],
+                          labels: List[np.ndarray]) -> Iterator[str]:
+        """
+        从数据块中逐条产出有效文本，并把对应的标签追加到labels中
+        
+        Args:
+            chunks: (分词后文本列表, 标签数组) 序列
+            labels: 用于收集有效文本标签的列表
+            
+        Yields:
+            str: 有效文本
+            
+        Raises:
+            ValueError: 所有数据块中都没有有效文本
+        """
+        total = 0
+        valid = 0
+        for texts, chunk_labels in chunks:
+            chunk_labels = np.asarray(chunk_labels)
+            keep = [i for i, t in enumerate(texts) if is_valid_document(t)]
+            total += len(texts)
+            valid += len(keep)
+            labels.append(chunk_labels[keep])
+            for i in keep:
+                yield texts[i]
+        
+        if valid < total:
+            logger.warning(f"过滤了{total - valid}个无效文本")
+        if not valid:
+            raise ValueError("过滤后没有有效文本可供向量化")
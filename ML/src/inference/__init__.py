@@ -0,0 +1,5 @@
+"""
+推理包
+
+提供基于已保存工件的新闻真实性预测功能。
+"""
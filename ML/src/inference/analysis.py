@@ -0,0 +1,160 @@
+"""
+分析结果构造模块
+
+将模型输出转换为与桌面客户端Client/Models/AnalysisResult.cs结构一致的字典，
+字段名与C#属性名相同，枚举使用整数值序列化。
+"""
+import uuid
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+
+# Client.Models.ResultType
+RESULT_UNKNOWN = 0
+RESULT_REAL = 1
+RESULT_SUSPICIOUS = 2
+RESULT_FAKE = 3
+
+# Client.Models.FeatureImpact
+IMPACT_NEGATIVE = 0
+IMPACT_NEUTRAL = 1
+IMPACT_POSITIVE = 2
+
+# 与客户端一致的结果类型阈值（基于真实性得分）
+FAKE_THRESHOLD = 0.4
+SUSPICIOUS_THRESHOLD = 0.7
+
+_SUMMARIES = {
+    RESULT_REAL: "该新闻很可能是真实的。模型未发现虚假新闻的常见特征。",
+    RESULT_SUSPICIOUS: "该新闻可能包含误导性信息，建议从其他渠道验证。",
+    RESULT_FAKE: "该新闻很可能是虚假的，请勿轻信和传播。",
+}
+
+
+def model_feature_weights(model: Any) -> Tuple[Optional[np.ndarray], bool]:
+    """
+    提取模型的特征权重，用于解释单条预测
+
+    线性模型使用虚假类别的系数，概率校准后的线性模型使用各校准折系数的平均值，
+    朴素贝叶斯使用两个类别的对数概率差，树模型使用特征重要性（无方向）。
+
+    Args:
+        model: 训练好的模型
+
+    Returns:
+        Tuple[Optional[np.ndarray], bool]: 特征权重（不支持时为None）和权重是否有方向
+    """
+    model = getattr(model, 'best_estimator_', model)
+    if hasattr(model, 'coef_'):
+        return np.asarray(model.coef_).ravel(), True
+    if hasattr(model, 'calibrated_classifiers_'):
+        estimators = [getattr(c, 'estimator', getattr(c, 'base_estimator', None))
+                      for c in model.calibrated_classifiers_]
+        if estimators and all(hasattr(e, 'coef_') for e in estimators):
+            return np.mean([np.asarray(e.coef_).ravel() for e in estimators], axis=0), True
+        return None, False
+    if hasattr(model, 'feature_log_prob_'):
+        log_prob = np.asarray(model.feature_log_prob_)
+        return log_prob[-1] - log_prob[0], True
+    if hasattr(model, 'feature_importances_'):
+        return np.asarray(model.feature_importances_), False
+    return None, False
+
+
+def top_feature_contributions(row: Any, weights: Optional[np.ndarray], signed: bool,
+                              feature_names: np.ndarray, top_k: int = 5) -> List[Tuple[str, float, float, bool]]:
+    """
+    计算单条样本中贡献最大的特征
+
+    Args:
+        row: 单行稀疏特征矩阵
+        weights: 特征权重
+        signed: 权重是否有方向
+        feature_names: 特征名称
+        top_k: 返回的特征数
+
+    Returns:
+        List[Tuple[str, float, float, bool]]: (特征名, 特征值, 贡献, 是否有方向) 列表，按贡献绝对值降序
+    """
+    if weights is None or row.nnz == 0:
+        return []
+
+    indices = row.indices
+    values = row.data
+    contributions = values * weights[indices]
+    order = np.argsort(-np.abs(contributions))[:top_k]
+    return [(str(feature_names[indices[i]]), float(values[i]), float(contributions[i]), signed)
+            for i in order if contributions[i] != 0]
+
+
+def build_analysis_result(record: Dict[str, Any], fake_probability: float,
+                          contributions: List[Tuple[str, float, float, bool]],
+                          model_version: str) -> Dict[str, Any]:
+    """
+    构造与客户端AnalysisResult结构一致的分析结果
+
+    Args:
+        record: 新闻记录（title、content、account_name等）
+        fake_probability: 虚假新闻概率
+        contributions: 贡献最大的特征
+        model_version: 模型工件版本
+
+    Returns:
+        Dict[str, Any]: 分析结果
+    """
+    truth_score = float(np.clip(1.0 - fake_probability, 0.0, 1.0))
+    confidence = float(min(1.0, abs(fake_probability - 0.5) * 2))
+
+    if truth_score < FAKE_THRESHOLD:
+        result_type = RESULT_FAKE
+    elif truth_score < SUSPICIOUS_THRESHOLD:
+        result_type = RESULT_SUSPICIOUS
+    else:
+        result_type = RESULT_REAL
+
+    features = [{
+        'Name': "基础分析",
+        'Value': truth_score,
+        'Description': "模型对标题、来源和内容的综合评估",
+        'Impact': IMPACT_POSITIVE if truth_score >= 0.5 else IMPACT_NEGATIVE,
+        'Importance': 1.0,
+    }]
+
+    total = sum(abs(c) for _, _, c, _ in contributions) or 1.0
+    for term, value, contribution, signed in contributions:
+        if not signed:
+            impact = IMPACT_NEUTRAL
+        else:
+            # 贡献为正表示推向虚假类别，降低真实性
+            impact = IMPACT_NEGATIVE if contribution > 0 else IMPACT_POSITIVE
+        features.append({
+            'Name': term,
+            'Value': value,
+            'Description': f"关键词「{term}」",
+            'Impact': impact,
+            'Importance': abs(contribution) / total,
+        })
+
+    now = datetime.now().isoformat(timespec='seconds')
+    return {
+        'Id': str(uuid.uuid4()),
+        'NewsItem': {
+            'Id': record.get('id') or str(uuid.uuid4()),
+            'Title': record.get('title') or "",
+            'Content': record.get('content') or "",
+            'Source': record.get('account_name') or "",
+            'PublishDate': record.get('publish_date') or now,
+            'Author': record.get('author') or "",
+            'Url': record.get('url') or "",
+            'Keywords': [term for term, _, _, _ in contributions],
+        },
+        'AnalysisTime': now,
+        'ResultType': result_type,
+        'TruthScore': truth_score,
+        'Confidence': confidence,
+        'Summary': _SUMMARIES[result_type],
+        'DetailedAnalysis': f"模型版本 {model_version} 判定该新闻为虚假新闻的概率为 {fake_probability:.2%}。",
+        'Features': features,
+    }
@@ -0,0 +1,247 @@
+"""
+微批处理调度模块
+
+在预测器前放置一个异步队列，把短时间内到达的多个请求合并为一批，
+用一次批量向量化和一次predict_proba完成打分，再把结果分发回各个调用方。
+"""
+import asyncio
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.utils.logger import logger
+
+
+# 批大小分布统计的桶上界
+_BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class MicroBatcher:
+    """微批处理调度器
+
+    请求进入队列后，调度循环取出第一个请求并开始计时，
+    在max_wait_ms内继续收集请求，直到达到max_batch_size或超时，然后提交整批处理。
+    批处理函数在线程池中执行，最多同时运行max_concurrent_batches批。
+    整批处理失败时逐条重试，只有出错的条目把异常返回给其调用方。
+    """
+
+    def __init__(self, process_batch: Callable[[List[Any]], Sequence[Any]],
+                 max_batch_size: int = 32, max_wait_ms: float = 5.0,
+                 max_concurrent_batches: int = 1, executor: Optional[Executor] = None) -> None:
+        """
+        初始化微批处理调度器
+
+        Args:
+            process_batch: 批处理函数，输入一批条目，返回等长的结果序列
+            max_batch_size: 每批最大条目数
+            max_wait_ms: 收集一批的最长等待时间（毫秒）
+            max_concurrent_batches: 同时执行的最大批数
+            executor: 执行批处理函数的线程池，默认使用事件循环的默认线程池
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self.max_concurrent_batches = max(1, int(max_concurrent_batches))
+        self.executor = executor
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._running_batches: set = set()
+
+        # 指标
+        self.batches_total = 0
+        self.items_total = 0
+        self.max_queue_depth = 0
+        self.batch_time_total = 0.0
+        self.failed_batches_total = 0
+        self.failed_items_total = 0
+        self.batch_size_histogram = {bucket: 0 for bucket in _BATCH_SIZE_BUCKETS}
+        self.batch_size_histogram['+Inf'] = 0
+
+    async def start(self) -> None:
+        """在当前事件循环中启动调度循环"""
+        self._queue = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+        logger.info(f"微批处理调度器启动: max_batch_size={self.max_batch_size}, "
+                    f"max_wait_ms={self.max_wait * 1000:.1f}, 并发批数={self.max_concurrent_batches}")
+
+    async def stop(self) -> None:
+        """停止调度循环并等待正在执行的批完成"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        if self._running_batches:
+            await asyncio.gather(*self._running_batches, return_exceptions=True)
+
+    async def submit(self, item: Any) -> Any:
+        """
+        提交单个条目并等待其结果
+
+        Args:
+            item: 待处理条目
+
+        Returns:
+            Any: 该条目的处理结果
+
+        Raises:
+            RuntimeError: 调度器未启动
+        """
+        if self._queue is None:
+            raise RuntimeError("微批处理调度器未启动")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        return await future
+
+    async def submit_many(self, items: Sequence[Any]) -> List[Any]:
+        """
+        提交多个条目并按顺序返回结果，各条目可能被分到不同的批中
+
+        Args:
+            items: 待处理条目
+
+        Returns:
+            List[Any]: 处理结果
+        """
+        return list(await asyncio.gather(*(self.submit(item) for item in items)))
+
+    async def _collect_batch(self) -> List[Tuple[Any, asyncio.Future]]:
+        """等待第一个条目，然后在最长等待时间内收集一批"""
+        assert self._queue is not None
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            # 队列中已有的条目直接取出，不等待
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        """调度循环"""
+        assert self._semaphore is not None
+        while True:
+            batch = await self._collect_batch()
+            await self._semaphore.acquire()
+            task = asyncio.get_running_loop().create_task(self._execute(batch))
+            self._running_batches.add(task)
+            task.add_done_callback(self._running_batches.discard)
+
+    async def _execute(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """在线程池中执行一批并把结果分发给等待的调用方"""
+        assert self._semaphore is not None
+        items = [item for item, _ in batch]
+        start = time.perf_counter()
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.process_batch, items)
+            if len(results) != len(items):
+                raise RuntimeError(f"批处理结果数量({len(results)})与输入数量({len(items)})不一致")
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            self.failed_batches_total += 1
+            if len(batch) == 1:
+                logger.error(f"批处理失败: {str(e)}")
+                self._fail(batch[0][1], e)
+            else:
+                # 一条异常数据不应使同批的其他请求失败，逐条重试以定位出错的条目
+                logger.warning(f"批处理失败，逐条重试{len(batch)}个条目: {str(e)}")
+                try:
+                    outcomes = await asyncio.get_running_loop().run_in_executor(
+                        self.executor, self._process_individually, items)
+                except Exception as retry_error:
+                    outcomes = [(retry_error, None)] * len(batch)
+                for (_, future), (error, result) in zip(batch, outcomes):
+                    if error is not None:
+                        self._fail(future, error)
+                    elif not future.done():
+                        future.set_result(result)
+        finally:
+            self._semaphore.release()
+            self._record_batch(len(items), time.perf_counter() - start)
+
+    def _process_individually(self, items: List[Any]) -> List[Tuple[Optional[Exception], Any]]:
+        """
+        逐条调用批处理函数
+
+        Args:
+            items: 待处理条目
+
+        Returns:
+            List[Tuple[Optional[Exception], Any]]: 每个条目的 (异常, 结果)，成功时异常为None
+        """
+        outcomes = []
+        for item in items:
+            try:
+                results = self.process_batch([item])
+                if len(results) != 1:
+                    raise RuntimeError(f"批处理结果数量({len(results)})与输入数量(1)不一致")
+                outcomes.append((None, results[0]))
+            except Exception as e:
+                logger.error(f"条目处理失败: {str(e)}")
+                outcomes.append((e, None))
+        return outcomes
+
+    def _fail(self, future: asyncio.Future, error: Exception) -> None:
+        """把异常返回给一个调用方"""
+        self.failed_items_total += 1
+        if not future.done():
+            future.set_exception(error)
+
+    def _record_batch(self, size: int, elapsed: float) -> None:
+        """记录批指标"""
+        self.batches_total += 1
+        self.items_total += size
+        self.batch_time_total += elapsed
+        for bucket in _BATCH_SIZE_BUCKETS:
+            if size <= bucket:
+                self.batch_size_histogram[bucket] += 1
+                break
+        else:
+            self.batch_size_histogram['+Inf'] += 1
+        logger.debug(f"完成一批: 大小={size}, 用时={elapsed * 1000:.1f}ms, 队列深度={self.queue_depth}")
+
+    @property
+    def queue_depth(self) -> int:
+        """当前排队等待的条目数"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        导出调度器指标
+
+        Returns:
+            Dict[str, Any]: 队列深度、批数、平均批大小、批大小分布、平均批耗时和失败数
+        """
+        batches = self.batches_total
+        return {
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'running_batches': len(self._running_batches),
+            'batches_total': batches,
+            'items_total': self.items_total,
+            'mean_batch_size': self.items_total / batches if batches else 0.0,
+            'mean_batch_ms': self.batch_time_total * 1000 / batches if batches else 0.0,
+            'failed_batches_total': self.failed_batches_total,
+            'failed_items_total': self.failed_items_total,
+            'batch_size_histogram': {str(k): v for k, v in self.batch_size_histogram.items()},
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000,
+        }
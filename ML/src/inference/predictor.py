@@ -0,0 +1,191 @@
+"""
+新闻预测模块
+
+加载已保存的工件包，对新的新闻文本进行预处理、向量化和打分。
+"""
+import time
+from typing import Dict, Any, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.data.data_loader import FEATURE_COLUMNS
+from src.inference.analysis import (
+    build_analysis_result, model_feature_weights, top_feature_contributions
+)
+from src.data.preprocessor import TextPreprocessor
+from src.utils.artifact_store import ArtifactStore, ArtifactBundle
+from src.utils.logger import logger
+
+
+# 标签中表示虚假新闻的类别
+FAKE_LABEL = 1
+
+
+class NewsPredictor:
+    """新闻预测器
+
+    持有工件包中的向量化器和模型，以及按训练配置构造的预处理器，
+    创建后可重复用于打分，不再重新初始化任何组件。
+    """
+
+    def __init__(self, bundle: ArtifactBundle) -> None:
+        """
+        初始化预测器
+
+        Args:
+            bundle: 工件包
+        """
+        self.bundle = bundle
+        self.vectorizer = bundle.vectorizer
+        self.model = bundle.model
+
+        # 推理时每批文本较少，使用单进程分词且不访问分词缓存；jieba用户词典使用工件中的副本
+        preprocessing_config = bundle.preprocessing_config()
+        preprocessing_config.update(n_workers=1, cache={'enabled': False})
+        self.preprocessor = TextPreprocessor(bundle.stopwords, preprocessing_config)
+        bundle.check_dictionaries(self.preprocessor.tokenization_settings()['dictionaries'])
+
+        classes = list(getattr(self.model, 'classes_', [0, 1]))
+        self._fake_index = classes.index(FAKE_LABEL) if FAKE_LABEL in classes else len(classes) - 1
+        self._feature_weights, self._weights_signed = model_feature_weights(self.model)
+        self._feature_names: Optional[Sequence[str]] = None
+
+        logger.info(f"预测器就绪: 版本={bundle.version}, 模型={type(self.model).__name__}")
+
+    @classmethod
+    def load(cls, version: Optional[str] = None, store: Optional[ArtifactStore] = None) -> 'NewsPredictor':
+        """
+        从工件存储加载预测器
+
+        Args:
+            version: 版本号，默认加载最新版本
+            store: 工件存储，默认按配置创建
+
+        Returns:
+            NewsPredictor: 预测器
+        """
+        store = store or ArtifactStore()
+        return cls(store.load(version))
+
+    @staticmethod
+    def to_frame(records: Sequence[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        将新闻记录转换为预处理器使用的数据框
+
+        Args:
+            records: 新闻记录，键为title、account_name、content
+
+        Returns:
+            pd.DataFrame: 包含特征列的数据框
+        """
+        return pd.DataFrame({
+            FEATURE_COLUMNS[0]: [r.get('title') or "" for r in records],
+            FEATURE_COLUMNS[1]: [r.get('account_name') or "" for r in records],
+            FEATURE_COLUMNS[2]: [r.get('content') or "" for r in records],
+        })
+
+    def vectorize(self, records: Sequence[Dict[str, Any]]):
+        """
+        对新闻记录进行预处理和向量化
+
+        Args:
+            records: 新闻记录
+
+        Returns:
+            spmatrix: 与输入逐行对应的稀疏特征矩阵
+        """
+        texts = self.preprocessor.preprocess_frame(self.to_frame(records))
+        return self.vectorizer.transform(texts, keep_empty=True)
+
+    def predict_proba(self, records: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """
+        计算新闻为虚假新闻的概率
+
+        Args:
+            records: 新闻记录
+
+        Returns:
+            np.ndarray: 每条记录为虚假新闻的概率
+        """
+        if not records:
+            return np.zeros(0)
+
+        start = time.perf_counter()
+        features = self.vectorize(records)
+        probabilities = self.model.predict_proba(features)[:, self._fake_index]
+        logger.debug(f"预测{len(records)}条记录, 用时{(time.perf_counter() - start) * 1000:.1f}ms")
+        return probabilities
+
+    def predict(self, records: Sequence[Dict[str, Any]], threshold: float = 0.5) -> List[int]:
+        """
+        预测新闻标签
+
+        Args:
+            records: 新闻记录
+            threshold: 判定为虚假新闻的概率阈值
+
+        Returns:
+            List[int]: 预测标签，1表示虚假新闻
+        """
+        return [int(p >= threshold) for p in self.predict_proba(records)]
+
+    def warm_up(self) -> None:
+        """
+        预热预测器
+
+        先显式初始化并预热分词器（加载jieba前缀词典缓存和用户词典），再执行一次完整的预测，
+        触发其余惰性初始化，使首个请求的延迟可预期。
+        """
+        start = time.perf_counter()
+        self.preprocessor.warm_up()
+        self.analyze([{'title': "预热", 'account_name': "", 'content': "预热文本"}])
+        logger.info(f"预测器预热完成, 用时{(time.perf_counter() - start) * 1000:.0f}ms")
+
+    @property
+    def feature_names(self) -> Sequence[str]:
+        """向量化器的特征名称，首次访问时生成"""
+        if self._feature_names is None:
+            self._feature_names = self.vectorizer.get_feature_names_out()
+        return self._feature_names
+
+    def analyze(self, records: Sequence[Dict[str, Any]], top_k: int = 5) -> List[Dict[str, Any]]:
+        """
+        分析新闻并生成与客户端AnalysisResult结构一致的结果
+
+        Args:
+            records: 新闻记录
+            top_k: 每条结果中列出的关键特征数
+
+        Returns:
+            List[Dict[str, Any]]: 分析结果列表
+        """
+        if not records:
+            return []
+
+        features = self.vectorize(records)
+        probabilities = self.model.predict_proba(features)[:, self._fake_index]
+        return self.build_results(records, features, probabilities, top_k)
+
+    def build_results(self, records: Sequence[Dict[str, Any]], features: Any,
+                      probabilities: np.ndarray, top_k: int = 5) -> List[Dict[str, Any]]:
+        """
+        根据特征矩阵和预测概率构造分析结果
+
+        Args:
+            records: 新闻记录
+            features: 与记录逐行对应的稀疏特征矩阵
+            probabilities: 虚假新闻概率
+            top_k: 每条结果中列出的关键特征数
+
+        Returns:
+            List[Dict[str, Any]]: 分析结果列表
+        """
+        features = features.tocsr()
+        results = []
+        for i, record in enumerate(records):
+            contributions = top_feature_contributions(
+                features[i], self._feature_weights, self._weights_signed, self.feature_names, top_k)
+            results.append(build_analysis_result(
+                record, float(probabilities[i]), contributions, self.bundle.version))
+        return results
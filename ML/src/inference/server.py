@@ -0,0 +1,230 @@
+"""
+HTTP推理服务模块
+
+为桌面客户端提供异步HTTP分析接口，对应Client/Services/Interfaces/IAnalysisService.cs。
+服务启动时加载一次模型工件并预热分词器，之后所有请求共享同一个预测器，
+CPU密集的预处理和打分在线程池中执行，不阻塞事件循环。
+启用微批处理时，并发到达的请求会被合并为一批统一向量化和打分。
+
+接口:
+    GET  /api/health             服务和模型状态
+    GET  /api/metrics            微批处理队列深度和批大小等指标
+    POST /api/analysis/text      分析标题和内容 {"title": ..., "content": ...}
+    POST /api/analysis/news      分析新闻项 {"Title": ..., "Content": ..., "Source": ...}
+    POST /api/analysis/batch     批量分析 {"items": [新闻项, ...]}
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+
+from src.inference.batcher import MicroBatcher
+from src.inference.predictor import NewsPredictor
+from src.utils.config_loader import CONFIG
+from src.utils.logger import logger
+
+try:
+    from aiohttp import web
+except ImportError:  # aiohttp为可选依赖
+    web = None
+
+
+def record_from_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    将请求中的新闻数据转换为预测器使用的记录
+
+    同时接受客户端NewsItem的PascalCase字段和小写字段。
+
+    Args:
+        payload: 请求中的新闻数据
+
+    Returns:
+        Dict[str, Any]: 新闻记录
+    """
+    def pick(*names: str) -> Any:
+        for name in names:
+            if payload.get(name):
+                return payload[name]
+        return None
+
+    return {
+        'id': pick('Id', 'id'),
+        'title': pick('Title', 'title') or "",
+        'content': pick('Content', 'content') or "",
+        'account_name': pick('Source', 'source', 'AccountName', 'account_name') or "",
+        'author': pick('Author', 'author'),
+        'url': pick('Url', 'url'),
+        'publish_date': pick('PublishDate', 'publish_date'),
+    }
+
+
+class InferenceService:
+    """推理服务
+
+    持有预测器和线程池，负责将HTTP请求转换为预测调用。
+    """
+
+    def __init__(self, predictor: NewsPredictor, workers: int = 4, max_batch_items: int = 256,
+                 batching: Optional[Dict[str, Any]] = None) -> None:
+        """
+        初始化推理服务
+
+        Args:
+            predictor: 已加载的预测器
+            workers: 执行预测的线程数
+            max_batch_items: 批量接口单次请求允许的最大条数
+            batching: 微批处理配置（enabled、max_batch_size、max_wait_ms），为None时不启用
+        """
+        self.predictor = predictor
+        self.max_batch_items = max_batch_items
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='inference')
+        self.started_at = time.time()
+        self.request_count = 0
+
+        self.batcher: Optional[MicroBatcher] = None
+        if batching and batching.get('enabled', False):
+            self.batcher = MicroBatcher(
+                predictor.analyze,
+                max_batch_size=batching.get('max_batch_size', 32),
+                max_wait_ms=batching.get('max_wait_ms', 5),
+                max_concurrent_batches=workers,
+                executor=self.executor
+            )
+
+    async def analyze(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        在线程池中分析新闻记录
+
+        Args:
+            records: 新闻记录
+
+        Returns:
+            List[Dict[str, Any]]: 分析结果
+        """
+        self.request_count += len(records)
+        if self.batcher is not None:
+            return await self.batcher.submit_many(records)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.predictor.analyze, records)
+
+    async def handle_health(self, request: 'web.Request') -> 'web.Response':
+        """健康检查接口"""
+        return web.json_response({
+            'status': 'ok',
+            'model_version': self.predictor.bundle.version,
+            'model': type(self.predictor.model).__name__,
+            'uptime_seconds': round(time.time() - self.started_at, 1),
+            'analyzed': self.request_count,
+        })
+
+    async def handle_metrics(self, request: 'web.Request') -> 'web.Response':
+        """微批处理指标接口"""
+        return web.json_response({
+            'analyzed': self.request_count,
+            'batching': self.batcher.metrics() if self.batcher is not None else None,
+        })
+
+    async def handle_text(self, request: 'web.Request') -> 'web.Response':
+        """分析标题和内容，对应AnalyzeTextAsync"""
+        payload = await self._read_json(request)
+        record = record_from_payload(payload)
+        if not record['content'].strip():
+            raise web.HTTPBadRequest(reason="内容不能为空")
+        results = await self.analyze([record])
+        return web.json_response(results[0])
+
+    async def handle_news(self, request: 'web.Request') -> 'web.Response':
+        """分析新闻项，对应AnalyzeNewsAsync"""
+        payload = await self._read_json(request)
+        results = await self.analyze([record_from_payload(payload)])
+        return web.json_response(results[0])
+
+    async def handle_batch(self, request: 'web.Request') -> 'web.Response':
+        """批量分析新闻项"""
+        payload = await self._read_json(request)
+        items = payload.get('items', payload.get('Items'))
+        if not isinstance(items, list):
+            raise web.HTTPBadRequest(reason="请求体需要包含items列表")
+        if len(items) > self.max_batch_items:
+            raise web.HTTPRequestEntityTooLarge(max_size=self.max_batch_items, actual_size=len(items))
+        results = await self.analyze([record_from_payload(item) for item in items])
+        return web.json_response({'results': results})
+
+    @staticmethod
+    async def _read_json(request: 'web.Request') -> Dict[str, Any]:
+        """读取并校验JSON请求体"""
+        try:
+            payload = await request.json()
+        except ValueError:
+            raise web.HTTPBadRequest(reason="请求体不是有效的JSON")
+        if not isinstance(payload, dict):
+            raise web.HTTPBadRequest(reason="请求体必须是JSON对象")
+        return payload
+
+    async def start(self, app: 'web.Application') -> None:
+        """在服务的事件循环中启动微批处理调度器"""
+        if self.batcher is not None:
+            await self.batcher.start()
+
+    async def close(self, app: 'web.Application') -> None:
+        """停止微批处理调度器并关闭线程池"""
+        if self.batcher is not None:
+            await self.batcher.stop()
+        self.executor.shutdown(wait=False)
+
+
+def create_app(service: InferenceService) -> 'web.Application':
+    """
+    创建aiohttp应用
+
+    Args:
+        service: 推理服务
+
+    Returns:
+        web.Application: 应用实例
+    """
+    app = web.Application()
+    app.add_routes([
+        web.get('/api/health', service.handle_health),
+        web.get('/api/metrics', service.handle_metrics),
+        web.post('/api/analysis/text', service.handle_text),
+        web.post('/api/analysis/news', service.handle_news),
+        web.post('/api/analysis/batch', service.handle_batch),
+    ])
+    app.on_startup.append(service.start)
+    app.on_cleanup.append(service.close)
+    return app
+
+
+def run_server(host: Optional[str] = None, port: Optional[int] = None,
+               version: Optional[str] = None) -> None:
+    """
+    加载模型并启动HTTP推理服务
+
+    Args:
+        host: 监听地址，默认使用配置中的server.host
+        port: 监听端口，默认使用配置中的server.port
+        version: 模型工件版本，默认使用配置中的server.model_version或最新版本
+
+    Raises:
+        ImportError: 未安装aiohttp
+    """
+    if web is None:
+        raise ImportError("HTTP推理服务需要aiohttp，请安装: pip install aiohttp")
+
+    config = CONFIG.get('server', {})
+    host = host or config.get('host', '127.0.0.1')
+    port = port or config.get('port', 5000)
+
+    predictor = NewsPredictor.load(version or config.get('model_version'))
+    predictor.warm_up()
+
+    service = InferenceService(
+        predictor,
+        workers=config.get('workers', 4),
+        max_batch_items=config.get('max_batch_items', 256),
+        batching=config.get('batching')
+    )
+    logger.info(f"HTTP推理服务启动: http://{host}:{port}, 模型版本: {predictor.bundle.version}")
+    web.run_app(create_app(service), host=host, port=port, print=None)
@@ -1,16 +1,23 @@
 """
 模型包
 
-提供各种机器学习模型的训练函数，支持朴素贝叶斯、随机森林、支持向量机和逻辑回归等算法。
+提供各种机器学习模型的训练函数，支持朴素贝叶斯、随机森林、支持向量机、逻辑回归和SGD线性模型等算法，
+以及基于partial_fit的外存增量训练。
 """
 from src.models.naive_bayes import train_naive_bayes
 from src.models.random_forest import train_random_forest
 from src.models.svm import train_svm
 from src.models.logistic_regression import train_logistic_regression
+from src.models.sgd import train_sgd
+from src.models.incremental import train_incremental, predict_stream, PARTIAL_FIT_MODELS
 
 __all__ = [
     'train_naive_bayes',
     'train_random_forest',
     'train_svm',
-    'train_logistic_regression'
+    'train_logistic_regression',
+    'train_sgd',
+    'train_incremental',
+    'predict_stream',
+    'PARTIAL_FIT_MODELS'
 ] 
\ No newline at end of file
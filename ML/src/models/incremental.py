@@ -0,0 +1,150 @@
+"""
+外存增量训练模块
+
+配合哈希向量化器和partial_fit逐块训练模型，每次只有一个数据块驻留在内存中，
+可以在超出内存的语料上训练。支持的模型:
+    naive_bayes: MultinomialNB
+    sgd: SGDClassifier（log_loss对应逻辑回归，hinge/modified_huber对应线性SVM）
+"""
+import time
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sklearn.naive_bayes import MultinomialNB
+
+from src.features.vectorizers import TextVectorizer, is_valid_document
+from src.models.sgd import build_sgd_classifier
+from src.utils.config_loader import CONFIG
+from src.utils.logger import logger
+
+
+PARTIAL_FIT_MODELS = ('naive_bayes', 'sgd')
+
+# 标签取值：0为真实新闻，1为虚假新闻
+CLASSES = np.array([0, 1])
+
+
+def build_partial_fit_model(model_type: str):
+    """
+    按配置创建支持partial_fit的模型
+    
+    Args:
+        model_type: 模型类型，'naive_bayes'或'sgd'
+    
+    Returns:
+        object: 未训练的模型
+    
+    Raises:
+        ValueError: 模型不支持增量训练
+    """
+    if model_type == 'naive_bayes':
+        config = CONFIG['models']['naive_bayes']
+        return MultinomialNB(alpha=config.get('alpha', 1.0), fit_prior=config.get('fit_prior', True))
+    if model_type == 'sgd':
+        return build_sgd_classifier()
+    
+    error_msg = f"模型{model_type}不支持增量训练，支持的模型: {', '.join(PARTIAL_FIT_MODELS)}"
+    logger.error(error_msg)
+    raise ValueError(error_msg)
+
+
+def _valid_rows(texts: List[str], labels: np.ndarray) -> Tuple[List[str], np.ndarray]:
+    """过滤数据块中的无效文本及其标签"""
+    keep = [i for i, t in enumerate(texts) if is_valid_document(t)]
+    return [texts[i] for i in keep], np.asarray(labels)[keep]
+
+
+def train_incremental(chunk_source: Callable[[], Iterable[Tuple[List[str], np.ndarray]]],
+                      vectorizer: TextVectorizer, model_type: str,
+                      progress_callback: Optional[Callable] = None):
+    """
+    逐块增量训练模型
+    
+    第一轮遍历时每个数据块先更新向量化器的在线IDF估计，再用当前估计加权后送入partial_fit；
+    之后的轮次（仅sgd，由models.sgd.epochs控制）只使用已累积的IDF，不重复计数。
+    
+    Args:
+        chunk_source: 每次调用返回一个新的 (分词后文本列表, 标签数组) 序列，多轮训练时会被调用多次
+        vectorizer: 哈希向量化器
+        model_type: 模型类型，'naive_bayes'或'sgd'
+        progress_callback: 进度回调函数
+    
+    Returns:
+        Tuple[object, int]: 训练好的模型和参与训练的样本数
+    
+    Raises:
+        ValueError: 模型不支持增量训练、向量化器不是哈希向量化器或没有有效文本
+    """
+    if vectorizer.vectorizer_type != 'hashing':
+        raise ValueError("增量训练需要哈希向量化器，tfidf和count需要完整语料构建词汇表")
+    
+    model = build_partial_fit_model(model_type)
+    # 朴素贝叶斯的计数会随轮次重复累加，只遍历一次
+    epochs = max(1, int(CONFIG['models']['sgd'].get('epochs', 1))) if model_type == 'sgd' else 1
+    
+    if progress_callback:
+        progress_callback(f"增量训练{model_type}模型")
+    
+    logger.info(f"开始增量训练: 模型={model_type}, 轮数={epochs}")
+    start = time.perf_counter()
+    n_samples = 0
+    for epoch in range(epochs):
+        n_samples = 0
+        for chunk_index, (texts, labels) in enumerate(chunk_source()):
+            texts, labels = _valid_rows(texts, labels)
+            if not texts:
+                continue
+            
+            if epoch == 0:
+                features = vectorizer.partial_fit_transform(texts)
+            else:
+                features = vectorizer.transform_texts(texts)
+            model.partial_fit(features, labels, classes=CLASSES)
+            
+            n_samples += len(texts)
+            logger.debug(f"第{epoch + 1}轮第{chunk_index + 1}块: {len(texts)}条, 累计{n_samples}条")
+        
+        if not n_samples:
+            raise ValueError("过滤后没有有效文本可供训练")
+        logger.info(f"第{epoch + 1}/{epochs}轮增量训练完成: {n_samples}条, "
+                    f"用时{time.perf_counter() - start:.1f}s")
+    
+    if progress_callback:
+        progress_callback(20)
+    
+    logger.info(f"增量训练完成: 样本数={n_samples}, 用时{time.perf_counter() - start:.1f}s")
+    return model, n_samples
+
+
+def predict_stream(chunks: Iterable[Tuple[List[str], np.ndarray]], vectorizer: TextVectorizer,
+                   model) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    """
+    逐块预测，只保留标签和预测结果
+    
+    Args:
+        chunks: (分词后文本列表, 标签数组) 序列
+        vectorizer: 已拟合的向量化器
+        model: 训练好的模型
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]: 真实标签、预测标签和虚假新闻概率（模型不支持概率时为None）
+    
+    Raises:
+        ValueError: 没有有效文本
+    """
+    y_true, y_pred, y_score = [], [], []
+    has_proba = hasattr(model, 'predict_proba')
+    for texts, labels in chunks:
+        texts, labels = _valid_rows(texts, labels)
+        if not texts:
+            continue
+        
+        features = vectorizer.transform_texts(texts)
+        y_true.append(labels)
+        y_pred.append(model.predict(features))
+        if has_proba:
+            y_score.append(model.predict_proba(features)[:, 1])
+    
+    if not y_true:
+        raise ValueError("过滤后没有有效文本可供预测")
+    return np.concatenate(y_true), np.concatenate(y_pred), np.concatenate(y_score) if has_proba else None
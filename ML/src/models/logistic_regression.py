@@ -1,7 +1,11 @@
 """
 逻辑回归模型模块
 """
+import time
+
+import numpy as np
 from sklearn.linear_model import LogisticRegression
+from src.models.search import warm_start_path_search
 from src.utils.config_loader import CONFIG
 from src.utils.logger import logger
 
@@ -10,6 +14,10 @@ def train_logistic_regression(x_train, y_train, progress_callback=None):
     """
     训练逻辑回归模型
     
+    求解器由models.logistic_regression.solver配置，稀疏TF-IDF特征上saga/liblinear通常比默认的lbfgs更快。
+    启用path时按C从小到大（正则化从强到弱）依次拟合，每一步以上一步的解为起点（warm_start），
+    按交叉验证得分选出最佳C后在全部训练数据上重新拟合。
+    
     Args:
         x_train: 训练特征
         y_train: 训练标签
@@ -26,22 +34,44 @@ def train_logistic_regression(x_train, y_train, progress_callback=None):
     C = config.get('C', 1.0)
     max_iter = config.get('max_iter', 100)
     random_state = config.get('random_state', 42)
+    solver = config.get('solver', 'lbfgs')
+    tol = config.get('tol', 1e-4)
+    path_config = config.get('path', {}) or {}
     
-    logger.info(f"训练逻辑回归模型: C={C}, max_iter={max_iter}, random_state={random_state}")
+    logger.info(f"训练逻辑回归模型: C={C}, solver={solver}, max_iter={max_iter}, tol={tol}, "
+                f"random_state={random_state}, 正则化路径={path_config.get('enabled', False)}")
     
     # 初始化模型
-    model = LogisticRegression(
+    base_model = LogisticRegression(
         C=C,
+        solver=solver,
         max_iter=max_iter,
+        tol=tol,
         random_state=random_state
     )
     
+    if path_config.get('enabled', False):
+        Cs = sorted(path_config.get('Cs', [0.01, 0.1, 1.0, 10.0, 100.0]))
+        if solver == 'liblinear':
+            logger.warning("liblinear求解器不支持warm_start，正则化路径上的每个C都会从头拟合")
+        
+        best_params, best_score, _ = warm_start_path_search(
+            base_model, {}, "C", Cs, x_train, y_train, CONFIG['evaluation'].get('cv_folds', 5),
+            path_config.get('n_jobs', None), "逻辑回归")
+        logger.info(f"逻辑回归最佳参数: {best_params}, 交叉验证结果: {best_score:.4f}")
+        base_model.set_params(**best_params)
+    
     # 训练模型
-    model.fit(x_train, y_train)
+    start = time.perf_counter()
+    model = base_model.fit(x_train, y_train)
+    logger.info(f"逻辑回归拟合完成: C={model.C}, 迭代次数={int(np.max(model.n_iter_))}, "
+                f"用时{time.perf_counter() - start:.2f}s")
+    if np.max(model.n_iter_) >= max_iter:
+        logger.warning(f"逻辑回归达到最大迭代次数{max_iter}仍未收敛，可以增大max_iter或改用saga/liblinear求解器")
     
     if progress_callback:
         # 逻辑回归训练通常比较快，分配中等的进度增量
         progress_callback(8)
     
     logger.info("逻辑回归模型训练完成")
-    return model 
\ No newline at end of file
+    return model 
@@ -1,8 +1,10 @@
 """
 随机森林模型模块
 """
+import time
+
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import GridSearchCV
+from src.models.search import PathSearchResult, run_search, warm_start_path_search
 from src.utils.config_loader import CONFIG
 from src.utils.logger import logger
 
@@ -11,6 +13,11 @@ def train_random_forest(x_train, y_train, progress_callback=None):
     """
     训练随机森林模型
     
+    超参数搜索策略由models.random_forest.search.strategy控制:
+        grid: GridSearchCV网格搜索
+        halving_grid / halving_random: 逐次减半搜索
+        warm_start: 对每个max_depth按n_estimators从小到大追加树，复用已训练的树
+    
     Args:
         x_train: 训练特征
         y_train: 训练标签
@@ -25,9 +32,12 @@ def train_random_forest(x_train, y_train, progress_callback=None):
     max_depth = config.get('max_depth', [5, 8, 15])
     random_state = config.get('random_state', 42)
     cv_folds = CONFIG['evaluation'].get('cv_folds', 5)
+    search_config = config.get('search', {}) or {}
+    strategy = search_config.get('strategy', 'grid')
+    n_jobs = search_config.get('n_jobs', None)
     
     logger.info(f"训练随机森林模型: n_estimators={n_estimators}, max_depth={max_depth}, "
-               f"random_state={random_state}, cv_folds={cv_folds}")
+               f"random_state={random_state}, cv_folds={cv_folds}, 搜索策略={strategy}, n_jobs={n_jobs}")
     
     # 初始化基础模型
     base_model = RandomForestClassifier(random_state=random_state)
@@ -42,22 +52,34 @@ def train_random_forest(x_train, y_train, progress_callback=None):
         "max_depth": max_depth
     }
     
-    logger.info("开始随机森林模型网格搜索")
-    model = GridSearchCV(base_model, param_grid=param_grid, cv=cv_folds)
-    
     # 训练模型
     if progress_callback:
         progress_callback("训练随机森林模型")
     
-    model.fit(x_train, y_train)
+    if strategy == 'warm_start':
+        best_params, best_score, results = warm_start_path_search(
+            base_model, {"max_depth": max_depth}, "n_estimators", sorted(n_estimators),
+            x_train, y_train, cv_folds, n_jobs, "随机森林")
+        
+        # 使用最佳参数在全部训练数据上重新拟合；拟合后恢复默认的n_jobs，
+        # 否则n_jobs会随模型保存到工件中，推理服务的每次predict_proba都占用全部CPU核心
+        start = time.perf_counter()
+        best_model = RandomForestClassifier(random_state=random_state, n_jobs=n_jobs, **best_params)
+        best_model.fit(x_train, y_train)
+        best_model.set_params(n_jobs=None)
+        logger.info(f"随机森林最佳参数重新拟合完成, 用时{time.perf_counter() - start:.1f}s")
+        model = PathSearchResult(best_model, best_params, best_score, results)
+    else:
+        model = run_search(base_model, param_grid, x_train, y_train, cv_folds, search_config, "随机森林")
+        best_params, best_score = model.best_params_, model.best_score_
     
     if progress_callback:
         # 随机森林训练和网格搜索较慢，分配较大的进度增量
         progress_callback(15)
     
     # 输出最佳参数
-    logger.info(f"随机森林最佳参数: {model.best_params_}")
-    logger.info(f"随机森林最佳交叉验证结果: {model.best_score_:.4f}")
+    logger.info(f"随机森林最佳参数: {best_params}")
+    logger.info(f"随机森林最佳交叉验证结果: {best_score:.4f}")
     
     logger.info("随机森林模型训练完成")
-    return model 
\ No newline at end of file
+    return model
@@ -0,0 +1,227 @@
+"""
+超参数搜索模块
+
+提供可配置的超参数搜索：网格搜索、逐次减半搜索（HalvingGridSearchCV/HalvingRandomSearchCV）
+以及沿一个参数路径使用warm_start复用已训练结果的交叉验证搜索。
+所有方式都会在日志中输出每个候选参数的耗时和得分。
+warm_start路径搜索把稀疏训练矩阵发布到共享内存，各并行任务只接收句柄。
+"""
+import time
+from itertools import product
+from typing import Dict, Any, List, Tuple, Sequence
+
+import numpy as np
+from joblib import Parallel, delayed
+from scipy.sparse import issparse
+from sklearn.base import clone
+from sklearn.model_selection import GridSearchCV, check_cv
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import HalvingGridSearchCV, HalvingRandomSearchCV
+
+from src.utils.shared_csr import SharedCSRMatrix, attach_csr, shared_handle
+from src.utils.logger import logger
+
+
+SEARCH_STRATEGIES = ('grid', 'halving_grid', 'halving_random', 'warm_start')
+
+
+class PathSearchResult:
+    """warm_start路径搜索的结果
+
+    与GridSearchCV一样提供best_estimator_、best_params_、best_score_和cv_results_，
+    预测委托给最佳模型，调用方（评估、多模型对比、工件保存）不需要区分搜索策略。
+    """
+
+    def __init__(self, best_estimator: Any, best_params: Dict[str, Any], best_score: float,
+                 results: List[Dict[str, Any]]) -> None:
+        """
+        Args:
+            best_estimator: 以最佳参数在全部训练数据上拟合的模型
+            best_params: 最佳参数
+            best_score: 最佳平均交叉验证得分
+            results: warm_start_path_search返回的每个候选的结果
+        """
+        self.best_estimator_ = best_estimator
+        self.best_params_ = best_params
+        self.best_score_ = best_score
+        self.cv_results_ = results
+
+    @property
+    def classes_(self) -> np.ndarray:
+        return self.best_estimator_.classes_
+
+    def predict(self, x: Any) -> np.ndarray:
+        return self.best_estimator_.predict(x)
+
+    def predict_proba(self, x: Any) -> np.ndarray:
+        return self.best_estimator_.predict_proba(x)
+
+
+def log_candidate_timings(search: Any, name: str) -> None:
+    """
+    在日志中输出搜索对象中每个候选参数的拟合耗时和得分
+
+    Args:
+        search: 已拟合的GridSearchCV或Halving*SearchCV
+        name: 模型名称
+    """
+    results = search.cv_results_
+    iterations = results.get('iter')
+    n_resources = results.get('n_resources')
+    for i, params in enumerate(results['params']):
+        stage = ""
+        if iterations is not None:
+            stage = f", 轮次={iterations[i]}, 样本数={n_resources[i]}"
+        logger.info(f"{name}候选参数 {params}: 平均拟合耗时={results['mean_fit_time'][i]:.2f}s, "
+                    f"平均预测耗时={results['mean_score_time'][i]:.2f}s, "
+                    f"交叉验证得分={results['mean_test_score'][i]:.4f}{stage}")
+
+
+def run_search(estimator: Any, param_grid: Dict[str, Sequence[Any]], x_train: Any, y_train: Any,
+               cv_folds: int, search_config: Dict[str, Any], name: str) -> Any:
+    """
+    按配置执行网格搜索或逐次减半搜索
+
+    Args:
+        estimator: 基础模型
+        param_grid: 参数网格
+        x_train: 训练特征
+        y_train: 训练标签
+        cv_folds: 交叉验证折数
+        search_config: 搜索配置（strategy、n_jobs、factor、n_candidates）
+        name: 模型名称，用于日志
+
+    Returns:
+        Any: 已拟合的搜索对象
+
+    Raises:
+        ValueError: 不支持的搜索策略
+    """
+    strategy = search_config.get('strategy', 'grid')
+    n_jobs = search_config.get('n_jobs', None)
+    random_state = getattr(estimator, 'random_state', None)
+
+    if strategy == 'grid':
+        search = GridSearchCV(estimator, param_grid=param_grid, cv=cv_folds, n_jobs=n_jobs)
+    elif strategy == 'halving_grid':
+        search = HalvingGridSearchCV(
+            estimator, param_grid=param_grid, cv=cv_folds, n_jobs=n_jobs,
+            factor=search_config.get('factor', 3), random_state=random_state
+        )
+    elif strategy == 'halving_random':
+        search = HalvingRandomSearchCV(
+            estimator, param_distributions=param_grid, cv=cv_folds, n_jobs=n_jobs,
+            factor=search_config.get('factor', 3),
+            n_candidates=search_config.get('n_candidates', 'exhaust'),
+            random_state=random_state
+        )
+    else:
+        raise ValueError(f"不支持的搜索策略: {strategy}，支持的策略: {', '.join(SEARCH_STRATEGIES)}")
+
+    logger.info(f"开始{name}超参数搜索: 策略={strategy}, n_jobs={n_jobs}, 参数网格={param_grid}")
+    start = time.perf_counter()
+    search.fit(x_train, y_train)
+    logger.info(f"{name}超参数搜索完成, 用时{time.perf_counter() - start:.1f}s")
+
+    log_candidate_timings(search, name)
+    return search
+
+
+def _fit_path_on_fold(estimator: Any, fixed_params: Dict[str, Any], path_param: str,
+                      path_values: Sequence[Any], x_train: Any, y_train: Any,
+                      train_idx: np.ndarray, test_idx: np.ndarray) -> List[Tuple[float, float]]:
+    """
+    在一个交叉验证折上沿参数路径依次拟合，利用warm_start复用上一步的结果
+
+    Args:
+        estimator: 基础模型（需支持warm_start）
+        fixed_params: 本次路径中保持不变的参数
+        path_param: 沿路径变化的参数名
+        path_values: 路径上的参数值，按顺序拟合
+        x_train: 全部训练特征，稀疏矩阵以共享内存句柄（dict）传入
+        y_train: 全部训练标签
+        train_idx: 本折训练样本下标
+        test_idx: 本折验证样本下标
+
+    Returns:
+        List[Tuple[float, float]]: 路径上每个点的 (验证得分, 增量拟合耗时)
+    """
+    if isinstance(x_train, dict):
+        x_train = attach_csr(x_train)
+    model = clone(estimator).set_params(warm_start=True, **fixed_params)
+    x_fold, y_fold = x_train[train_idx], y_train[train_idx]
+    x_val, y_val = x_train[test_idx], y_train[test_idx]
+
+    points = []
+    for value in path_values:
+        start = time.perf_counter()
+        model.set_params(**{path_param: value})
+        model.fit(x_fold, y_fold)
+        elapsed = time.perf_counter() - start
+        points.append((model.score(x_val, y_val), elapsed))
+    return points
+
+
+def warm_start_path_search(estimator: Any, fixed_grid: Dict[str, Sequence[Any]], path_param: str,
+                           path_values: Sequence[Any], x_train: Any, y_train: Any, cv_folds: int,
+                           n_jobs: Any, name: str) -> Tuple[Dict[str, Any], float, List[Dict[str, Any]]]:
+    """
+    沿参数路径的warm_start交叉验证搜索
+
+    对fixed_grid中的每组参数和每个交叉验证折，按path_values顺序依次拟合同一个模型，
+    每一步只在上一步的基础上继续训练（如随机森林追加树、逻辑回归从上一个解开始迭代）。
+    各 (参数组, 折) 任务通过joblib并行执行。
+
+    Args:
+        estimator: 基础模型（需支持warm_start）
+        fixed_grid: 路径之外的参数网格
+        path_param: 沿路径变化的参数名
+        path_values: 路径上的参数值，按顺序拟合
+        x_train: 训练特征
+        y_train: 训练标签
+        cv_folds: 交叉验证折数
+        n_jobs: 并行任务数
+        name: 模型名称，用于日志
+
+    Returns:
+        Tuple[Dict[str, Any], float, List[Dict[str, Any]]]: 最佳参数、最佳平均得分和每个候选的结果
+    """
+    y_train = np.asarray(y_train)
+    splits = list(check_cv(cv_folds, y_train, classifier=True).split(x_train, y_train))
+    keys = list(fixed_grid)
+    combos = [dict(zip(keys, values)) for values in product(*(fixed_grid[k] for k in keys))]
+
+    logger.info(f"开始{name}warm_start路径搜索: 路径参数={path_param}{list(path_values)}, "
+                f"其他参数组合={len(combos)}, 折数={len(splits)}, n_jobs={n_jobs}")
+    start = time.perf_counter()
+    # 稀疏矩阵只复制到共享内存一次，各任务在共享内存上构造视图；
+    # 矩阵本身已在共享内存中（如多模型对比的工作进程）时直接复用其句柄
+    handle = shared_handle(x_train)
+    shared = SharedCSRMatrix(x_train) if handle is None and issparse(x_train) else None
+    try:
+        if shared is not None:
+            handle = shared.handle
+        x_arg = handle if handle is not None else x_train
+        fold_points = Parallel(n_jobs=n_jobs)(
+            delayed(_fit_path_on_fold)(estimator, combo, path_param, path_values,
+                                       x_arg, y_train, train_idx, test_idx)
+            for combo in combos for train_idx, test_idx in splits
+        )
+    finally:
+        if shared is not None:
+            shared.close()
+
+    results = []
+    n_folds = len(splits)
+    for c, combo in enumerate(combos):
+        points = np.array(fold_points[c * n_folds:(c + 1) * n_folds])  # (折数, 路径长度, 2)
+        for p, value in enumerate(path_values):
+            params = dict(combo, **{path_param: value})
+            score = float(points[:, p, 0].mean())
+            fit_time = float(points[:, p, 1].mean())
+            results.append({'params': params, 'mean_test_score': score, 'mean_incremental_fit_time': fit_time})
+            logger.info(f"{name}候选参数 {params}: 平均增量拟合耗时={fit_time:.2f}s, 交叉验证得分={score:.4f}")
+
+    best = max(results, key=lambda r: r['mean_test_score'])
+    logger.info(f"{name}warm_start路径搜索完成, 用时{time.perf_counter() - start:.1f}s")
+    return best['params'], best['mean_test_score'], results
@@ -0,0 +1,63 @@
+"""
+随机梯度下降线性模型模块
+"""
+from sklearn.linear_model import SGDClassifier
+from src.utils.config_loader import CONFIG
+from src.utils.logger import logger
+
+
+def build_sgd_classifier():
+    """
+    按配置创建SGDClassifier
+    
+    loss为log_loss时等价于逻辑回归，为hinge或modified_huber时等价于线性SVM；
+    只有log_loss和modified_huber支持predict_proba。
+    
+    Returns:
+        SGDClassifier: 未训练的模型
+    """
+    config = CONFIG['models']['sgd']
+    loss = config.get('loss', 'log_loss')
+    alpha = config.get('alpha', 1e-5)
+    penalty = config.get('penalty', 'l2')
+    random_state = config.get('random_state', 42)
+    
+    logger.info(f"初始化SGD模型: loss={loss}, alpha={alpha}, penalty={penalty}, random_state={random_state}")
+    
+    return SGDClassifier(
+        loss=loss,
+        alpha=alpha,
+        penalty=penalty,
+        max_iter=config.get('max_iter', 1000),
+        tol=config.get('tol', 1e-3),
+        random_state=random_state
+    )
+
+
+def train_sgd(x_train, y_train, progress_callback=None):
+    """
+    训练SGD线性模型
+    
+    Args:
+        x_train: 训练特征
+        y_train: 训练标签
+        progress_callback: 进度回调函数
+    
+    Returns:
+        object: 训练好的模型
+    """
+    if progress_callback:
+        progress_callback("训练SGD模型")
+    
+    # 初始化模型
+    model = build_sgd_classifier()
+    
+    # 训练模型
+    model.fit(x_train, y_train)
+    
+    if progress_callback:
+        # SGD训练很快，分配较小的进度增量
+        progress_callback(5)
+    
+    logger.info("SGD模型训练完成")
+    return model
@@ -0,0 +1,143 @@
+"""
+多模型对比模块
+
+特征只计算一次，然后在进程池中并行训练多个模型。训练和测试矩阵发布到共享内存，
+各工作进程在共享内存上构造零拷贝视图，不接收矩阵的序列化副本。
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.evaluation.metrics import compute_metrics
+from src.models.naive_bayes import train_naive_bayes
+from src.models.random_forest import train_random_forest
+from src.models.svm import train_svm
+from src.models.logistic_regression import train_logistic_regression
+from src.models.sgd import train_sgd
+from src.utils.config_loader import CONFIG
+from src.utils.shared_csr import SharedCSRMatrix, attach_csr
+from src.utils.logger import logger
+
+
+MODEL_TRAINERS: Dict[str, Callable] = {
+    'naive_bayes': train_naive_bayes,
+    'random_forest': train_random_forest,
+    'svm': train_svm,
+    'logistic': train_logistic_regression,
+    'sgd': train_sgd,
+}
+
+
+def _limit_nested_jobs(n_jobs: int) -> None:
+    """
+    限制工作进程内模型训练自身的并行任务数
+    
+    随机森林的超参数搜索和逻辑回归的正则化路径默认使用全部CPU核心，
+    多个模型同时训练时每个工作进程只分到一部分核心，避免进程数成倍超过核心数。
+    
+    Args:
+        n_jobs: 每个工作进程可用的并行任务数
+    """
+    models_config = CONFIG['models']
+    models_config['random_forest'].setdefault('search', {})['n_jobs'] = n_jobs
+    models_config['logistic_regression'].setdefault('path', {})['n_jobs'] = n_jobs
+
+
+def _train_and_score(model_type: str, x_train_handle: Dict[str, Any], y_train: np.ndarray,
+                     x_test_handle: Dict[str, Any], y_test: np.ndarray,
+                     n_jobs: int = 1) -> Tuple[Dict[str, Any], Any]:
+    """
+    工作进程中训练并评估一个模型
+    
+    Args:
+        model_type: 模型类型
+        x_train_handle: 训练矩阵的共享内存句柄
+        y_train: 训练标签
+        x_test_handle: 测试矩阵的共享内存句柄
+        y_test: 测试标签
+        n_jobs: 模型训练内部的并行任务数
+    
+    Returns:
+        Tuple[Dict[str, Any], Any]: 对比报告中的一行和训练好的模型
+    """
+    _limit_nested_jobs(n_jobs)
+    x_train = attach_csr(x_train_handle)
+    x_test = attach_csr(x_test_handle)
+    
+    start = time.perf_counter()
+    model = MODEL_TRAINERS[model_type](x_train, y_train)
+    fit_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    y_pred = model.predict(x_test)
+    y_score = model.predict_proba(x_test)[:, 1] if hasattr(model, 'predict_proba') else None
+    predict_time = time.perf_counter() - start
+    
+    row = {'model': model_type, 'fit_time': fit_time, 'predict_time': predict_time}
+    row.update(compute_metrics(y_test, y_pred, y_score))
+    return row, getattr(model, 'best_estimator_', model)
+
+
+def run_model_sweep(model_types: Sequence[str], x_train: Any, y_train: np.ndarray,
+                    x_test: Any, y_test: np.ndarray, n_workers: Optional[int] = None,
+                    progress_callback: Optional[Callable] = None) -> List[Tuple[Dict[str, Any], Any]]:
+    """
+    并行训练并评估多个模型
+    
+    单个模型失败不影响其他模型，失败的模型在报告中记录错误信息。
+    
+    Args:
+        model_types: 模型类型列表
+        x_train: 训练特征矩阵
+        y_train: 训练标签
+        x_test: 测试特征矩阵
+        y_test: 测试标签
+        n_workers: 工作进程数，默认每个模型一个进程
+        progress_callback: 进度回调函数，每完成一个模型调用一次
+    
+    Returns:
+        List[Tuple[Dict[str, Any], Any]]: 按model_types顺序的 (报告行, 模型)，失败的模型为None
+    
+    Raises:
+        ValueError: 不支持的模型类型
+    """
+    unknown = [m for m in model_types if m not in MODEL_TRAINERS]
+    if unknown:
+        raise ValueError(f"不支持的模型: {', '.join(unknown)}，支持的模型: {', '.join(MODEL_TRAINERS)}")
+    
+    n_workers = min(n_workers or len(model_types), len(model_types))
+    # CPU核心在工作进程之间平分，模型内部的并行搜索不再各自使用全部核心
+    nested_jobs = max(1, (os.cpu_count() or 1) // n_workers)
+    y_train = np.asarray(y_train)
+    y_test = np.asarray(y_test)
+    results: Dict[str, Tuple[Dict[str, Any], Any]] = {}
+    
+    start = time.perf_counter()
+    with SharedCSRMatrix(x_train) as shared_train, SharedCSRMatrix(x_test) as shared_test:
+        logger.info(f"开始并行训练{len(model_types)}个模型: {', '.join(model_types)}, 进程数={n_workers}, "
+                    f"每个进程的并行任务数={nested_jobs}, "
+                    f"共享内存={(shared_train.nbytes + shared_test.nbytes) / 1024 ** 2:.1f}MB")
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = {
+                executor.submit(_train_and_score, model_type, shared_train.handle, y_train,
+                                shared_test.handle, y_test, nested_jobs): model_type
+                for model_type in model_types
+            }
+            for future in as_completed(futures):
+                model_type = futures[future]
+                try:
+                    row, model = future.result()
+                    logger.info(f"{model_type}训练完成: 训练耗时={row['fit_time']:.1f}s, "
+                                f"准确率={row['accuracy']:.4f}, AUC={row['auc']:.4f}")
+                except Exception as e:
+                    logger.error(f"{model_type}训练失败: {str(e)}", exc_info=True)
+                    row, model = {'model': model_type, 'error': str(e)}, None
+                results[model_type] = (row, model)
+                if progress_callback:
+                    progress_callback(1)
+    
+    logger.info(f"多模型训练完成, 总用时{time.perf_counter() - start:.1f}s")
+    return [results[model_type] for model_type in model_types]
@@ -0,0 +1,129 @@
+"""
+模型在线更新模块
+
+用新标注的样本更新已训练的模型，耗时只与新样本数量相关:
+    MultinomialNB / SGDClassifier: partial_fit
+    LogisticRegression: 转换为以当前系数为起点的SGDClassifier(loss='log_loss')，
+        以小的固定学习率在新样本上走有限的几轮随机梯度步
+    RandomForestClassifier: 保留已有的树，追加在新样本上训练的树
+
+逻辑回归不能用warm_start原地更新：warm_start只决定求解的起点，lbfgs等求解器在新样本上会收敛到
+只由新样本决定的最优解，一小批新样本就会替换掉原模型。
+"""
+import time
+from typing import Optional
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.naive_bayes import MultinomialNB
+
+from src.utils.config_loader import CONFIG
+from src.utils.logger import logger
+
+
+def update_model(model, x_new, y_new, progress_callback=None, train_size: Optional[int] = None):
+    """
+    用新样本更新模型
+    
+    逻辑回归和随机森林的更新只看到新样本：逻辑回归转换为SGDClassifier后从旧解出发
+    在新样本上走update.logistic.epochs轮、学习率为update.logistic.eta0的梯度步，
+    随机森林新增的树只在新样本上训练，因此两者都需要新样本同时包含两个类别。
+    这类更新是对完整重训的近似，积累较多新样本后仍应定期用main.py完整训练。
+    
+    Args:
+        model: 训练好的模型（搜索对象会使用其最佳模型）
+        x_new: 新样本特征
+        y_new: 新样本标签
+        progress_callback: 进度回调函数
+        train_size: 模型此前的训练样本数，用于把逻辑回归的C换算为SGD的正则化系数
+    
+    Returns:
+        object: 更新后的模型；逻辑回归返回SGDClassifier
+    
+    Raises:
+        ValueError: 模型类型不支持在线更新或新样本不满足要求
+    """
+    model = getattr(model, 'best_estimator_', model)
+    y_new = np.asarray(y_new)
+    config = CONFIG.get('update', {})
+    
+    if progress_callback:
+        progress_callback(f"更新{type(model).__name__}模型")
+    
+    unseen = set(np.unique(y_new)) - set(getattr(model, 'classes_', []))
+    if unseen:
+        raise ValueError(f"新样本包含模型未见过的类别: {sorted(unseen)}")
+    
+    start = time.perf_counter()
+    if isinstance(model, (MultinomialNB, SGDClassifier)):
+        model.partial_fit(x_new, y_new)
+    elif isinstance(model, LogisticRegression):
+        _require_both_classes(model, y_new)
+        model = _logistic_to_sgd(model, x_new, y_new, config.get('logistic', {}) or {}, train_size)
+    elif isinstance(model, RandomForestClassifier):
+        _require_both_classes(model, y_new)
+        n_new = config.get('forest_new_trees', 50)
+        model.set_params(warm_start=True, n_estimators=model.n_estimators + n_new)
+        model.fit(x_new, y_new)
+        logger.info(f"随机森林追加{n_new}棵树，共{model.n_estimators}棵")
+    else:
+        error_msg = (f"模型{type(model).__name__}不支持在线更新，"
+                     f"支持: MultinomialNB, SGDClassifier, LogisticRegression, RandomForestClassifier")
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+    
+    logger.info(f"模型更新完成: {type(model).__name__}, 新样本数={len(y_new)}, "
+                f"用时{time.perf_counter() - start:.2f}s")
+    
+    if progress_callback:
+        progress_callback(10)
+    return model
+
+
+def _logistic_to_sgd(model: LogisticRegression, x_new, y_new: np.ndarray, config: dict,
+                     train_size: Optional[int]) -> SGDClassifier:
+    """
+    以逻辑回归的系数为起点，用SGD在新样本上做有限步数的更新
+    
+    逻辑回归的目标 C*Σloss + ||w||²/2 与SGD的 mean(loss) + alpha*||w||²/2 在alpha=1/(C*n)时一致，
+    n为训练样本数。更新后的模型是SGDClassifier，之后的更新直接走partial_fit。
+    
+    Args:
+        model: 训练好的逻辑回归模型
+        x_new: 新样本特征
+        y_new: 新样本标签
+        config: update.logistic配置（epochs、eta0）
+        train_size: 模型此前的训练样本数，未知时使用SGD默认的正则化系数
+    
+    Returns:
+        SGDClassifier: 更新后的模型
+    """
+    if len(model.classes_) != 2:
+        error_msg = f"逻辑回归的在线更新只支持二分类，当前类别: {list(model.classes_)}"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+    
+    epochs = int(config.get('epochs', 1))
+    eta0 = float(config.get('eta0', 0.001))
+    alpha = 1.0 / (model.C * train_size) if train_size else 0.0001
+    sgd = SGDClassifier(loss='log_loss', alpha=alpha, learning_rate='constant', eta0=eta0,
+                        max_iter=epochs, tol=None, shuffle=True, random_state=model.random_state)
+    sgd.fit(x_new, y_new, coef_init=model.coef_, intercept_init=model.intercept_)
+    
+    drift = float(np.linalg.norm(sgd.coef_ - model.coef_) / max(np.linalg.norm(model.coef_), 1e-12))
+    logger.info(f"逻辑回归已转换为SGDClassifier(log_loss)并在新样本上更新: 轮数={epochs}, 学习率={eta0}, "
+                f"alpha={alpha:.2e}, 系数相对变化={drift:.2%}")
+    if drift > 0.5:
+        logger.warning(f"本次更新使逻辑回归系数变化{drift:.0%}，模型可能偏向新样本，建议减小update.logistic.eta0"
+                       f"或使用main.py完整重训")
+    return sgd
+
+
+def _require_both_classes(model, y_new: np.ndarray) -> None:
+    """检查新样本是否包含模型的全部类别"""
+    missing = set(model.classes_) - set(np.unique(y_new))
+    if missing:
+        error_msg = f"{type(model).__name__}的更新需要新样本包含全部类别，缺少: {sorted(missing)}"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
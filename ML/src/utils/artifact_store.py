@@ -0,0 +1,273 @@
+"""
+模型工件存储模块
+
+将训练好的向量化器、模型和预处理配置保存为带版本号的工件包，
+并支持以内存映射方式快速加载，用于推理和增量更新。
+"""
+import os
+import json
+import time
+import shutil
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+import joblib
+
+from src.utils.config_loader import CONFIG
+from src.utils.logger import logger
+
+
+# 工件包格式版本，结构不兼容地变化时递增
+BUNDLE_FORMAT_VERSION = 1
+
+BUNDLE_FILE = 'bundle.joblib'
+META_FILE = 'meta.json'
+LATEST_FILE = 'LATEST'
+DICTS_DIR = 'dicts'
+
+
+class ArtifactBundle:
+    """工件包
+
+    包含推理所需的全部对象：已拟合的向量化器、训练好的模型、停用词索引、训练时的配置
+    和训练时使用的jieba用户词典。
+    """
+
+    def __init__(self, version: str, vectorizer: Any, model: Any, stopwords: Any,
+                 config: Dict[str, Any], metadata: Dict[str, Any],
+                 dictionaries: Optional[Dict[str, Any]] = None) -> None:
+        """
+        初始化工件包
+
+        Args:
+            version: 版本号
+            vectorizer: 已拟合的TextVectorizer
+            model: 训练好的模型
+            stopwords: 停用词索引
+            config: 训练时的配置（preprocessing、features、models等部分）
+            metadata: 元数据（模型类型、训练时间、评估结果等）
+            dictionaries: 工件中保存的jieba用户词典，user_dicts为副本的路径，fingerprint为训练时的词典指纹；
+                旧版本工件没有保存词典时为None
+        """
+        self.version = version
+        self.vectorizer = vectorizer
+        self.model = model
+        self.stopwords = stopwords
+        self.config = config
+        self.metadata = metadata
+        self.dictionaries = dictionaries
+
+    def preprocessing_config(self) -> Dict[str, Any]:
+        """
+        推理和在线更新使用的预处理配置
+
+        jieba用户词典指向工件中保存的副本，并关闭官方账号名词典的生成，
+        分词结果与训练时一致，也不会在训练以外读取训练集。
+
+        Returns:
+            Dict[str, Any]: 预处理配置
+        """
+        config = dict(self.config['preprocessing'])
+        jieba_config = dict(config.get('jieba') or {})
+        if self.dictionaries is not None:
+            user_dicts = list(self.dictionaries['user_dicts'])
+        else:
+            # 旧版本工件没有保存词典，退回到本机现有的词典文件，分词结果可能与训练时不同
+            logger.warning(f"工件{self.version}没有保存jieba用户词典，使用本机现有的词典文件")
+            user_dicts = list(jieba_config.get('user_dicts') or [])
+            if jieba_config.get('account_names', False) and jieba_config.get('account_dict'):
+                user_dicts.append(jieba_config['account_dict'])
+        jieba_config.update(user_dicts=user_dicts, account_names=False)
+        config['jieba'] = jieba_config
+        return config
+
+    def check_dictionaries(self, fingerprint: str) -> bool:
+        """
+        检查预处理器加载的词典与训练时是否一致
+
+        Args:
+            fingerprint: 预处理器的词典指纹（tokenization_settings()['dictionaries']）
+
+        Returns:
+            bool: 一致或工件没有记录指纹时为True
+        """
+        expected = (self.dictionaries or {}).get('fingerprint')
+        if expected and expected != fingerprint:
+            logger.warning(f"工件{self.version}的jieba词典与训练时不一致（主词典或用户词典已变化），分词结果可能不同")
+            return False
+        return True
+
+
+class ArtifactStore:
+    """工件存储
+
+    每个版本保存在根目录下的独立子目录（v0001、v0002……）中，
+    LATEST文件记录最新版本号。工件包使用未压缩的joblib格式保存，
+    加载时可将其中的大型numpy数组（系数、IDF、树结构等）内存映射，避免复制。
+    """
+
+    def __init__(self, root: Optional[str] = None) -> None:
+        """
+        初始化工件存储
+
+        Args:
+            root: 工件根目录，默认使用配置中的artifacts.dir
+        """
+        self.root = root or CONFIG.get('artifacts', {}).get('dir', 'artifacts')
+
+    def list_versions(self) -> List[str]:
+        """
+        列出所有已保存的版本
+
+        Returns:
+            List[str]: 按版本号升序排列的版本列表
+        """
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(
+            name for name in os.listdir(self.root)
+            if name.startswith('v') and name[1:].isdigit()
+            and os.path.exists(os.path.join(self.root, name, BUNDLE_FILE))
+        )
+
+    def latest_version(self) -> Optional[str]:
+        """
+        获取最新版本号
+
+        Returns:
+            Optional[str]: 最新版本号，没有工件时为None
+        """
+        latest_path = os.path.join(self.root, LATEST_FILE)
+        if os.path.exists(latest_path):
+            with open(latest_path, 'r', encoding='utf-8') as f:
+                version = f.read().strip()
+            if version:
+                return version
+
+        versions = self.list_versions()
+        return versions[-1] if versions else None
+
+    def _next_version(self) -> str:
+        """生成下一个版本号"""
+        versions = self.list_versions()
+        number = int(versions[-1][1:]) + 1 if versions else 1
+        return f"v{number:04d}"
+
+    def save(self, vectorizer: Any, model: Any, stopwords: Any = None,
+             metadata: Optional[Dict[str, Any]] = None, config: Optional[Dict[str, Any]] = None,
+             dictionaries: Optional[Dict[str, Any]] = None) -> str:
+        """
+        保存工件包为新版本
+
+        GridSearchCV等搜索对象只保存其最佳模型。jieba用户词典复制到版本目录下的dicts子目录，
+        推理和在线更新时从工件加载，不依赖本机的词典文件和训练集。
+
+        Args:
+            vectorizer: 已拟合的TextVectorizer
+            model: 训练好的模型
+            stopwords: 停用词索引，默认使用向量化器的停用词
+            metadata: 额外的元数据
+            config: 训练时的配置，默认使用当前配置的preprocessing、features、models部分；
+                在线更新时传入基础版本的配置
+            dictionaries: 训练时解析的jieba用户词典，包含user_dicts（词典路径列表）和fingerprint（词典指纹）；
+                在线更新时传入基础版本的dictionaries
+
+        Returns:
+            str: 新版本号
+        """
+        version = self._next_version()
+        version_dir = os.path.join(self.root, version)
+        os.makedirs(version_dir, exist_ok=True)
+
+        saved_dictionaries = None
+        if dictionaries is not None:
+            saved_dictionaries = {'user_dicts': [], 'fingerprint': dictionaries.get('fingerprint')}
+            os.makedirs(os.path.join(version_dir, DICTS_DIR), exist_ok=True)
+            for i, path in enumerate(dictionaries.get('user_dicts', [])):
+                # 加序号保持加载顺序，也避免不同目录下的同名词典互相覆盖
+                name = f"{i:02d}_{os.path.basename(path)}"
+                shutil.copyfile(path, os.path.join(version_dir, DICTS_DIR, name))
+                saved_dictionaries['user_dicts'].append(name)
+
+        model = getattr(model, 'best_estimator_', model)
+        metadata = dict(metadata or {})
+        metadata.update({
+            'version': version,
+            'format_version': BUNDLE_FORMAT_VERSION,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'model_class': type(model).__name__,
+            'vectorizer_type': getattr(vectorizer, 'vectorizer_type', None),
+        })
+
+        bundle = {
+            'format_version': BUNDLE_FORMAT_VERSION,
+            'vectorizer': vectorizer,
+            'model': model,
+            'stopwords': stopwords if stopwords is not None else getattr(vectorizer, 'stopwords', None),
+            'config': config if config is not None else {
+                section: CONFIG.get(section, {}) for section in ('preprocessing', 'features', 'models')
+            },
+            'metadata': metadata,
+            'dictionaries': saved_dictionaries,
+        }
+
+        start = time.perf_counter()
+        # 不压缩，加载时才能对numpy数组使用内存映射
+        joblib.dump(bundle, os.path.join(version_dir, BUNDLE_FILE), compress=0)
+        with open(os.path.join(version_dir, META_FILE), 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, ensure_ascii=False, indent=2, default=str)
+
+        # 原子地更新最新版本指针
+        latest_tmp = os.path.join(self.root, f"{LATEST_FILE}.tmp")
+        with open(latest_tmp, 'w', encoding='utf-8') as f:
+            f.write(version)
+        os.replace(latest_tmp, os.path.join(self.root, LATEST_FILE))
+
+        logger.info(f"工件已保存: {version_dir}, 用时{(time.perf_counter() - start) * 1000:.0f}ms")
+        return version
+
+    def load(self, version: Optional[str] = None, mmap: bool = True) -> ArtifactBundle:
+        """
+        加载工件包
+
+        Args:
+            version: 版本号，默认加载最新版本
+            mmap: 是否以只读内存映射方式加载大型numpy数组；需要原地修改模型时应设为False
+
+        Returns:
+            ArtifactBundle: 工件包
+
+        Raises:
+            FileNotFoundError: 工件不存在
+            ValueError: 工件包格式不兼容
+        """
+        version = version or self.latest_version()
+        if version is None:
+            raise FileNotFoundError(f"工件目录中没有可用的模型: {self.root}")
+
+        bundle_path = os.path.join(self.root, version, BUNDLE_FILE)
+        if not os.path.exists(bundle_path):
+            raise FileNotFoundError(f"工件不存在: {bundle_path}")
+
+        start = time.perf_counter()
+        bundle = joblib.load(bundle_path, mmap_mode='r' if mmap else None)
+        if bundle.get('format_version') != BUNDLE_FORMAT_VERSION:
+            raise ValueError(f"不兼容的工件包格式: {bundle.get('format_version')}")
+
+        dictionaries = bundle.get('dictionaries')
+        if dictionaries is not None:
+            dicts_dir = os.path.join(self.root, version, DICTS_DIR)
+            dictionaries = dict(dictionaries, user_dicts=[
+                os.path.join(dicts_dir, name) for name in dictionaries['user_dicts']
+            ])
+
+        logger.info(f"工件已加载: {bundle_path}, 用时{(time.perf_counter() - start) * 1000:.1f}ms")
+        return ArtifactBundle(
+            version=version,
+            vectorizer=bundle['vectorizer'],
+            model=bundle['model'],
+            stopwords=bundle['stopwords'],
+            config=bundle['config'],
+            metadata=bundle['metadata'],
+            dictionaries=dictionaries,
+        )
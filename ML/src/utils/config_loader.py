@@ -6,8 +6,9 @@
 """
 import os
 import sys
-import yaml
-from typing import Dict, Any, Optional, List
+import threading
+from collections.abc import MutableMapping
+from typing import Dict, Any, Optional, Iterator
 
 
 class ConfigLoader:
@@ -45,6 +46,9 @@ class ConfigLoader:
             FileNotFoundError: 配置文件不存在
             yaml.YAMLError: 配置文件格式错误
         """
+        # YAML解析器在真正加载配置时才导入
+        import yaml
+        
         # 检查配置文件是否存在
         if not os.path.exists(self.config_path):
             error_msg = f"配置文件不存在: {self.config_path}"
@@ -92,7 +96,13 @@ class ConfigLoader:
             data_defaults = {
                 'train_path': 'data/train.news.csv',
                 'test_path': 'data/test.news.csv',
-                'stopwords_path': 'data/stop_words.txt'
+                'stopwords_path': 'data/stop_words.txt',
+                'streaming': False,
+                'chunk_size': 5000,
+                'columnar': {
+                    'enabled': True,
+                    'cache_dir': 'cache/columnar'
+                }
             }
             for key, value in data_defaults.items():
                 if key not in self.config['data']:
@@ -103,7 +113,22 @@ class ConfigLoader:
             preprocessing_defaults = {
                 'use_stopwords': True,
                 'content_separator': '\n',
-                'tokenizer': 'jieba'
+                'tokenizer': 'jieba',
+                'n_workers': 1,
+                'chunk_size': 1000,
+                'output': 'text',
+                'cache': {
+                    'enabled': True,
+                    'path': 'cache/tokens.sqlite',
+                    'max_entries': 1000000
+                },
+                'jieba': {
+                    'dict_cache_dir': 'cache/jieba',
+                    'dictionary': None,
+                    'user_dicts': [],
+                    'account_names': False,
+                    'account_dict': 'cache/jieba/account_names.txt'
+                }
             }
             for key, value in preprocessing_defaults.items():
                 if key not in self.config['preprocessing']:
@@ -111,6 +136,12 @@ class ConfigLoader:
         
         # 特征部分默认值
         if 'features' in self.config:
+            if 'cache' not in self.config['features']:
+                self.config['features']['cache'] = {
+                    'enabled': True,
+                    'cache_dir': 'cache/features'
+                }
+            
             if 'tfidf' not in self.config['features']:
                 self.config['features']['tfidf'] = {
                     'min_df': 5,
@@ -118,7 +149,10 @@ class ConfigLoader:
                     'ngram_range': [1, 2],
                     'use_stopwords': True,
                     'use_idf': True,
-                    'norm': 'l2'
+                    'norm': 'l2',
+                    'n_jobs': -1,
+                    'fit_chunk_size': 2000,
+                    'compact': False
                 }
             
             if 'countvec' not in self.config['features']:
@@ -127,7 +161,31 @@ class ConfigLoader:
                     'max_features': 10000,
                     'ngram_range': [1, 2],
                     'use_stopwords': True,
-                    'binary': False
+                    'binary': False,
+                    'n_jobs': -1,
+                    'fit_chunk_size': 2000,
+                    'compact': False
+                }
+            
+            if 'selection' not in self.config['features']:
+                self.config['features']['selection'] = {
+                    'enabled': False,
+                    'method': 'chi2',
+                    'k': 3000,
+                    'l1_C': 1.0,
+                    'random_state': 42,
+                    'measure_savings': True,
+                    'latency_sample': 1000
+                }
+            
+            if 'hashing' not in self.config['features']:
+                self.config['features']['hashing'] = {
+                    'n_features': 1048576,
+                    'ngram_range': [1, 2],
+                    'use_stopwords': True,
+                    'use_idf': True,
+                    'norm': 'l2',
+                    'compact': False
                 }
         
         # 模型部分默认值
@@ -140,6 +198,78 @@ class ConfigLoader:
                 if key not in self.config['model']:
                     self.config['model'][key] = value
         
+        # SGD模型默认值
+        if 'models' in self.config and 'sgd' not in self.config['models']:
+            self.config['models']['sgd'] = {
+                'loss': 'log_loss',
+                'alpha': 0.00001,
+                'penalty': 'l2',
+                'max_iter': 1000,
+                'tol': 0.001,
+                'epochs': 1,
+                'random_state': 42
+            }
+        
+        # 模型工件部分默认值
+        artifacts_defaults = {
+            'dir': 'artifacts',
+            'save_after_train': True
+        }
+        self.config.setdefault('artifacts', {})
+        for key, value in artifacts_defaults.items():
+            if key not in self.config['artifacts']:
+                self.config['artifacts'][key] = value
+        
+        # 评估绘图部分默认值
+        for key in ('plot', 'plot_async'):
+            if key not in self.config['evaluation']:
+                self.config['evaluation'][key] = True
+        
+        # 评估置信区间部分默认值
+        bootstrap_defaults = {
+            'enabled': True,
+            'n_resamples': 1000,
+            'confidence': 0.95,
+            'seed': 42
+        }
+        self.config['evaluation'].setdefault('bootstrap', {})
+        for key, value in bootstrap_defaults.items():
+            if key not in self.config['evaluation']['bootstrap']:
+                self.config['evaluation']['bootstrap'][key] = value
+        
+        # 多模型对比部分默认值
+        self.config.setdefault('sweep', {})
+        if 'n_workers' not in self.config['sweep']:
+            self.config['sweep']['n_workers'] = None
+        
+        # 在线更新部分默认值
+        update_defaults = {
+            'logistic': {'epochs': 1, 'eta0': 0.001},
+            'forest_new_trees': 50
+        }
+        self.config.setdefault('update', {})
+        for key, value in update_defaults.items():
+            if key not in self.config['update']:
+                self.config['update'][key] = value
+        
+        # HTTP推理服务部分默认值
+        server_defaults = {
+            'host': '127.0.0.1',
+            'port': 5000,
+            'workers': 4,
+            'max_batch_items': 256,
+            'model_version': None,
+            'batching': {
+                'enabled': True,
+                'max_batch_size': 32,
+                'max_wait_ms': 5
+            }
+        }
+        self.config.setdefault('server', {})
+        for key, value in server_defaults.items():
+            if key not in self.config['server']:
+                self.config['server'][key] = value
+        
         # 日志部分默认值
         if 'logging' in self.config:
             logging_defaults = {
@@ -187,6 +317,8 @@ class ConfigLoader:
         Raises:
             OSError: 保存配置文件失败
         """
+        import yaml
+        
         path = config_path or self.config_path
         
         # 确保目录存在
@@ -219,10 +351,91 @@ def load_config(config_path: str) -> Dict[str, Any]:
     return loader.get_config()
 
 
-# 全局配置实例
-try:
-    config_loader = ConfigLoader()
-    CONFIG = config_loader.get_config()
-except Exception as e:
-    print(f"加载配置失败: {str(e)}")
-    sys.exit(1) 
\ No newline at end of file
+# 配置文件路径环境变量；spawn方式启动的工作进程通过它沿用主进程指定的配置文件
+CONFIG_PATH_ENV = 'FAKENEWSDETECTOR_CONFIG'
+DEFAULT_CONFIG_PATH = 'config/config.yaml'
+
+
+class LazyConfig(MutableMapping):
+    """延迟加载的全局配置
+    
+    行为与配置字典相同，但第一次读取时才加载YAML配置文件，
+    只导入模块（例如执行--help）不读取任何文件。
+    set_config_path切换配置文件后，所有通过 from src.utils.config_loader import CONFIG
+    持有该对象的模块都会读到新的配置。
+    """
+    
+    def __init__(self) -> None:
+        self._config_path: Optional[str] = None
+        self._config: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def config_path(self) -> str:
+        """当前使用的配置文件路径"""
+        return self._config_path or os.environ.get(CONFIG_PATH_ENV) or DEFAULT_CONFIG_PATH
+    
+    @property
+    def loaded(self) -> bool:
+        """配置文件是否已经加载"""
+        return self._config is not None
+    
+    def configure(self, config_path: str) -> None:
+        """
+        指定配置文件路径，已加载的配置会在下次访问时按新路径重新加载
+        
+        Args:
+            config_path: 配置文件路径
+        """
+        with self._lock:
+            self._config_path = config_path
+            os.environ[CONFIG_PATH_ENV] = config_path
+            self._config = None
+    
+    def _data(self) -> Dict[str, Any]:
+        """返回配置字典，首次访问时加载"""
+        if self._config is None:
+            with self._lock:
+                if self._config is None:
+                    try:
+                        self._config = ConfigLoader(self.config_path).get_config()
+                    except Exception as e:
+                        print(f"加载配置失败: {str(e)}")
+                        sys.exit(1)
+        return self._config
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._data()[key]
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._data()[key] = value
+    
+    def __delitem__(self, key: str) -> None:
+        del self._data()[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data())
+    
+    def __len__(self) -> int:
+        return len(self._data())
+    
+    def __repr__(self) -> str:
+        if self._config is None:
+            return f"LazyConfig({self.config_path!r}, 未加载)"
+        return repr(self._config)
+
+
+def set_config_path(config_path: str) -> None:
+    """
+    指定全局配置使用的配置文件
+    
+    应在第一次记录日志之前调用，日志记录器创建后不会随配置切换而重新配置。
+    
+    Args:
+        config_path: 配置文件路径
+    """
+    CONFIG.configure(config_path)
+
+
+# 全局配置实例，第一次访问时才加载
+CONFIG = LazyConfig()
@@ -108,9 +108,44 @@ class LoggerConfig:
         return logger
 
 
-# 创建默认的日志记录器
-logger_config = LoggerConfig()
-logger = logger_config.get_logger('FakeNewsDetector')
+_logger_config: Optional[LoggerConfig] = None
+
+
+def get_logger_config() -> LoggerConfig:
+    """
+    获取全局日志配置，首次调用时根据全局配置创建
+    
+    Returns:
+        LoggerConfig: 日志配置
+    """
+    global _logger_config
+    if _logger_config is None:
+        _logger_config = LoggerConfig()
+    return _logger_config
+
+
+class LazyLogger:
+    """延迟创建的日志记录器
+    
+    第一次记录日志时才读取配置、创建日志目录并打开日志文件，
+    只导入模块不产生任何文件操作。其余行为与logging.Logger相同。
+    """
+    
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._logger: Optional[logging.Logger] = None
+    
+    def _get(self) -> logging.Logger:
+        if self._logger is None:
+            self._logger = get_logger_config().get_logger(self._name)
+        return self._logger
+    
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._get(), attr)
+
+
+# 默认的日志记录器，第一次使用时创建
+logger = LazyLogger('FakeNewsDetector')
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -123,4 +158,4 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         logging.Logger: 配置好的日志记录器实例
     """
-    return logger_config.get_logger(name) 
\ No newline at end of file
+    return get_logger_config().get_logger(name)
@@ -0,0 +1,189 @@
+"""
+共享内存稀疏矩阵模块
+
+把scipy CSR矩阵的data/indices/indptr三个数组发布到multiprocessing.shared_memory中，
+工作进程只接收一个很小的句柄，再在共享内存上构造零拷贝的只读视图，
+避免每个工作进程都收到一份序列化的矩阵副本。
+
+用法:
+    with SharedCSRMatrix(x_train) as shared:
+        executor.submit(worker, shared.handle, ...)
+
+    # 工作进程中
+    x_train = attach_csr(handle)
+"""
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix, spmatrix
+
+from src.utils.logger import logger
+
+
+CSR_COMPONENTS = ('data', 'indices', 'indptr')
+
+# 本进程创建的共享内存块，按名称索引；在同一进程内附加时直接复用
+_owned: Dict[str, shared_memory.SharedMemory] = {}
+
+# 本进程附加的共享内存块，按名称索引；同一工作进程处理多个任务时只附加一次
+_attached: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def _open_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    附加到已存在的共享内存块，不向资源跟踪器登记
+
+    共享内存块由创建方负责释放；如果附加方也登记，资源跟踪器会在附加方退出时
+    重复释放或报告泄漏。Python 3.13起可以直接传入track=False。
+
+    Args:
+        name: 共享内存块名称
+
+    Returns:
+        shared_memory.SharedMemory: 共享内存块
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+class SharedCSRMatrix:
+    """发布到共享内存中的CSR矩阵
+
+    由创建方持有，负责在使用结束后关闭并释放共享内存；handle可以被序列化后传给工作进程。
+    """
+
+    def __init__(self, matrix: spmatrix) -> None:
+        """
+        把稀疏矩阵复制到共享内存
+
+        Args:
+            matrix: 稀疏矩阵，非CSR格式会先转换为CSR；列下标未排序时发布排序后的副本
+        """
+        matrix = csr_matrix(matrix)
+        # 工作进程中的视图是只读的，SVC等模型训练前会原地排序下标，只能在发布前排好
+        if not matrix.has_sorted_indices:
+            matrix = matrix.copy()
+            matrix.sort_indices()
+        self.shape: Tuple[int, int] = matrix.shape
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self.handle: Dict[str, Any] = {'shape': self.shape, 'components': {}}
+
+        try:
+            for component in CSR_COMPONENTS:
+                array = np.ascontiguousarray(getattr(matrix, component))
+                # 长度为0的共享内存块不合法，至少分配1字节
+                shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                self._blocks.append(shm)
+                _owned[shm.name] = shm
+                np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+                self.handle['components'][component] = (shm.name, array.dtype.str, array.shape[0])
+        except Exception:
+            self.close()
+            raise
+
+        logger.debug(f"稀疏矩阵已发布到共享内存: 形状={self.shape}, {self.nbytes / 1024 ** 2:.1f}MB")
+
+    @property
+    def nbytes(self) -> int:
+        """共享内存中三个数组的总字节数"""
+        return sum(shm.size for shm in self._blocks)
+
+    def close(self) -> None:
+        """关闭并释放共享内存，之后工作进程不能再附加"""
+        for shm in self._blocks:
+            _owned.pop(shm.name, None)
+            _attached.pop(shm.name, None)
+            try:
+                shm.close()
+            except BufferError:
+                # 本进程中仍有矩阵视图引用这块内存，映射在视图回收后解除
+                pass
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._blocks = []
+
+    def __enter__(self) -> 'SharedCSRMatrix':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def attach_csr(handle: Dict[str, Any]) -> csr_matrix:
+    """
+    根据句柄在共享内存上构造CSR矩阵视图，不复制数据
+
+    返回的矩阵的三个数组都是只读的，列下标已由SharedCSRMatrix排序。共享内存块在本进程内保持附加，
+    直到调用detach_all或创建方释放。
+
+    Args:
+        handle: SharedCSRMatrix.handle
+
+    Returns:
+        csr_matrix: 零拷贝的只读CSR矩阵
+    """
+    arrays = []
+    for component in CSR_COMPONENTS:
+        name, dtype, length = handle['components'][component]
+        shm = _owned.get(name) or _attached.get(name)
+        if shm is None:
+            shm = _attached[name] = _open_shared_memory(name)
+        array = np.ndarray((length,), dtype=np.dtype(dtype), buffer=shm.buf)
+        array.flags.writeable = False
+        arrays.append(array)
+
+    matrix = csr_from_components(*arrays, shape=handle['shape'], has_sorted_indices=True)
+    # 记录来源句柄，嵌套的并行任务可以直接复用，不再复制到新的共享内存块
+    matrix.shared_handle = handle
+    return matrix
+
+
+def shared_handle(matrix: Any) -> Optional[Dict[str, Any]]:
+    """
+    获取由attach_csr构造的矩阵的共享内存句柄
+
+    Args:
+        matrix: 任意矩阵
+
+    Returns:
+        Optional[Dict[str, Any]]: 句柄，矩阵不在共享内存中时为None
+    """
+    return getattr(matrix, 'shared_handle', None)
+
+
+def csr_from_components(data: np.ndarray, indices: np.ndarray, indptr: np.ndarray,
+                        shape: Tuple[int, int], has_sorted_indices: bool = False) -> csr_matrix:
+    """
+    直接用已有数组构造CSR矩阵，不做任何复制
+
+    csr_matrix((data, indices, indptr))会按取值范围重新选择下标类型，可能把int64下标复制为int32；
+    这里绕过构造函数的类型调整，保证矩阵始终引用传入的数组（共享内存或内存映射）。
+
+    Args:
+        data: 非零元素值
+        indices: 列下标
+        indptr: 行指针
+        shape: 矩阵形状
+        has_sorted_indices: 调用方保证每行列下标已排序时为True，之后sort_indices()不会写入数组
+
+    Returns:
+        csr_matrix: CSR矩阵
+    """
+    matrix = csr_matrix(tuple(shape), dtype=data.dtype)
+    matrix.data, matrix.indices, matrix.indptr = data, indices, indptr
+    if has_sorted_indices:
+        matrix.has_sorted_indices = True
+    return matrix
+
+
+def detach_all() -> None:
+    """关闭本进程附加的全部共享内存块（不释放，释放由创建方负责）"""
+    for name in list(_attached):
+        _attached.pop(name).close()
@@ -0,0 +1,24 @@
+"""
+命令行启动的回归测试
+
+python main.py --help 及predict、serve、update等子命令的 --help 只解析参数，
+不应导入pandas、jieba、sklearn、matplotlib等重量级依赖。train的入口模块本身就是训练流程，不在检查范围内。
+"""
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.bench_startup import ML_DIR, parse_importtime
+
+FORBIDDEN = ['pandas', 'jieba', 'sklearn', 'matplotlib']
+
+
+@pytest.mark.parametrize('command', ['', 'predict', 'serve', 'update', 'bench'])
+def test_help_does_not_import_heavy_dependencies(command):
+    args = [sys.executable, '-X', 'importtime', 'main.py', *([command] if command else []), '--help']
+    result = subprocess.run(args, cwd=ML_DIR, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    imported = {name.split('.')[0] for name in parse_importtime(result.stderr)}
+    assert not imported & set(FORBIDDEN), f"{' '.join(args[3:])} 导入了: {sorted(imported & set(FORBIDDEN))}"
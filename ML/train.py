@@ -0,0 +1,460 @@
+"""
+FakeNewsDetector - 训练并评估模型（main.py train）
+"""
+import os
+import sys
+import argparse
+import traceback
+from typing import Dict, Tuple, List, Any, Optional, Union, Callable
+import numpy as np
+from scipy.sparse import spmatrix
+from tqdm import tqdm
+
+from src.utils.config_loader import CONFIG, set_config_path
+from src.utils.logger import logger
+from src.data.data_loader import load_data, load_stopwords, iter_data_chunks
+from src.data.preprocessor import TextPreprocessor
+from src.data.stopwords import StopwordIndex
+from src.features.vectorizers import TextVectorizer
+from src.features.feature_cache import FeatureCache
+from src.features.selection import select_features
+from src.models import (
+    train_naive_bayes, train_random_forest, train_svm, train_logistic_regression, train_sgd,
+    train_incremental, predict_stream, PARTIAL_FIT_MODELS
+)
+from src.models.sweep import MODEL_TRAINERS, run_model_sweep
+from src.evaluation.metrics import evaluate_model, save_comparison_report
+from src.evaluation.reporting import wait_for_plots
+from src.utils.artifact_store import ArtifactStore
+
+
+def extract_features_cached(vectorizer_type: str, update_progress: Callable) -> Tuple[
+        TextVectorizer, StopwordIndex, spmatrix, np.ndarray, spmatrix, np.ndarray]:
+    """
+    加载数据、预处理并提取特征，优先使用特征矩阵缓存
+    
+    数据文件和分词配置未变化时直接通过来源索引命中缓存，不读取数据也不分词；
+    否则完成分词后按分词结果的哈希查找缓存，仍未命中时才进行向量化并写入缓存。
+    
+    Args:
+        vectorizer_type: 向量化方法
+        update_progress: 进度回调函数
+        
+    Returns:
+        Tuple: 向量化器、停用词索引、训练特征、训练标签、测试特征和测试标签
+    """
+    feature_cache = FeatureCache()
+    preprocessor = None
+    source_digest = None
+    if feature_cache.enabled:
+        stopwords = load_stopwords()
+        preprocessor = TextPreprocessor(stopwords)
+        source_digest = FeatureCache.source_digest(
+            [CONFIG['data']['train_path'], CONFIG['data']['test_path']],
+            preprocessor.tokenization_settings())
+        corpus_digest = feature_cache.lookup_source(source_digest)
+        cached = feature_cache.load(corpus_digest, vectorizer_type, stopwords.fingerprint) if corpus_digest else None
+        if cached is not None:
+            vectorizer, x_train_vec, y_train, x_test_vec, y_test = cached
+            update_progress(30)  # 跳过数据加载、预处理和特征提取
+            return vectorizer, stopwords, x_train_vec, y_train, x_test_vec, y_test
+    
+    # 加载数据
+    update_progress("加载数据")
+    x_train, y_train, x_test, y_test, stopwords = load_data()
+    logger.info(f"数据加载完成，训练集大小: {len(x_train)}，测试集大小: {len(x_test)}")
+    update_progress(10)  # 为数据加载分配10%进度
+    
+    # 预处理数据
+    update_progress("预处理数据")
+    preprocessor = preprocessor or TextPreprocessor(stopwords)
+    x_train_processed, x_test_processed = preprocessor.preprocess_data(
+        x_train, x_test, update_progress)
+    logger.info(f"数据预处理完成，处理后训练集大小: {len(x_train_processed)}，测试集大小: {len(x_test_processed)}")
+    del x_train, x_test  # 原始数据不再使用，尽早释放
+    update_progress(10)  # 为数据预处理分配10%进度
+    
+    # 数据文件变化但分词结果相同时仍可复用缓存
+    corpus_digest = None
+    if feature_cache.enabled:
+        corpus_digest = FeatureCache.corpus_digest([x_train_processed, x_test_processed], [y_train, y_test])
+        feature_cache.link_source(source_digest, corpus_digest)
+        cached = feature_cache.load(corpus_digest, vectorizer_type, stopwords.fingerprint)
+        if cached is not None:
+            vectorizer, x_train_vec, y_train, x_test_vec, y_test = cached
+            update_progress(10)  # 跳过特征提取
+            return vectorizer, stopwords, x_train_vec, y_train, x_test_vec, y_test
+    
+    # 使用向量化器
+    update_progress(f"特征提取: {vectorizer_type}")
+    vectorizer = TextVectorizer(vectorizer_type, stopwords)
+    x_train_vec = vectorizer.fit_transform(x_train_processed, update_progress)
+    x_test_vec = vectorizer.transform(x_test_processed, update_progress)
+    x_train_vec, x_test_vec = select_features(vectorizer, x_train_vec, y_train, x_test_vec, x_test_processed)
+    logger.info(f"特征提取完成，特征矩阵形状: {x_train_vec.shape}, {x_test_vec.shape}")
+    update_progress(10)  # 为特征提取分配10%进度
+    
+    if corpus_digest is not None:
+        feature_cache.save(corpus_digest, vectorizer, x_train_vec, y_train, x_test_vec, y_test)
+    return vectorizer, stopwords, x_train_vec, y_train, x_test_vec, y_test
+
+
+def training_dictionaries(stopwords: StopwordIndex) -> Dict[str, Any]:
+    """
+    解析训练时使用的jieba用户词典，随模型工件保存
+    
+    与训练时的预处理器使用相同的配置，官方账号名词典在训练集未变化时直接复用。
+    
+    Args:
+        stopwords: 停用词索引
+        
+    Returns:
+        Dict[str, Any]: 用户词典路径列表和词典指纹
+    """
+    preprocessing_config = dict(CONFIG['preprocessing'], cache={'enabled': False})
+    return TextPreprocessor(stopwords, preprocessing_config).dictionaries()
+
+
+def parse_model_list(value: str) -> List[str]:
+    """
+    解析--models参数
+    
+    Args:
+        value: 'all'或以逗号分隔的模型列表
+        
+    Returns:
+        List[str]: 模型类型列表
+        
+    Raises:
+        argparse.ArgumentTypeError: 包含不支持的模型
+    """
+    if value.strip().lower() == 'all':
+        return list(MODEL_TRAINERS)
+    
+    models = [m.strip() for m in value.split(',') if m.strip()]
+    unknown = [m for m in models if m not in MODEL_TRAINERS]
+    if unknown or not models:
+        raise argparse.ArgumentTypeError(
+            f"不支持的模型: {', '.join(unknown) or value}，可选: all 或 {', '.join(MODEL_TRAINERS)}")
+    return models
+
+
+def run_sweep(model_types: List[str], vectorizer: TextVectorizer, stopwords: StopwordIndex,
+              x_train_vec: spmatrix, y_train: np.ndarray, x_test_vec: spmatrix, y_test: np.ndarray,
+              update_progress: Callable) -> List[Dict[str, Any]]:
+    """
+    在同一份特征上并行训练多个模型，输出对比报告并保存AUC最高的模型
+    
+    Args:
+        model_types: 模型类型列表
+        vectorizer: 已拟合的向量化器
+        stopwords: 停用词索引
+        x_train_vec: 训练特征
+        y_train: 训练标签
+        x_test_vec: 测试特征
+        y_test: 测试标签
+        update_progress: 进度回调函数
+        
+    Returns:
+        List[Dict[str, Any]]: 对比报告
+    """
+    update_progress(f"并行训练{len(model_types)}个模型")
+    step = 50 // len(model_types)  # 训练、预测和评估共分配50%进度
+    results = run_model_sweep(model_types, x_train_vec, y_train, x_test_vec, y_test,
+                              CONFIG.get('sweep', {}).get('n_workers'),
+                              lambda _: update_progress(step))
+    rows = [row for row, _ in results]
+    save_comparison_report(rows)
+    
+    print("\n模型对比结果:")
+    print(f"{'模型':<16}{'训练耗时(s)':>12}{'准确率':>10}{'精确率':>10}{'召回率':>10}{'F1':>10}{'AUC':>10}")
+    for row in rows:
+        if 'error' in row:
+            print(f"{row['model']:<16}训练失败: {row['error']}")
+            continue
+        print(f"{row['model']:<16}{row['fit_time']:>12.2f}{row['accuracy']:>10.4f}{row['precision']:>10.4f}"
+              f"{row['recall']:>10.4f}{row['f1']:>10.4f}{row['auc']:>10.4f}")
+    
+    succeeded = [(row, model) for row, model in results if model is not None]
+    if succeeded and CONFIG.get('artifacts', {}).get('save_after_train', True):
+        best_row, best_model = max(succeeded, key=lambda item: item[0]['auc'])
+        version = ArtifactStore().save(vectorizer, best_model, stopwords, metadata={
+            'model_type': best_row['model'],
+            'accuracy': best_row['accuracy'],
+            'auc': best_row['auc'],
+            'train_size': int(x_train_vec.shape[0]),
+            'n_features': int(x_train_vec.shape[1]),
+        }, dictionaries=training_dictionaries(stopwords))
+        logger.info(f"AUC最高的模型为{best_row['model']}，模型工件版本: {version}")
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    训练入口函数，处理命令行参数，加载数据，预处理，训练模型并评估结果。
+    
+    Args:
+        argv: 命令行参数，默认使用sys.argv
+    
+    命令行参数:
+        --model: 选择使用的模型类型 (naive_bayes, random_forest, svm, logistic, sgd)
+        --vectorizer: 选择使用的特征向量化方法 (tfidf, count, hashing)，
+                      hashing使用外存增量训练，只支持naive_bayes和sgd
+        --models: 多模型对比模式，'all'或以逗号分隔的模型列表；特征只计算一次，各模型在进程池中并行训练
+        --config: 配置文件路径
+        --no-plots: 不绘制评估图像
+    """
+    # 解析命令行参数
+    parser = argparse.ArgumentParser(description="FakeNewsDetector - 训练并评估模型")
+    parser.add_argument('--model', type=str, default=None,
+                        choices=['naive_bayes', 'random_forest', 'svm', 'logistic', 'sgd'],
+                        help="选择要使用的模型")
+    parser.add_argument('--vectorizer', type=str, default=None,
+                        choices=['tfidf', 'count', 'hashing'],
+                        help="选择要使用的向量化方法")
+    parser.add_argument('--models', type=parse_model_list, default=None,
+                        help="多模型对比: all 或以逗号分隔的模型列表，如 naive_bayes,svm")
+    parser.add_argument('--config', type=str, default=None,
+                        help="配置文件路径，默认为config/config.yaml")
+    parser.add_argument('--no-plots', action='store_true',
+                        help="不绘制评估图像，也不导入matplotlib")
+    
+    args = parser.parse_args(argv)
+    if args.config:
+        set_config_path(args.config)
+    logger.debug("程序开始执行...")
+    if args.models and args.vectorizer == 'hashing':
+        parser.error("多模型对比模式不支持hashing向量化")
+    
+    # 交互式选择模型（如果未通过命令行指定）
+    if args.model is None and not args.models:
+        print("\n请选择要使用的模型:")
+        print("1. 朴素贝叶斯 (naive_bayes)")
+        print("2. 随机森林 (random_forest)")
+        print("3. 支持向量机 (svm)")
+        print("4. 逻辑回归 (logistic)")
+        print("5. SGD线性模型 (sgd)")
+        
+        choice = input("\n请输入选项编号 [1-5]，默认为1: ").strip()
+        
+        model_map = {
+            "": "naive_bayes",  # 默认选项
+            "1": "naive_bayes",
+            "2": "random_forest",
+            "3": "svm",
+            "4": "logistic",
+            "5": "sgd"
+        }
+        
+        if choice not in model_map:
+            print(f"无效的选择: {choice}，将使用默认模型 (朴素贝叶斯)")
+            args.model = "naive_bayes"
+        else:
+            args.model = model_map[choice]
+            
+        print(f"已选择模型: {args.model}")
+    
+    # 交互式选择向量化方法（如果未通过命令行指定）
+    if args.vectorizer is None:
+        print("\n请选择要使用的向量化方法:")
+        print("1. TF-IDF向量化 (tfidf)")
+        print("2. Count向量化 (count)")
+        print("3. 哈希向量化，外存增量训练 (hashing)")
+        
+        choice = input("\n请输入选项编号 [1-3]，默认为1: ").strip()
+        
+        vectorizer_map = {
+            "": "tfidf",  # 默认选项
+            "1": "tfidf",
+            "2": "count",
+            "3": "hashing"
+        }
+        
+        if choice not in vectorizer_map:
+            print(f"无效的选择: {choice}，将使用默认向量化方法 (tfidf)")
+            args.vectorizer = "tfidf"
+        else:
+            args.vectorizer = vectorizer_map[choice]
+            
+        print(f"已选择向量化方法: {args.vectorizer}")
+    
+    # 创建结果目录
+    os.makedirs('results', exist_ok=True)
+    
+    # 设置进度条
+    pbar = tqdm(total=100, desc="初始化", ncols=100)
+    
+    def update_progress(value_or_desc: Union[int, str]) -> None:
+        """更新进度条
+        
+        Args:
+            value_or_desc: 进度增量或描述文本
+        """
+        if isinstance(value_or_desc, str):
+            pbar.set_description(value_or_desc)
+            logger.debug(f"进度更新: {value_or_desc}")
+        else:
+            pbar.update(value_or_desc)
+    
+    logger.info(f"启动FakeNewsDetector，使用模型: {args.model or ', '.join(args.models)}，向量化方法: {args.vectorizer}")
+    
+    try:
+        if args.vectorizer == 'hashing':
+            # 外存模式：哈希向量化 + partial_fit逐块训练，任何时刻只有一个数据块在内存中
+            if args.model not in PARTIAL_FIT_MODELS:
+                raise ValueError(f"hashing向量化只支持增量训练模型: {', '.join(PARTIAL_FIT_MODELS)}")
+            
+            update_progress("外存增量训练")
+            stopwords = load_stopwords()
+            preprocessor = TextPreprocessor(stopwords)
+            vectorizer = TextVectorizer(args.vectorizer, stopwords)
+            update_progress(30)  # 数据读取、分词和特征提取都在逐块训练中完成
+            
+            n_features = vectorizer.vectorizer.n_features
+            model, train_size = train_incremental(
+                lambda: preprocessor.preprocess_stream(iter_data_chunks(CONFIG['data']['train_path'])),
+                vectorizer, args.model, update_progress)
+            update_progress(10)  # 与其他模型一样，训练阶段共分配30%进度
+            
+            update_progress("预测测试集")
+            y_test, y_predict, y_score = predict_stream(
+                preprocessor.preprocess_stream(iter_data_chunks(CONFIG['data']['test_path'])),
+                vectorizer, model)
+            logger.info(f"预测完成，预测结果大小: {len(y_predict)}")
+            update_progress(10)  # 为预测分配10%进度
+        elif CONFIG['data'].get('streaming', False):
+            # 流式模式：数据按块读取、分词并直接送入向量化器，不构造完整的DataFrame
+            update_progress("流式加载数据")
+            stopwords = load_stopwords()
+            preprocessor = TextPreprocessor(stopwords)
+            vectorizer = TextVectorizer(args.vectorizer, stopwords)
+            update_progress(20)  # 为数据加载和预处理初始化分配20%进度
+            
+            update_progress(f"流式分词与特征提取: {args.vectorizer}")
+            x_train_vec, y_train = vectorizer.fit_transform_stream(
+                preprocessor.preprocess_stream(iter_data_chunks(CONFIG['data']['train_path'])),
+                update_progress)
+            x_test_vec, y_test = vectorizer.transform_stream(
+                preprocessor.preprocess_stream(iter_data_chunks(CONFIG['data']['test_path'])),
+                update_progress)
+            x_train_vec, x_test_vec = select_features(vectorizer, x_train_vec, y_train, x_test_vec)
+            logger.info(f"特征提取完成，特征矩阵形状: {x_train_vec.shape}, {x_test_vec.shape}")
+            update_progress(10)  # 为特征提取分配10%进度
+        else:
+            vectorizer, stopwords, x_train_vec, y_train, x_test_vec, y_test = extract_features_cached(
+                args.vectorizer, update_progress)
+        
+        if args.models:
+            run_sweep(args.models, vectorizer, stopwords, x_train_vec, y_train, x_test_vec, y_test,
+                      update_progress)
+            update_progress("完成")
+            pbar.close()
+            logger.info("FakeNewsDetector执行完成")
+            return
+        
+        if args.vectorizer != 'hashing':
+            # 训练模型
+            update_progress(f"训练{args.model}模型")
+            logger.info(f"开始训练{args.model}模型...")
+            
+            # 各个模型已经在各自的函数中有进度更新，此处只分配模型初始化的部分进度
+            update_progress(5)  # 为模型初始化分配5%进度
+            
+            if args.model == 'naive_bayes':
+                model = train_naive_bayes(x_train_vec, y_train, update_progress)
+                # 朴素贝叶斯在函数内部会更新5%进度
+            elif args.model == 'random_forest':
+                model = train_random_forest(x_train_vec, y_train, update_progress)
+                # 随机森林在函数内部会更新总共20%进度(5%+15%)
+            elif args.model == 'svm':
+                model = train_svm(x_train_vec, y_train, update_progress)
+                # SVM在函数内部会更新10%进度
+            elif args.model == 'logistic':
+                model = train_logistic_regression(x_train_vec, y_train, update_progress)
+                # 逻辑回归在函数内部会更新8%进度
+            elif args.model == 'sgd':
+                model = train_sgd(x_train_vec, y_train, update_progress)
+                # SGD在函数内部会更新5%进度
+            
+            logger.info("模型训练完成")
+            
+            # 根据模型类型补充剩余进度，确保总进度达到30%
+            remaining_progress = {
+                'naive_bayes': 20,    # 已经更新了5% + 5% = 10%，还需要20%
+                'random_forest': 5,   # 已经更新了5% + 20% = 25%，还需要5%
+                'svm': 15,            # 已经更新了5% + 10% = 15%，还需要15%
+                'logistic': 17,       # 已经更新了5% + 8% = 13%，还需要17%
+                'sgd': 20             # 已经更新了5% + 5% = 10%，还需要20%
+            }
+            update_progress(remaining_progress[args.model])  # 确保所有模型总进度为30%
+            
+            # 预测
+            update_progress("预测测试集")
+            y_predict = model.predict(x_test_vec)
+            y_score = model.predict_proba(x_test_vec)[:, 1] if hasattr(model, 'predict_proba') else None
+            logger.info(f"预测完成，预测结果大小: {len(y_predict)}")
+            train_size, n_features = x_train_vec.shape
+            update_progress(10)  # 为预测分配10%进度
+        
+        # 评估模型
+        update_progress("评估模型性能")
+        results = evaluate_model(y_test, y_predict, update_progress, y_score=y_score,
+                                 plot=False if args.no_plots else None)
+        logger.info(f"模型评估完成")
+        update_progress(10)  # 为评估分配10%进度
+        
+        # 保存向量化器和模型，供predict.py推理使用
+        if CONFIG.get('artifacts', {}).get('save_after_train', True):
+            update_progress("保存模型")
+            version = ArtifactStore().save(vectorizer, model, stopwords, metadata={
+                'model_type': args.model,
+                'accuracy': float(results['accuracy']),
+                'auc': float(results['auc']),
+                'train_size': int(train_size),
+                'n_features': int(n_features),
+            }, dictionaries=training_dictionaries(stopwords))
+            logger.info(f"模型工件版本: {version}")
+        
+        # 等待后台线程写完评估图像
+        if wait_for_plots():
+            logger.info("评估图像已全部保存")
+        update_progress("完成")
+        update_progress(10)  # 最后10%进度完成
+        
+        # 显示结果
+        logger.info(f"模型评估结果: 准确率={results['accuracy']:.4f}, AUC={results['auc']:.4f}")
+        print("\n模型评估结果:")
+        print(f"准确率: {results['accuracy']:.4f}")
+        print(f"AUC: {results['auc']:.4f}")
+        
+        # 关闭进度条
+        pbar.close()
+        logger.info("FakeNewsDetector执行完成")
+        
+    except FileNotFoundError as e:
+        logger.error(f"文件未找到: {str(e)}", exc_info=True)
+        pbar.close()
+        print(f"错误: 无法找到所需文件 - {str(e)}")
+        print(traceback.format_exc())
+        
+    except ValueError as e:
+        logger.error(f"数据处理错误: {str(e)}", exc_info=True)
+        pbar.close()
+        print(f"错误: 数据处理异常 - {str(e)}")
+        print(traceback.format_exc())
+        
+    except Exception as e:
+        logger.error(f"发生未知错误: {str(e)}", exc_info=True)
+        pbar.close()
+        print(f"错误: 系统执行异常 - {str(e)}")
+        print(traceback.format_exc())
+        raise
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"程序执行出错: {str(e)}")
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,89 @@
+"""
+FakeNewsDetector - 用新标注的新闻在线更新已保存的模型
+"""
+import sys
+import time
+import argparse
+import traceback
+from typing import List, Optional
+
+from src.utils.logger import logger
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    在线更新入口函数，加载工件，只对新样本分词和向量化，原地更新模型并保存为新版本。
+    
+    新样本CSV的格式与训练集相同（标题、官方账号名、报告内容和标签列）。
+    tfidf/count向量化器的词汇表保持不变，hashing向量化器会用新样本继续更新在线IDF估计。
+    
+    Args:
+        argv: 命令行参数，默认使用sys.argv
+    
+    命令行参数:
+        --input: 新标注样本的CSV文件
+        --version: 基础工件版本号，默认使用最新版本
+    """
+    parser = argparse.ArgumentParser(description="FakeNewsDetector - 模型在线更新")
+    parser.add_argument('--input', type=str, required=True, help="新标注样本的CSV文件")
+    parser.add_argument('--version', type=str, default=None, help="基础工件版本号，默认使用最新版本")
+    args = parser.parse_args(argv)
+    
+    # 解析参数后再导入训练依赖，--help不承担pandas、jieba、sklearn的导入开销
+    from src.data.columnar_cache import ColumnarCache
+    from src.data.data_loader import read_dataset, extract_features, extract_labels
+    from src.data.preprocessor import TextPreprocessor
+    from src.features.vectorizers import is_valid_document
+    from src.models.updater import update_model
+    from src.utils.artifact_store import ArtifactStore
+    
+    start = time.perf_counter()
+    store = ArtifactStore()
+    # 模型需要原地修改，不使用只读内存映射
+    bundle = store.load(args.version, mmap=False)
+    
+    # 新样本通常很小，不生成列式缓存
+    data, label_column = read_dataset(args.input, ColumnarCache(enabled=False))
+    labels = extract_labels(data, label_column)
+    logger.info(f"读取新样本: {args.input}, {len(data)}条, 基础版本: {bundle.version}")
+    
+    # jieba用户词典使用工件中的副本，与训练时的分词一致
+    preprocessor = TextPreprocessor(bundle.stopwords, bundle.preprocessing_config())
+    bundle.check_dictionaries(preprocessor.tokenization_settings()['dictionaries'])
+    texts = preprocessor.preprocess_frame(extract_features(data))
+    keep = [i for i, t in enumerate(texts) if is_valid_document(t)]
+    if not keep:
+        raise ValueError("新样本中没有有效文本")
+    texts = [texts[i] for i in keep]
+    labels = labels[keep]
+    
+    vectorizer = bundle.vectorizer
+    if vectorizer.vectorizer_type == 'hashing':
+        features = vectorizer.partial_fit_transform(texts)
+    else:
+        features = vectorizer.transform_texts(texts)
+    
+    model = update_model(bundle.model, features, labels,
+                         train_size=int(bundle.metadata.get('train_size', 0)) or None)
+    
+    metadata = {key: value for key, value in bundle.metadata.items() if key in ('model_type', 'n_features')}
+    metadata.update({
+        'base_version': bundle.version,
+        'update_rows': len(texts),
+        'train_size': int(bundle.metadata.get('train_size', 0)) + len(texts),
+    })
+    version = store.save(vectorizer, model, bundle.stopwords, metadata=metadata, config=bundle.config,
+                         dictionaries=bundle.dictionaries)
+    
+    elapsed = time.perf_counter() - start
+    logger.info(f"在线更新完成: {bundle.version} -> {version}, 新样本{len(texts)}条, 用时{elapsed:.1f}s")
+    print(f"模型已更新: {bundle.version} -> {version}，新样本{len(texts)}条，用时{elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"更新出错: {str(e)}")
+        traceback.print_exc()
+        sys.exit(1)